@@ -0,0 +1,135 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Set
+
+from models.place import Place
+from api.kakao_local_api import KakaoLocalAPI
+from api.kakao_map_api import KakaoMapAPI
+from api.transport import HttpTransport
+from api.response_cache import ResponseCache
+
+
+class _AsyncClientBase:
+    """동기 클라이언트 호출을 동시 실행 수 제한 하에 asyncio로 실행"""
+
+    def __init__(self, max_concurrency: int = 8):
+        self.max_concurrency = max_concurrency
+        # 작업자 수가 동시 실행 수를 제한하고, 초과 호출은 실행기 대기열에서 기다림
+        # (이벤트 루프에 묶이는 세마포어가 없어 asyncio.run을 여러 번 호출해도 안전)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix="kakao-async")
+        self._pending: Set[Future] = set()
+
+    async def _run(self, func, *args, **kwargs):
+        """동기 함수를 실행기에서 수행 (동시 실행 수 제한)
+
+        작업을 취소하면 대기열에 있는 호출은 실행되지 않지만, 이미 스레드에서 실행 중인
+        HTTP 요청은 끝까지 진행되고 결과만 버려짐
+        """
+        future = self._executor.submit(func, *args, **kwargs)
+        self._pending.add(future)
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            self._pending.discard(future)
+
+    def cancel_all(self) -> int:
+        """실행기 대기열에서 아직 시작되지 않은 요청 취소 (취소된 요청 수 반환, 실행 중인 요청은 멈추지 않음)"""
+        cancelled = 0
+        for future in list(self._pending):
+            # concurrent.futures.Future.cancel()은 이미 실행 중이거나 끝난 호출이면 False
+            if future.cancel():
+                cancelled += 1
+        return cancelled
+
+    async def aclose(self):
+        """진행 중인 요청을 취소하고 실행기 종료"""
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+class AsyncKakaoLocalAPI(_AsyncClientBase):
+    """KakaoLocalAPI의 asyncio 버전"""
+
+    def __init__(self, api_key: str, transport: Optional[HttpTransport] = None,
+                 max_concurrency: int = 8, response_cache: Optional[ResponseCache] = None):
+        super().__init__(max_concurrency)
+        self.api = KakaoLocalAPI(api_key, transport, response_cache)
+
+    async def search_by_keyword(self, query: str, x: Optional[float] = None, y: Optional[float] = None,
+                                radius: Optional[int] = None, page: int = 1, size: int = 15) -> List[Place]:
+        """키워드로 장소 검색"""
+        return await self._run(self.api.search_by_keyword, query, x, y, radius, page, size)
+
+    async def search_by_category(self, category_group_code: str, x: Optional[float] = None,
+                                 y: Optional[float] = None, radius: Optional[int] = None,
+                                 page: int = 1, size: int = 15) -> List[Place]:
+        """카테고리로 장소 검색"""
+        return await self._run(self.api.search_by_category, category_group_code,
+                               x, y, radius, page, size)
+
+    async def get_place_detail(self, place_id: str) -> Optional[Place]:
+        """장소 상세 정보 조회 (ID로 검색)"""
+        return await self._run(self.api.get_place_detail, place_id)
+
+    async def search_nearby_places(self, x: float, y: float, radius: int = 1000,
+                                   category: Optional[str] = None) -> List[Place]:
+        """주변 장소 검색"""
+        return await self._run(self.api.search_nearby_places, x, y, radius, category)
+
+    def get_category_name(self, category_code: str) -> str:
+        """카테고리 코드를 한글명으로 변환"""
+        return self.api.get_category_name(category_code)
+
+    def get_all_categories(self) -> Dict[str, str]:
+        """모든 카테고리 코드와 이름 반환"""
+        return self.api.get_all_categories()
+
+
+class AsyncKakaoMapAPI(_AsyncClientBase):
+    """KakaoMapAPI의 asyncio 버전"""
+
+    def __init__(self, api_key: str, transport: Optional[HttpTransport] = None,
+                 max_concurrency: int = 8, response_cache: Optional[ResponseCache] = None):
+        super().__init__(max_concurrency)
+        self.api = KakaoMapAPI(api_key, transport, response_cache)
+
+    async def search_keyword(self, query: str, x: Optional[float] = None, y: Optional[float] = None,
+                             radius: Optional[int] = None, page: int = 1,
+                             size: int = 15) -> Optional[Dict[str, Any]]:
+        """키워드 검색"""
+        return await self._run(self.api.search_keyword, query, x, y, radius, page, size)
+
+    async def search_category(self, category_group_code: str, x: Optional[float] = None,
+                              y: Optional[float] = None, radius: Optional[int] = None,
+                              page: int = 1, size: int = 15) -> Optional[Dict[str, Any]]:
+        """카테고리 검색"""
+        return await self._run(self.api.search_category, category_group_code,
+                               x, y, radius, page, size)
+
+    async def search_address(self, query: str) -> Optional[Dict[str, Any]]:
+        """주소 검색"""
+        return await self._run(self.api.search_address, query)
+
+    async def coord_to_address(self, x: float, y: float) -> Optional[Dict[str, Any]]:
+        """좌표를 주소로 변환 (역지오코딩)"""
+        return await self._run(self.api.coord_to_address, x, y)
+
+    async def coord_to_region(self, x: float, y: float) -> Optional[Dict[str, Any]]:
+        """좌표를 행정구역 정보로 변환"""
+        return await self._run(self.api.coord_to_region, x, y)
+
+    async def check_roadview_available(self, x: float, y: float) -> bool:
+        """로드뷰 이용 가능 여부 확인"""
+        return await self._run(self.api.check_roadview_available, x, y)
+
+    def get_roadview(self, x: float, y: float, level: int = 1,
+                     width: int = 640, height: int = 360) -> Optional[str]:
+        """로드뷰 이미지 URL 생성"""
+        return self.api.get_roadview(x, y, level, width, height)
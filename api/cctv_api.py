@@ -1,13 +1,25 @@
+import logging
+import threading
 import requests
 from typing import Dict, Any, Optional, List
-from models.cctv import CCTV, CCTVArea
-from utils.coordinates import Coordinates
+from models.cctv import CCTV, CCTVArea, CCTVTable
+from utils.spatial_index import SpatialIndex
+from api.transport import HttpTransport, get_shared_transport
+from api.response_cache import ResponseCache
 import xml.etree.ElementTree as ET
 
 
 class CCTVApi:
-    def __init__(self, service_key: Optional[str] = None):
+    # 응답 캐시에서 주변 CCTV 조회 결과를 구분하는 이름
+    NEARBY_ENDPOINT = "cctv:nearby"
+    
+    def __init__(self, service_key: Optional[str] = None, transport: Optional[HttpTransport] = None,
+                 response_cache: Optional[ResponseCache] = None):
         self.service_key = service_key
+        self.transport = transport or get_shared_transport()
+        self.response_cache = response_cache
+        self._cctv_index: Optional[SpatialIndex] = None
+        self._cctv_index_lock = threading.Lock()
         self.base_url = "https://openapi.data.go.kr"
         
         self.region_codes = {
@@ -31,19 +43,25 @@ class CCTVApi:
         }
     
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[str]:
-        """API 요청 수행"""
+        """API 요청 수행 (응답 캐시가 있으면 캐시 우선)"""
         try:
-            if self.service_key:
-                params['serviceKey'] = self.service_key
-            
-            url = f"{self.base_url}{endpoint}"
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
-            print(f"CCTV API 요청 실패: {e}")
+            if self.response_cache:
+                return self.response_cache.get_or_fetch(
+                    endpoint, params, lambda: self._fetch(endpoint, params)
+                )
+            return self._fetch(endpoint, params)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logging.warning(f"CCTV API 요청 실패 [{getattr(e, 'kind', 'unknown')}]: {e}")
             return None
     
+    def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Optional[str]:
+        """네트워크 요청 수행 (실패 시 ApiError 발생)"""
+        if self.service_key:
+            params['serviceKey'] = self.service_key
+        
+        url = f"{self.base_url}{endpoint}"
+        return self.transport.get_text(url, params=params)
+    
     def _parse_xml_response(self, xml_text: str) -> List[Dict[str, Any]]:
         """XML 응답 파싱"""
         try:
@@ -62,23 +80,35 @@ class CCTVApi:
             return []
     
     def get_cctv_list(self, x: float, y: float, radius: float = 1.0) -> List[CCTV]:
-        """주변 CCTV 목록 조회 (샘플 데이터 반환)"""
-        # 네트워크 오류로 인해 API 호출 대신 샘플 데이터만 반환
-        sample_cctvs = []
-        
-        # 서울과 부산의 샘플 데이터만 사용
-        for region_code in ['11', '26']:
-            cctvs = self._get_sample_cctv_data(region_code)
-            sample_cctvs.extend(cctvs)
+        """주변 CCTV 목록 조회 (같은 공간 셀의 반복 조회는 캐시에서 응답)"""
+        if not self.response_cache:
+            return self._find_nearby_cctvs(x, y, radius)
         
-        nearby_cctvs = []
-        for cctv in sample_cctvs:
-            if cctv.x and cctv.y:
-                distance = Coordinates.calculate_distance(y, x, cctv.y, cctv.x)
-                if distance <= radius:
-                    nearby_cctvs.append(cctv)
-        
-        return nearby_cctvs
+        return self.response_cache.get_or_fetch(
+            self.NEARBY_ENDPOINT, {"x": x, "y": y, "radius": radius},
+            lambda: self._find_nearby_cctvs(x, y, radius)
+        )
+    
+    def _find_nearby_cctvs(self, x: float, y: float, radius: float) -> List[CCTV]:
+        """주변 CCTV 목록 계산 (샘플 데이터 반환, 가까운 순)"""
+        return self._get_cctv_index().query_radius(y, x, radius)
+    
+    def _get_cctv_index(self) -> SpatialIndex:
+        """CCTV 공간 인덱스 (처음 사용할 때 한 번 구성)"""
+        index = self._cctv_index
+        if index is not None:
+            return index
+        # 여러 실행기 스레드가 처음 동시에 호출해도 인덱스는 한 번만 구성
+        with self._cctv_index_lock:
+            if self._cctv_index is None:
+                # 네트워크 오류로 인해 API 호출 대신 서울과 부산의 샘플 데이터만 사용
+                located = [cctv for region_code in ['11', '26']
+                           for cctv in self._get_sample_cctv_data(region_code)
+                           if cctv.x and cctv.y]
+                self._cctv_index = SpatialIndex.from_points(
+                    located, [cctv.y for cctv in located], [cctv.x for cctv in located]
+                )
+            return self._cctv_index
     
     def get_cctv_info(self, cctv_id: str) -> Optional[CCTV]:
         """CCTV 상세 정보 조회"""
@@ -147,20 +177,7 @@ class CCTVApi:
     
     def create_cctv_area(self, region_code: str) -> CCTVArea:
         """지역별 CCTV 구역 생성"""
-        cctvs = self.get_cctv_by_region(region_code)
+        cctvs = CCTVTable.from_models(self.get_cctv_by_region(region_code))
         region_name = self.get_region_name(region_code)
         
-        if not cctvs:
-            bounds = {'north': 0, 'south': 0, 'east': 0, 'west': 0}
-        else:
-            lats = [cctv.y for cctv in cctvs if cctv.y]
-            lngs = [cctv.x for cctv in cctvs if cctv.x]
-            
-            bounds = {
-                'north': max(lats) if lats else 0,
-                'south': min(lats) if lats else 0,
-                'east': max(lngs) if lngs else 0,
-                'west': min(lngs) if lngs else 0
-            }
-        
-        return CCTVArea(name=region_name, bounds=bounds, cctv_list=cctvs)
\ No newline at end of file
+        return CCTVArea(name=region_name, bounds=cctvs.bounds(), cctv_list=cctvs)
\ No newline at end of file
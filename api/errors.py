@@ -0,0 +1,65 @@
+from typing import Optional
+
+import requests
+
+
+class ApiError(requests.exceptions.RequestException):
+    """분류된 API 오류 기본 클래스"""
+    kind = 'unknown'
+    retryable = False
+
+    def __init__(self, message: str, status_code: Optional[int] = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.status_code = status_code
+
+
+class TransientApiError(ApiError):
+    """일시적 오류 (타임아웃, 연결 실패, 5xx, 429) - 재시도 대상"""
+    kind = 'transient'
+    retryable = True
+
+
+class ClientApiError(ApiError):
+    """요청 자체의 오류 (인증 실패, 잘못된 파라미터 등 4xx) - 재시도해도 동일"""
+    kind = 'client'
+
+
+class CircuitOpenError(ApiError):
+    """서비스 장애로 차단기가 열려 즉시 실패 처리됨"""
+    kind = 'circuit_open'
+
+
+class QuotaExceededError(ApiError):
+    """일일 호출 한도 초과"""
+    kind = 'quota'
+
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def classify_exception(exc: requests.exceptions.RequestException) -> ApiError:
+    """requests 예외를 분류된 API 오류로 변환"""
+    if isinstance(exc, ApiError):
+        return exc
+
+    response = getattr(exc, 'response', None)
+    if response is not None:
+        return classify_response(response)
+
+    if isinstance(exc, requests.exceptions.Timeout):
+        return TransientApiError(f"응답 시간 초과: {exc}")
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        return TransientApiError(f"연결 실패: {exc}")
+    return ApiError(f"요청 실패: {exc}")
+
+
+def classify_response(response: requests.Response) -> Optional[ApiError]:
+    """HTTP 응답 상태 코드를 분류 (정상 응답이면 None)"""
+    status = response.status_code
+    if status < 400:
+        return None
+
+    message = f"HTTP {status} {response.reason or ''}".strip() + f" ({response.url})"
+    if status in RETRYABLE_STATUS_CODES:
+        return TransientApiError(message, status_code=status, response=response)
+    return ClientApiError(message, status_code=status, response=response)
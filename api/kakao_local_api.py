@@ -1,11 +1,19 @@
+import logging
 import requests
-from typing import Dict, Any, Optional, List
-from models.place import Place
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator
+from models.place import Place, PlaceTable
+from api import kakao_parser
+from api.transport import HttpTransport, get_shared_transport
+from api.response_cache import ResponseCache
 
 
 class KakaoLocalAPI:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[HttpTransport] = None,
+                 response_cache: Optional[ResponseCache] = None):
         self.api_key = api_key
+        self.transport = transport or get_shared_transport()
+        self.response_cache = response_cache
         self.base_url = "https://dapi.kakao.com"
         self.headers = {
             "Authorization": f"KakaoAK {api_key}",
@@ -34,19 +42,32 @@ class KakaoLocalAPI:
         }
     
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """API 요청 수행"""
+        """API 요청 수행 (응답 캐시가 있으면 캐시 우선)"""
         try:
-            url = f"{self.base_url}{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"API 요청 실패: {e}")
+            if self.response_cache:
+                return self.response_cache.get_or_fetch(
+                    endpoint, params, lambda: self._fetch(endpoint, params)
+                )
+            return self._fetch(endpoint, params)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logging.warning(f"API 요청 실패 [{getattr(e, 'kind', 'unknown')}]: {e}")
             return None
     
+    def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """네트워크 요청 수행 (실패 시 ApiError 발생)"""
+        url = f"{self.base_url}{endpoint}"
+        return kakao_parser.loads(self.transport.get_content(url, params=params, headers=self.headers))
+    
     def search_by_keyword(self, query: str, x: Optional[float] = None, y: Optional[float] = None, 
                          radius: Optional[int] = None, page: int = 1, size: int = 15) -> List[Place]:
         """키워드로 장소 검색"""
+        response = self._search_keyword_response(query, x, y, radius, page, size)
+        return kakao_parser.parse_places(response)[0]
+    
+    def _search_keyword_response(self, query: str, x: Optional[float] = None, y: Optional[float] = None,
+                                 radius: Optional[int] = None, page: int = 1,
+                                 size: int = 15) -> Optional[Dict[str, Any]]:
+        """키워드 검색 원본 응답 (meta 포함) 조회"""
         params = {
             "query": query,
             "page": page,
@@ -60,11 +81,7 @@ class KakaoLocalAPI:
         if radius is not None:
             params["radius"] = radius
             
-        response = self._make_request("/v2/local/search/keyword.json", params)
-        
-        if response and 'documents' in response:
-            return [Place.from_kakao_response(doc) for doc in response['documents']]
-        return []
+        return self._make_request("/v2/local/search/keyword.json", params)
     
     def search_by_category(self, category_group_code: str, x: Optional[float] = None, 
                           y: Optional[float] = None, radius: Optional[int] = None,
@@ -84,10 +101,7 @@ class KakaoLocalAPI:
             params["radius"] = radius
             
         response = self._make_request("/v2/local/search/category.json", params)
-        
-        if response and 'documents' in response:
-            return [Place.from_kakao_response(doc) for doc in response['documents']]
-        return []
+        return kakao_parser.parse_places(response)[0]
     
     def get_place_detail(self, place_id: str) -> Optional[Place]:
         """장소 상세 정보 조회 (ID로 검색)"""
@@ -115,8 +129,12 @@ class KakaoLocalAPI:
         return self.category_codes.copy()
     
     def search_with_pagination(self, query: str, total_pages: int = 3, 
+                             concurrent: bool = False, max_workers: int = 3,
                              **kwargs) -> List[Place]:
         """페이지네이션을 통한 확장 검색"""
+        if concurrent:
+            return self._search_pages_concurrently(query, total_pages, max_workers, **kwargs)
+        
         all_places = []
         
         for page in range(1, total_pages + 1):
@@ -125,4 +143,48 @@ class KakaoLocalAPI:
                 break
             all_places.extend(places)
             
-        return all_places
\ No newline at end of file
+        return all_places
+    
+    def search_table(self, query: str, total_pages: int = 3, max_workers: int = 3,
+                     **kwargs) -> PlaceTable:
+        """여러 페이지를 동시에 요청해 하나의 PlaceTable로 병합 (대량 조회용)"""
+        tables = [kakao_parser.parse_place_table(response)[0]
+                  for response in self._iter_keyword_pages(query, total_pages, max_workers, **kwargs)]
+        return PlaceTable.concat(tables).drop_duplicates('id')
+    
+    def _search_pages_concurrently(self, query: str, total_pages: int, max_workers: int,
+                                   **kwargs) -> List[Place]:
+        """여러 페이지를 동시에 요청하고 페이지 순서대로 병합"""
+        all_places = []
+        seen_ids = set()
+        
+        for response in self._iter_keyword_pages(query, total_pages, max_workers, **kwargs):
+            for place in kakao_parser.parse_places(response)[0]:
+                if place.id in seen_ids:
+                    continue
+                seen_ids.add(place.id)
+                all_places.append(place)
+        
+        return all_places
+    
+    def _iter_keyword_pages(self, query: str, total_pages: int, max_workers: int,
+                            **kwargs) -> Iterator[Dict[str, Any]]:
+        """키워드 검색 응답을 페이지 순서대로 반환 (빈 페이지나 마지막 페이지에서 중단)"""
+        max_workers = max(1, max_workers)
+        
+        def fetch(page: int) -> Optional[Dict[str, Any]]:
+            return self._search_keyword_response(query, page=page, **kwargs)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, total_pages) or 1) as executor:
+            # max_workers 개씩 묶어서 요청하고, 마지막 페이지가 확인되면 다음 묶음은 요청하지 않음
+            for start in range(1, total_pages + 1, max_workers):
+                pages = range(start, min(start + max_workers, total_pages + 1))
+                
+                for response in executor.map(fetch, pages):
+                    if not response or not response.get('documents'):
+                        return
+                    
+                    yield response
+                    
+                    if response.get('meta', {}).get('is_end', False):
+                        return
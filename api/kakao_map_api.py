@@ -1,11 +1,18 @@
+import logging
 import requests
 from typing import Dict, Any, Optional, List
 import json
+from api import kakao_parser
+from api.transport import HttpTransport, get_shared_transport
+from api.response_cache import ResponseCache
 
 
 class KakaoMapAPI:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[HttpTransport] = None,
+                 response_cache: Optional[ResponseCache] = None):
         self.api_key = api_key
+        self.transport = transport or get_shared_transport()
+        self.response_cache = response_cache
         self.base_url = "https://dapi.kakao.com"
         self.headers = {
             "Authorization": f"KakaoAK {api_key}",
@@ -13,16 +20,22 @@ class KakaoMapAPI:
         }
     
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """API 요청 수행"""
+        """API 요청 수행 (응답 캐시가 있으면 캐시 우선)"""
         try:
-            url = f"{self.base_url}{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"API 요청 실패: {e}")
+            if self.response_cache:
+                return self.response_cache.get_or_fetch(
+                    endpoint, params, lambda: self._fetch(endpoint, params)
+                )
+            return self._fetch(endpoint, params)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logging.warning(f"API 요청 실패 [{getattr(e, 'kind', 'unknown')}]: {e}")
             return None
     
+    def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """네트워크 요청 수행 (실패 시 ApiError 발생)"""
+        url = f"{self.base_url}{endpoint}"
+        return kakao_parser.loads(self.transport.get_content(url, params=params, headers=self.headers))
+    
     def search_keyword(self, query: str, x: Optional[float] = None, y: Optional[float] = None, 
                       radius: Optional[int] = None, page: int = 1, size: int = 15) -> Optional[Dict[str, Any]]:
         """키워드 검색"""
@@ -79,14 +92,9 @@ class KakaoMapAPI:
     def check_roadview_available(self, x: float, y: float) -> bool:
         """로드뷰 이용 가능 여부 확인"""
         try:
-            roadview_info_url = "https://dapi.kakao.com/v2/local/geo/coord2roadview.json"
             params = {"x": x, "y": y}
-            response = requests.get(roadview_info_url, headers=self.headers, params=params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return len(data.get('documents', [])) > 0
-            return False
+            data = self._make_request("/v2/local/geo/coord2roadview.json", params)
+            return bool(data and len(data.get('documents', [])) > 0)
         except Exception:
             return False
     
@@ -0,0 +1,86 @@
+import json
+import sys
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from models.place import Place, PlaceTable
+from models.table import DictionaryColumn, _intern
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
+
+
+Body = Union[bytes, str, Dict[str, Any], None]
+
+
+def loads(body: Union[bytes, str]) -> Any:
+    """JSON 본문 디코딩 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _decode(body: Body) -> Dict[str, Any]:
+    """원본 본문 또는 이미 디코딩된 응답(캐시 적중 등)을 딕셔너리로 변환"""
+    if body is None:
+        return {}
+    if isinstance(body, (bytes, bytearray, memoryview, str)):
+        body = loads(body)
+    return body if isinstance(body, dict) else {}
+
+
+# 행 튜플 앞부분에 담는 PlaceTable 문자열 열 (순서는 parse_place_table의 튜플과 같음)
+PLACE_STRING_COLUMNS = ('id', 'name', 'address', 'road_address', 'category', 'phone', 'url')
+
+
+def parse_place_table(body: Body) -> Tuple[PlaceTable, Dict[str, Any]]:
+    """장소 검색 응답 본문을 PlaceTable과 meta로 변환 (Place가 쓰는 필드만 읽음)"""
+    data = _decode(body)
+    docs = data.get('documents') or []
+
+    # 문서를 한 번만 훑어 필요한 필드를 행 튜플로 모은 뒤 열로 전치
+    rows = [(doc.get('id', ''), doc.get('place_name', ''), doc.get('address_name', ''),
+             doc.get('road_address_name', ''), doc.get('category_name', ''),
+             doc.get('phone', ''), doc.get('place_url', ''),
+             doc.get('x') or '0', doc.get('y') or '0', doc.get('distance') or 'nan')
+            for doc in docs]
+    values = list(zip(*rows)) if rows else [()] * 10
+
+    columns = {name: DictionaryColumn.encode(column)
+               for name, column in zip(PLACE_STRING_COLUMNS, values)}
+    category = columns['category']
+    category.values = [_intern(v) for v in category.values]
+
+    # 숫자 필드는 문자열 그대로 NumPy가 한 번에 변환 (거리는 기준 좌표가 있을 때만 와서 빈 값은 NaN)
+    columns['x'] = np.array(values[7], dtype=np.float64)
+    columns['y'] = np.array(values[8], dtype=np.float64)
+    columns['distance'] = np.array(values[9], dtype=np.float64)
+    return PlaceTable(columns), data.get('meta') or {}
+
+
+def parse_places(body: Body) -> Tuple[List[Place], Dict[str, Any]]:
+    """장소 검색 응답 본문을 Place 목록과 meta로 변환"""
+    data = _decode(body)
+    intern = sys.intern
+    places = []
+    append = places.append
+    for doc in data.get('documents') or ():
+        get = doc.get
+        category = get('category_name', '')
+        distance = get('distance')
+        append(Place(
+            id=get('id', ''),
+            name=get('place_name', ''),
+            address=get('address_name', ''),
+            road_address=get('road_address_name', ''),
+            x=float(get('x') or 0),
+            y=float(get('y') or 0),
+            category=intern(category) if type(category) is str else category,
+            phone=get('phone', ''),
+            url=get('place_url', ''),
+            distance=float(distance) if distance else None
+        ))
+    return places, data.get('meta') or {}
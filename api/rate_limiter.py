@@ -0,0 +1,128 @@
+import threading
+import time
+from datetime import date
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+from api.errors import QuotaExceededError
+
+
+class TokenBucket:
+    """초당 호출 수를 제한하는 토큰 버킷 (부족하면 대기열처럼 순서대로 대기)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰 획득 (대기한 시간을 초 단위로 반환)"""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰을 미리 차감해 두면 뒤이은 호출은 그만큼 더 기다리게 된다
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """엔드포인트 계열별 초당 제한과 일일 쿼터 집계"""
+
+    # (계열, URL 경로 접두사 또는 호스트) - 위에서부터 먼저 일치하는 계열 사용
+    FAMILY_RULES = [
+        ('roadview', '/v2/local/geo/coord2roadview'),
+        ('geo', '/v2/local/geo/'),
+        ('search', '/v2/local/search/'),
+        ('cctv', 'openapi.data.go.kr'),
+    ]
+
+    DEFAULT_FAMILY = 'default'
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.limits = limits or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._counters: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_family(self, url: str) -> str:
+        """URL이 속한 엔드포인트 계열 반환"""
+        parts = urlsplit(url)
+        for family, pattern in self.FAMILY_RULES:
+            if parts.path.startswith(pattern) or parts.netloc == pattern:
+                return family
+        return self.DEFAULT_FAMILY
+
+    def _get_limit(self, family: str) -> Dict[str, float]:
+        return self.limits.get(family) or self.limits.get(self.DEFAULT_FAMILY) or {}
+
+    def _get_bucket(self, family: str) -> TokenBucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            limit = self._get_limit(family)
+            bucket = TokenBucket(limit.get('per_second', 0), limit.get('burst'))
+            self._buckets[family] = bucket
+        return bucket
+
+    def _get_counter(self, family: str) -> Dict[str, Any]:
+        counter = self._counters.get(family)
+        today = date.today()
+        if counter is None:
+            counter = {'day': today, 'used_today': 0, 'total_requests': 0,
+                       'throttled': 0, 'total_wait': 0.0}
+            self._counters[family] = counter
+        elif counter['day'] != today:
+            counter['day'] = today
+            counter['used_today'] = 0
+        return counter
+
+    def acquire(self, url: str, count_quota: bool = True) -> float:
+        """요청 전 호출 (한도 내가 될 때까지 대기, 일일 쿼터 초과 시 예외)
+
+        같은 요청의 재시도는 count_quota=False로 호출해 초당 제한만 적용하고 쿼터는 차감하지 않음
+        """
+        family = self.get_family(url)
+        daily_quota = int(self._get_limit(family).get('daily_quota', 0))
+
+        with self._lock:
+            counter = self._get_counter(family)
+            if count_quota:
+                if daily_quota and counter['used_today'] >= daily_quota:
+                    raise QuotaExceededError(f"{family} 일일 호출 한도({daily_quota}회)를 초과했습니다")
+                counter['used_today'] += 1
+                counter['total_requests'] += 1
+            bucket = self._get_bucket(family)
+
+        wait = bucket.acquire()
+
+        if wait > 0:
+            with self._lock:
+                counter['throttled'] += 1
+                counter['total_wait'] += wait
+        return wait
+
+    def get_quota_status(self) -> Dict[str, Dict[str, Any]]:
+        """계열별 쿼터 사용 현황 조회"""
+        status = {}
+        with self._lock:
+            for family in set(self.limits) | set(self._counters):
+                counter = self._get_counter(family)
+                daily_quota = int(self._get_limit(family).get('daily_quota', 0))
+                status[family] = {
+                    'used_today': counter['used_today'],
+                    'daily_quota': daily_quota,
+                    'remaining': max(daily_quota - counter['used_today'], 0) if daily_quota else None,
+                    'total_requests': counter['total_requests'],
+                    'throttled': counter['throttled'],
+                    'total_wait': counter['total_wait']
+                }
+        return status
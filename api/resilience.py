@@ -0,0 +1,85 @@
+import random
+import threading
+import time
+from typing import Optional
+
+import requests
+
+from api.errors import CircuitOpenError
+
+
+class RetryPolicy:
+    """지수 백오프 + 지터 재시도 정책 (멱등 GET 요청 전용)"""
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.3,
+                 backoff_max: float = 5.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def get_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """재시도 전 대기 시간 (attempt는 0부터 시작)"""
+        # 서버가 Retry-After를 알려주면 그 값을 우선 사용
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+
+        # full jitter: 0 ~ min(최대값, 기본값 * 2^attempt) 사이의 임의 시간
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """호스트별 회로 차단기 (연속 실패 시 일정 시간 동안 즉시 실패)"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """요청 전 호출 - 차단 상태이면 CircuitOpenError 발생"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            elapsed = time.monotonic() - self.opened_at
+            # 결과가 기록되지 않은 시험 요청도 reset_timeout이 지나면 다시 시험
+            if elapsed >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_progress = False
+
+            # 반개방 상태에서는 시험 요청 하나만 통과
+            if self.state == self.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                self.opened_at = time.monotonic()
+                return
+
+            remaining = max(self.reset_timeout - elapsed, 0)
+            raise CircuitOpenError(f"{self.name} 서비스 일시 차단 중 ({remaining:.0f}초 후 재시도)")
+
+    def record_success(self):
+        """요청 성공 기록"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+            self._trial_in_progress = False
+
+    def record_failure(self):
+        """일시적 오류 기록"""
+        with self._lock:
+            self.failure_count += 1
+            if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_progress = False
@@ -0,0 +1,225 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+from urllib.parse import urlencode
+
+from api.errors import ClientApiError
+from utils.cache import Cache
+from utils.coordinates import Coordinates
+
+
+class ResponseCache:
+    """API 응답 read-through 캐시 (엔드포인트별 TTL, 정규화된 키)"""
+
+    # 엔드포인트 경로 → TTL 설정 이름
+    ENDPOINT_NAMES = {
+        '/v2/local/search/keyword.json': 'keyword',
+        '/v2/local/search/category.json': 'category',
+        '/v2/local/search/address.json': 'address',
+        '/v2/local/geo/coord2address.json': 'coord2address',
+        '/v2/local/geo/coord2regioncode.json': 'coord2region',
+        '/v2/local/geo/coord2roadview.json': 'roadview',
+        'cctv:nearby': 'cctv_nearby',
+    }
+
+    DEFAULT_TTLS = {
+        'keyword': 600,
+        'category': 600,
+        'address': 7 * 86400,
+        'coord2address': 7 * 86400,
+        'coord2region': 7 * 86400,
+        'roadview': 86400,
+        'cctv_nearby': 3600,
+        'default': 3600,
+    }
+
+    # 좌표 기반 조회는 이 크기(미터)의 타일 단위로 캐시 키를 묶어 같은 칸의 요청이 캐시를 공유
+    # (요청은 호출한 좌표 그대로 보내므로, 캐시 히트는 셀 안에서 처음 요청한 좌표의 결과)
+    SPATIAL_CELL_SIZES = {
+        'coord2address': 10,
+        'coord2region': 100,
+        'roadview': 10,
+        'cctv_nearby': 50,
+    }
+
+    # 좌표 파라미터 반올림 자릿수 (소수점 6자리 ≈ 0.1m)
+    COORD_PRECISION = 6
+    COORD_PARAMS = ('x', 'y')
+
+    STAT_NAMES = ('hits', 'stale_hits', 'negative_hits', 'misses')
+
+    # 백그라운드 갱신 동시 실행 수 (오래된 항목이 몰려도 API 호출은 이 수만큼만)
+    REFRESH_WORKERS = 2
+
+    def __init__(self, cache: Cache, ttls: Optional[Dict[str, int]] = None,
+                 stale_grace: int = 86400, empty_ttl: int = 300, failure_ttl: int = 30,
+                 cell_sizes: Optional[Dict[str, float]] = None):
+        self.cache = cache
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.cell_sizes = dict(self.SPATIAL_CELL_SIZES)
+        if cell_sizes:
+            self.cell_sizes.update(cell_sizes)
+
+        # 만료 후 오래된 값을 제공하며 백그라운드 갱신하는 유예 시간
+        self.stale_grace = stale_grace
+        # 빈 결과 / 잘못된 요청(4xx)을 캐시하는 시간
+        self.empty_ttl = empty_ttl
+        self.failure_ttl = failure_ttl
+
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=self.REFRESH_WORKERS,
+                                                    thread_name_prefix="cache-revalidate")
+
+    def get_endpoint_name(self, endpoint: str) -> str:
+        """엔드포인트의 TTL 설정 이름"""
+        return self.ENDPOINT_NAMES.get(endpoint, 'default')
+
+    def get_ttl(self, endpoint: str) -> int:
+        """엔드포인트의 캐시 유지 시간 (0이면 캐시하지 않음)"""
+        return self.ttls.get(self.get_endpoint_name(endpoint), self.ttls['default'])
+
+    def snap_params(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """좌표 기반 엔드포인트는 x, y를 공간 셀(타일) 중심으로 맞춘 캐시 키용 파라미터 반환"""
+        cell_size = self.cell_sizes.get(self.get_endpoint_name(endpoint), 0)
+        if cell_size <= 0 or params.get('x') is None or params.get('y') is None:
+            return params
+
+        lng, lat = float(params['x']), float(params['y'])
+        zoom = Coordinates.zoom_for_cell_size(lat, cell_size)
+        lat, lng = Coordinates.snap_to_tile_center(lat, lng, zoom)
+
+        snapped = dict(params)
+        snapped['x'] = round(lng, self.COORD_PRECISION)
+        snapped['y'] = round(lat, self.COORD_PRECISION)
+        return snapped
+
+    def make_key(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """정렬된 파라미터와 반올림한 좌표로 캐시 키 생성"""
+        normalized = []
+        for name, value in params.items():
+            if name in self.COORD_PARAMS and value is not None:
+                value = f"{float(value):.{self.COORD_PRECISION}f}"
+            elif isinstance(value, str):
+                value = value.strip()
+            normalized.append((name, str(value)))
+
+        return f"api:{endpoint}?{urlencode(sorted(normalized))}"
+
+    def _record(self, name: str, stat: str):
+        with self._lock:
+            stats = self._stats.setdefault(name, dict.fromkeys(self.STAT_NAMES, 0))
+            stats[stat] += 1
+
+    @staticmethod
+    def _is_empty(value: Any) -> bool:
+        """검색 결과가 없는 응답인지 확인"""
+        return isinstance(value, dict) and 'documents' in value and not value['documents']
+
+    def _store(self, key: str, value: Any, ttl: int):
+        """응답 저장 (빈 결과는 짧은 TTL, 실패(None)는 저장하지 않음)"""
+        if value is None:
+            return
+        if self._is_empty(value):
+            self.cache.set(key, value, min(ttl, self.empty_ttl))
+        else:
+            self.cache.set(key, value, ttl, stale_ttl=self.stale_grace)
+
+    def _fetch_and_store(self, key: str, ttl: int, fetch: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """네트워크 요청 후 결과 저장 (잘못된 요청은 negative 캐시)"""
+        try:
+            value = fetch()
+        except ClientApiError:
+            # 지오코딩되지 않는 주소 등 같은 요청을 반복해도 실패하는 경우
+            if self.failure_ttl > 0:
+                self.cache.set_negative(key, self.failure_ttl)
+            raise
+
+        self._store(key, value, ttl)
+        return value
+
+    def _refresh_in_background(self, key: str, ttl: int, fetch: Callable[[], Optional[Any]]):
+        """오래된 항목을 백그라운드에서 갱신 (같은 키는 한 번만)"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch_and_store(key, ttl, fetch)
+            except Exception as e:
+                logging.warning(f"캐시 백그라운드 갱신 실패 [{getattr(e, 'kind', 'unknown')}]: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        try:
+            self._refresh_executor.submit(refresh)
+        except RuntimeError:
+            # 종료된 뒤에는 갱신하지 않고 오래된 값만 제공
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_fetch(self, endpoint: str, params: Dict[str, Any],
+                     fetch: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """캐시에 있으면 반환, 없으면 fetch 결과를 캐시에 저장 후 반환 (만료 항목은 유예 시간 동안 반환 후 갱신)
+
+        좌표 기반 엔드포인트는 공간 셀 단위로 키를 만들고, fetch는 호출한 좌표로 요청
+        """
+        ttl = self.get_ttl(endpoint)
+        if ttl <= 0:
+            return fetch()
+
+        name = self.get_endpoint_name(endpoint)
+        key = self.make_key(endpoint, self.snap_params(endpoint, params))
+
+        state, value = self.cache.lookup(key)
+        if state == Cache.FRESH:
+            self._record(name, 'hits')
+            return value
+
+        if state == Cache.NEGATIVE:
+            self._record(name, 'negative_hits')
+            return None
+
+        if state == Cache.STALE:
+            self._record(name, 'stale_hits')
+            self._refresh_in_background(key, ttl, fetch)
+            return value
+
+        self._record(name, 'misses')
+        return self._fetch_and_store(key, ttl, fetch)
+
+    def close(self):
+        """대기 중인 백그라운드 갱신을 취소하고 갱신 스레드 종료"""
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._refreshing.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """엔드포인트별 히트/미스 통계 (stale, negative 히트도 히트로 집계)"""
+        with self._lock:
+            endpoints = {name: dict(stats) for name, stats in self._stats.items()}
+
+        totals = {stat: sum(stats[stat] for stats in endpoints.values())
+                  for stat in self.STAT_NAMES}
+        for stats in endpoints.values():
+            hits = stats['hits'] + stats['stale_hits'] + stats['negative_hits']
+            total = hits + stats['misses']
+            stats['hit_rate'] = hits / total if total else 0.0
+
+        hits = totals['hits'] + totals['stale_hits'] + totals['negative_hits']
+        misses = totals['misses']
+        return {
+            'hits': hits,
+            'stale_hits': totals['stale_hits'],
+            'negative_hits': totals['negative_hits'],
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'endpoints': endpoints
+        }
@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+
+def make_request_key(url: str, params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> str:
+    """엔드포인트와 정규화된 파라미터로 요청 키 생성"""
+    normalized = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    key = f"{url}?{urlencode(normalized)}"
+
+    # API 키가 다르면 응답도 다를 수 있으므로 인증 헤더는 키에 포함
+    auth = (headers or {}).get('Authorization')
+    if auth:
+        key += f"#{auth}"
+    return key
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """같은 키의 동시 요청을 하나의 호출로 합치고 결과를 공유"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """진행 중인 동일 호출이 있으면 그 결과를 기다리고, 없으면 직접 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                is_leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                is_leader = True
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """실행된 호출 수와 합쳐진(공유된) 호출 수"""
+        with self._lock:
+            return {'executed': self.executed, 'shared': self.shared,
+                    'in_flight': len(self._calls)}
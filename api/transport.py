@@ -0,0 +1,186 @@
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api.errors import ApiError, TransientApiError, ClientApiError, classify_exception, classify_response
+from api.rate_limiter import RateLimiter
+from api.resilience import RetryPolicy, CircuitBreaker
+from api.single_flight import SingleFlight, make_request_key
+
+
+class HttpTransport:
+    """호스트별 keep-alive 세션을 재사용하는 공용 HTTP 전송 계층"""
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = True, connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0, rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = (connect_timeout, read_timeout)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.single_flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _create_session(self) -> requests.Session:
+        """커넥션 풀이 설정된 세션 생성"""
+        session = requests.Session()
+        # pool_maxsize는 호스트당 최대 연결 수, pool_block이면 초과 요청은 대기
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def get_session(self, url: str) -> requests.Session:
+        """URL의 호스트에 해당하는 세션 반환"""
+        host_key = self._host_key(url)
+
+        with self._lock:
+            session = self._sessions.get(host_key)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host_key] = session
+            return session
+
+    def get_circuit_breaker(self, url: str) -> CircuitBreaker:
+        """URL의 호스트에 해당하는 회로 차단기 반환"""
+        host_key = self._host_key(url)
+
+        with self._lock:
+            breaker = self._breakers.get(host_key)
+            if breaker is None:
+                breaker = CircuitBreaker(host_key, self.failure_threshold, self.reset_timeout)
+                self._breakers[host_key] = breaker
+            return breaker
+
+    @property
+    def last_error(self) -> Optional[ApiError]:
+        """현재 스레드에서 마지막으로 실패한 요청의 분류된 오류"""
+        return getattr(self._local, 'last_error', None)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[Tuple[float, float]] = None) -> requests.Response:
+        """GET 요청 수행 (일시적 오류는 재시도, 실패 시 ApiError 계열 예외 발생)
+
+        회로 차단기 실패와 일일 쿼터는 재시도를 포함한 요청 하나당 한 번만 반영
+        """
+        self._local.last_error = None
+        breaker = self.get_circuit_breaker(url)
+        session = self.get_session(url)
+        breaker.before_request()
+        attempt = 0
+
+        while True:
+            response = None
+            try:
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(url, count_quota=attempt == 0)
+
+                response = session.get(url, params=params, headers=headers,
+                                       timeout=timeout or self.timeout)
+                error = classify_response(response)
+            except requests.exceptions.RequestException as e:
+                error = classify_exception(e)
+
+            if error is None:
+                breaker.record_success()
+                return response
+
+            if not error.retryable or attempt >= self.retry_policy.max_retries:
+                # 재시도가 모두 끝난 최종 결과만 차단기에 기록
+                if isinstance(error, TransientApiError):
+                    breaker.record_failure()
+                elif isinstance(error, ClientApiError):
+                    # 4xx는 서비스가 응답하고 있다는 뜻이므로 차단기에는 성공으로 기록
+                    breaker.record_success()
+                self._local.last_error = error
+                raise error
+
+            time.sleep(self.retry_policy.get_delay(attempt, response))
+            attempt += 1
+
+    def _coalesced(self, url: str, params: Optional[Dict[str, Any]],
+                   headers: Optional[Dict[str, str]], parse: str):
+        """동일한 동시 요청은 한 번만 보내고 파싱된 결과를 공유"""
+        def fetch():
+            response = self.get(url, params=params, headers=headers)
+            if parse == 'json':
+                return response.json()
+            return response.content if parse == 'content' else response.text
+
+        key = f"{parse}:{make_request_key(url, params, headers)}"
+        self._local.last_error = None
+        try:
+            return self.single_flight.do(key, fetch)
+        except ApiError as e:
+            # 함께 기다린 스레드에도 오류를 기록
+            self._local.last_error = e
+            raise
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                 headers: Optional[Dict[str, str]] = None) -> Any:
+        """GET 요청 후 JSON 응답 반환 (동일 요청 병합)"""
+        return self._coalesced(url, params, headers, 'json')
+
+    def get_text(self, url: str, params: Optional[Dict[str, Any]] = None,
+                 headers: Optional[Dict[str, str]] = None) -> str:
+        """GET 요청 후 텍스트 응답 반환 (동일 요청 병합)"""
+        return self._coalesced(url, params, headers, 'text')
+
+    def get_content(self, url: str, params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> bytes:
+        """GET 요청 후 디코딩하지 않은 응답 본문 반환 (동일 요청 병합)"""
+        return self._coalesced(url, params, headers, 'content')
+
+    def close(self):
+        """모든 세션 종료"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_shared_transport: Optional[HttpTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_transport() -> HttpTransport:
+    """애플리케이션 전역 공유 전송 계층 반환"""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = HttpTransport()
+        return _shared_transport
+
+
+def configure_shared_transport(**settings) -> HttpTransport:
+    """설정값으로 공유 전송 계층 재생성"""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is not None:
+            _shared_transport.close()
+        _shared_transport = HttpTransport(**settings)
+        return _shared_transport
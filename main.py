@@ -124,15 +124,15 @@ class KakaoMapApp:
     def setup_cache(self):
         """캐시 초기화"""
         try:
-            self.cache = Cache()
+            self.cache = Cache(**self.config.get_cache_settings())
             
             if self.splash:
                 self.splash.showMessage("🗺️ KakaoMap Clone\n\n캐시 초기화 중...", 
                                       Qt.AlignmentFlag.AlignCenter, Qt.GlobalColor.black)
                 self.app.processEvents()
             
-            # 만료된 캐시 정리
-            self.cache.cleanup_expired()
+            # 만료된 캐시는 시작을 막지 않도록 백그라운드에서 조금씩 정리
+            self.cache.start_background_cleanup(**self.config.get_cache_cleanup_settings())
             
             cache_stats = self.cache.get_cache_stats()
             logging.info(f"캐시 초기화 완료 - 파일: {cache_stats['total_files']}개, "
@@ -150,7 +150,7 @@ class KakaoMapApp:
                                       Qt.AlignmentFlag.AlignCenter, Qt.GlobalColor.black)
                 self.app.processEvents()
             
-            self.main_window = MainWindow(self.config)
+            self.main_window = MainWindow(self.config, self.cache)
             
             if self.splash:
                 self.splash.showMessage("🗺️ KakaoMap Clone\n\n완료!", 
@@ -207,7 +207,8 @@ class KakaoMapApp:
         """애플리케이션 정리"""
         try:
             if self.cache:
-                self.cache.cleanup_expired()
+                self.cache.stop_background_cleanup()
+                self.cache.close()
             
             logging.info("애플리케이션 정리 완료")
             
@@ -218,7 +219,7 @@ class KakaoMapApp:
 def check_dependencies():
     """필수 의존성 확인"""
     required_modules = [
-        'PyQt6', 'requests', 'PIL'
+        'PyQt6', 'requests', 'PIL', 'numpy'
     ]
     
     missing_modules = []
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, ClassVar, Iterable, Union
 from datetime import datetime
 
+import numpy as np
 
-@dataclass
+from models.table import ModelTable, _intern
+
+
+@dataclass(slots=True)
 class CCTV:
     id: str
     name: str
@@ -17,6 +21,8 @@ class CCTV:
     pixel_count: Optional[str] = None
     manage_agency: Optional[str] = None
     
+    ACTIVE_STATUSES: ClassVar[tuple] = ('active', 'normal', '정상', '운영중')
+    
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> 'CCTV':
         """공공 API 응답으로부터 CCTV 객체 생성"""
@@ -26,12 +32,12 @@ class CCTV:
             address=data.get('address', data.get('cctvAddress', '')),
             x=float(data.get('longitude', data.get('x', 0))),
             y=float(data.get('latitude', data.get('y', 0))),
-            purpose=data.get('purpose', data.get('cctvPurpose', '')),
-            institution=data.get('institution', data.get('cctvInstitution', '')),
-            status=data.get('status', data.get('cctvStatus', 'unknown')),
-            installation_date=data.get('installationDate', data.get('cctvInstallDate')),
-            pixel_count=data.get('pixelCount', data.get('cctvPixel')),
-            manage_agency=data.get('manageAgency', data.get('cctvManageAgency'))
+            purpose=_intern(data.get('purpose', data.get('cctvPurpose', ''))),
+            institution=_intern(data.get('institution', data.get('cctvInstitution', ''))),
+            status=_intern(data.get('status', data.get('cctvStatus', 'unknown'))),
+            installation_date=_intern(data.get('installationDate', data.get('cctvInstallDate'))),
+            pixel_count=_intern(data.get('pixelCount', data.get('cctvPixel'))),
+            manage_agency=_intern(data.get('manageAgency', data.get('cctvManageAgency')))
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -52,7 +58,7 @@ class CCTV:
     
     def is_active(self) -> bool:
         """CCTV 활성 상태 확인"""
-        return self.status.lower() in ['active', 'normal', '정상', '운영중']
+        return self.status.lower() in self.ACTIVE_STATUSES
     
     def get_display_name(self) -> str:
         """표시용 이름 반환"""
@@ -77,12 +83,54 @@ class CCTV:
         return (self.y, self.x)
 
 
+class CCTVTable(ModelTable):
+    """CCTV 목록의 열 단위 컨테이너 (목적/상태 필터와 집계를 배열 연산으로 처리)"""
+    
+    model = CCTV
+    
+    def purpose_mask(self, purpose: str) -> np.ndarray:
+        """목적이 일치하는 행의 마스크 (대소문자 무시)"""
+        purpose = purpose.lower()
+        return self.columns['purpose'].mask_where(lambda value: (value or '').lower() == purpose)
+    
+    def filter_purpose(self, purpose: str) -> 'CCTVTable':
+        """목적별 CCTV 필터링"""
+        return self.filter(self.purpose_mask(purpose))
+    
+    def status_mask(self, statuses: Iterable[str]) -> np.ndarray:
+        """상태가 주어진 값 중 하나인 행의 마스크 (대소문자 무시)"""
+        wanted = {status.lower() for status in statuses}
+        return self.columns['status'].mask_where(lambda value: (value or '').lower() in wanted)
+    
+    def filter_status(self, statuses: Iterable[str]) -> 'CCTVTable':
+        """상태별 CCTV 필터링"""
+        return self.filter(self.status_mask(statuses))
+    
+    def active_mask(self) -> np.ndarray:
+        """활성 CCTV 행의 마스크"""
+        return self.status_mask(CCTV.ACTIVE_STATUSES)
+    
+    def count_active(self) -> int:
+        """활성 CCTV 개수"""
+        return int(self.active_mask().sum())
+    
+    def purpose_counts(self) -> Dict[str, int]:
+        """목적별 CCTV 개수"""
+        column = self.columns['purpose']
+        counts = np.bincount(column.codes, minlength=len(column.values))
+        result: Dict[str, int] = {}
+        for value, count in zip(column.values, counts.tolist()):
+            if count:
+                result[value] = result.get(value, 0) + count
+        return result
+
+
 @dataclass 
 class CCTVArea:
     """CCTV 구역 정보"""
     name: str
     bounds: Dict[str, float]
-    cctv_list: List[CCTV]
+    cctv_list: Union[CCTVTable, List[CCTV]]
     
     def get_cctv_count(self) -> int:
         """구역 내 CCTV 개수"""
@@ -90,8 +138,13 @@ class CCTVArea:
     
     def get_active_cctv_count(self) -> int:
         """구역 내 활성 CCTV 개수"""
+        # 목록이면 테이블로 바꾸는 비용이 한 번 훑는 것보다 크므로 그대로 셈
+        if isinstance(self.cctv_list, CCTVTable):
+            return self.cctv_list.count_active()
         return sum(1 for cctv in self.cctv_list if cctv.is_active())
     
     def get_cctv_by_purpose(self, purpose: str) -> List[CCTV]:
         """목적별 CCTV 필터링"""
+        if isinstance(self.cctv_list, CCTVTable):
+            return self.cctv_list.filter_purpose(purpose).to_list()
         return [cctv for cctv in self.cctv_list if cctv.purpose.lower() == purpose.lower()]
\ No newline at end of file
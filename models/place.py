@@ -1,8 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+import numpy as np
 
-@dataclass
+from models.table import ModelTable, _intern
+
+
+@dataclass(slots=True)
 class Place:
     id: str
     name: str
@@ -25,7 +29,7 @@ class Place:
             road_address=data.get('road_address_name', ''),
             x=float(data.get('x', 0)),
             y=float(data.get('y', 0)),
-            category=data.get('category_name', ''),
+            category=_intern(data.get('category_name', '')),
             phone=data.get('phone', ''),
             url=data.get('place_url', ''),
             distance=float(data.get('distance', 0)) if data.get('distance') else None
@@ -60,4 +64,19 @@ class Place:
             return ''
         
         parts = self.category.split(' > ')
-        return parts[-1] if parts else self.category
\ No newline at end of file
+        return parts[-1] if parts else self.category
+
+
+class PlaceTable(ModelTable):
+    """장소 목록의 열 단위 컨테이너"""
+    
+    model = Place
+    float_columns = ('x', 'y', 'distance')
+    
+    def category_mask(self, keyword: str) -> np.ndarray:
+        """카테고리에 키워드가 포함된 행의 마스크"""
+        return self.columns['category'].mask_where(lambda value: keyword in (value or ''))
+    
+    def filter_category(self, keyword: str) -> 'PlaceTable':
+        """카테고리 키워드로 장소 필터링"""
+        return self.filter(self.category_mask(keyword))
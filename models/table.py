@@ -0,0 +1,235 @@
+import sys
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from utils.coordinates import Coordinates
+
+
+def _intern(value: Any) -> Any:
+    """반복되는 문자열을 하나의 객체로 공유"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class DictionaryColumn:
+    """사전 부호화된 문자열 열 (정수 코드 배열 + 고유 값 목록)"""
+
+    __slots__ = ('codes', 'values')
+
+    def __init__(self, codes: np.ndarray, values: List[Any]):
+        self.codes = codes
+        self.values = values
+
+    @classmethod
+    def encode(cls, items: Iterable[Any]) -> 'DictionaryColumn':
+        """값 목록을 코드 배열과 고유 값 목록으로 부호화"""
+        items = list(items)
+        values = list(dict.fromkeys(items))
+        # 모든 값이 다르면 (ID, 이름 등) 코드는 행 번호와 같음
+        if len(values) == len(items):
+            return cls(np.arange(len(items), dtype=np.int32), values)
+        index = {value: code for code, value in enumerate(values)}
+        codes = np.fromiter(map(index.__getitem__, items), dtype=np.int32, count=len(items))
+        return cls(codes, values)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[self.codes[index]]
+
+    def take(self, indices) -> 'DictionaryColumn':
+        """인덱스(또는 불리언 마스크)로 고른 행만 담은 열 (사전은 공유)"""
+        return DictionaryColumn(self.codes[indices], self.values)
+
+    def decode(self) -> List[Any]:
+        """코드 배열을 값 목록으로 복원"""
+        if not self.values:
+            return [None] * len(self.codes)
+        lookup = np.empty(len(self.values), dtype=object)
+        lookup[:] = self.values
+        return lookup[self.codes].tolist()
+
+    def isin(self, values: Iterable[Any]) -> np.ndarray:
+        """값이 주어진 집합에 속하는 행의 불리언 마스크 (사전에서 한 번만 비교)"""
+        wanted = set(values)
+        return self.mask_where(lambda value: value in wanted)
+
+    def mask_where(self, predicate) -> np.ndarray:
+        """사전 값에 조건을 적용한 결과를 행 단위 마스크로 확장"""
+        matched = np.fromiter((bool(predicate(value)) for value in self.values),
+                              dtype=bool, count=len(self.values))
+        return matched[self.codes] if len(self.values) else np.zeros(len(self.codes), dtype=bool)
+
+    def concat(self, other: 'DictionaryColumn') -> 'DictionaryColumn':
+        """두 열을 이어 붙임 (뒤 열의 코드는 앞 열의 사전에 맞춰 다시 매김)"""
+        mapping = {value: code for code, value in enumerate(self.values)}
+        remap = np.array([mapping.setdefault(value, len(mapping)) for value in other.values],
+                         dtype=np.int32)
+        codes = remap[other.codes] if len(remap) else other.codes
+        return DictionaryColumn(np.concatenate([self.codes, codes]), list(mapping))
+
+
+class ModelTable:
+    """모델 목록을 열 단위로 보관하는 컨테이너 (실수 열은 float64 배열, 문자열 열은 사전 부호화)"""
+
+    model: Any = None
+    # float64 배열로 보관하는 열 (None은 NaN)
+    float_columns: Sequence[str] = ('x', 'y')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._names = tuple(f.name for f in fields(cls.model))
+        # 기본값이 None인 실수 필드는 NaN을 None으로 복원
+        cls._optional = frozenset(f.name for f in fields(cls.model) if f.default is None)
+
+    def __init__(self, columns: Optional[Dict[str, Any]] = None):
+        if columns is None:
+            columns = {name: (np.zeros(0) if name in self.float_columns
+                              else DictionaryColumn(np.zeros(0, dtype=np.int32), []))
+                       for name in self._names}
+        self.columns = columns
+        self._objects: Dict[int, Any] = {}
+
+    @classmethod
+    def from_models(cls, items: Iterable[Any]) -> 'ModelTable':
+        """모델 객체 목록으로 테이블 생성"""
+        if isinstance(items, cls):
+            return items
+        items = list(items)
+        columns = {}
+        for f in fields(cls.model):
+            values = [getattr(item, f.name) for item in items]
+            if f.name in cls.float_columns:
+                columns[f.name] = np.array([np.nan if v is None else v for v in values],
+                                           dtype=np.float64)
+            else:
+                columns[f.name] = DictionaryColumn.encode(values)
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, tables: Iterable['ModelTable']) -> 'ModelTable':
+        """여러 테이블을 하나로 이어 붙임"""
+        result = None
+        for table in tables:
+            if result is None:
+                result = table
+                continue
+            columns = {}
+            for name, column in result.columns.items():
+                other = table.columns[name]
+                if isinstance(column, DictionaryColumn):
+                    columns[name] = column.concat(other)
+                else:
+                    columns[name] = np.concatenate([column, other])
+            result = cls(columns)
+        return result if result is not None else cls()
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.columns['x']
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.columns['y']
+
+    def __len__(self) -> int:
+        return len(self.columns['x'])
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("테이블 인덱스 범위를 벗어났습니다")
+            index = int(index)
+            # 접근할 때 한 번만 모델 객체로 변환
+            obj = self._objects.get(index)
+            if obj is None:
+                obj = self.model(*(self._value(name, index) for name in self._names))
+                self._objects[index] = obj
+            return obj
+        return self.take(index)
+
+    def _value(self, name: str, index: int) -> Any:
+        column = self.columns[name]
+        if isinstance(column, DictionaryColumn):
+            return column[index]
+        value = float(column[index])
+        if value != value and name in self._optional:
+            return None
+        return value
+
+    def column(self, name: str) -> List[Any]:
+        """열 전체를 파이썬 값 목록으로 반환"""
+        column = self.columns[name]
+        if isinstance(column, DictionaryColumn):
+            return column.decode()
+        values = column.tolist()
+        if name in self._optional:
+            values = [None if v != v else v for v in values]
+        return values
+
+    def to_list(self) -> List[Any]:
+        """모든 행을 모델 객체 목록으로 변환"""
+        return [self.model(*row) for row in zip(*(self.column(name) for name in self._names))]
+
+    def take(self, indices) -> 'ModelTable':
+        """슬라이스, 인덱스 배열 또는 불리언 마스크로 고른 행의 테이블"""
+        if not isinstance(indices, slice):
+            indices = np.asarray(indices)
+        columns = {name: (column.take(indices) if isinstance(column, DictionaryColumn)
+                          else column[indices])
+                   for name, column in self.columns.items()}
+        return type(self)(columns)
+
+    def filter(self, mask: np.ndarray) -> 'ModelTable':
+        """불리언 마스크가 참인 행만 남긴 테이블"""
+        return self.take(np.asarray(mask, dtype=bool))
+
+    def drop_duplicates(self, name: str = 'id') -> 'ModelTable':
+        """열 값이 같은 행 중 처음 나온 행만 남긴 테이블 (순서 유지)"""
+        _, first = np.unique(self.columns[name].codes, return_index=True)
+        return self.take(np.sort(first))
+
+    def bbox_mask(self, bounds: Dict[str, float]) -> np.ndarray:
+        """경계 영역(north/south/east/west) 안에 있는 행의 마스크"""
+        return ((self.y >= bounds['south']) & (self.y <= bounds['north']) &
+                (self.x >= bounds['west']) & (self.x <= bounds['east']))
+
+    def filter_bbox(self, bounds: Dict[str, float]) -> 'ModelTable':
+        """경계 영역 안의 행만 남긴 테이블"""
+        return self.filter(self.bbox_mask(bounds))
+
+    def distances_from(self, lat: float, lng: float) -> np.ndarray:
+        """한 좌표에서 각 행까지의 거리 (km 단위 배열)"""
+        return Coordinates.calculate_distances(lat, lng, self.y, self.x)
+
+    def filter_radius(self, lat: float, lng: float, radius_km: float) -> 'ModelTable':
+        """반경 안의 행만 남긴 테이블"""
+        return self.filter(self.distances_from(lat, lng) <= radius_km)
+
+    def sort_by_distance(self, lat: float, lng: float) -> 'ModelTable':
+        """가까운 순으로 정렬한 테이블"""
+        return self.take(np.argsort(self.distances_from(lat, lng), kind='stable'))
+
+    def bounds(self) -> Dict[str, float]:
+        """좌표가 있는 행들의 경계 영역 (없으면 모두 0)"""
+        located = (self.x != 0) & (self.y != 0) & ~np.isnan(self.x) & ~np.isnan(self.y)
+        if not located.any():
+            return {'north': 0, 'south': 0, 'east': 0, 'west': 0}
+        xs, ys = self.x[located], self.y[located]
+        return {
+            'north': float(ys.max()),
+            'south': float(ys.min()),
+            'east': float(xs.max()),
+            'west': float(xs.min())
+        }
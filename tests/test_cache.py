@@ -0,0 +1,243 @@
+import os
+import sqlite3
+import time
+
+import pytest
+
+from utils.cache import AccessIndex, Cache, FileCacheBackend, SQLiteCacheBackend, hash_key
+
+
+BACKENDS = [FileCacheBackend, SQLiteCacheBackend]
+
+
+def record(value='값', ttl=3600):
+    now = time.time()
+    return {'value': value, 'expires_at': now + ttl, 'created_at': now}
+
+
+def stored_keys(backend, keys):
+    return [key for key in keys if backend.read(key) is not None]
+
+
+def cache_files(path):
+    return sorted(name for name in os.listdir(path) if name.endswith('.cache'))
+
+
+def test_access_index_lru_order():
+    index = AccessIndex('lru')
+    for name in 'abc':
+        index.add(name, 10)
+    index.touch('a')
+
+    assert index.pop_victim(exclude='b') == 'c'
+    assert index.pop_victim() == 'b'
+    assert index.pop_victim() == 'a'
+    assert index.pop_victim() is None
+    assert index.total_bytes == 0
+
+
+def test_access_index_lfu_order():
+    index = AccessIndex('lfu')
+    for name in 'abc':
+        index.add(name, 10)
+    index.touch('a')
+    index.touch('a')
+    index.touch('c')
+
+    assert index.pop_victim() == 'b'
+    assert index.pop_victim(exclude='c') == 'a'
+    assert index.pop_victim() == 'c'
+    assert len(index) == 0
+
+
+def test_access_index_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        AccessIndex('fifo')
+
+
+@pytest.mark.parametrize('backend_cls', BACKENDS)
+def test_lru_evicts_least_recently_used(tmp_path, backend_cls):
+    backend = backend_cls(str(tmp_path), max_entries=3, eviction_policy='lru')
+    evicted = []
+    backend.on_evict = evicted.extend
+    keys = [f'key{i}' for i in range(5)]
+
+    for key in keys[:3]:
+        backend.write(key, record())
+    backend.read('key0')
+    backend.write('key3', record())
+
+    assert evicted == [hash_key('key1')]
+    backend.read('key2')
+    backend.write('key4', record())
+    assert evicted == [hash_key('key1'), hash_key('key0')]
+    assert stored_keys(backend, keys) == ['key2', 'key3', 'key4']
+    backend.close()
+
+
+@pytest.mark.parametrize('backend_cls', BACKENDS)
+def test_lfu_evicts_least_frequently_used(tmp_path, backend_cls):
+    backend = backend_cls(str(tmp_path), max_entries=3, eviction_policy='lfu')
+    evicted = []
+    backend.on_evict = evicted.extend
+    keys = [f'key{i}' for i in range(5)]
+
+    for key in keys[:3]:
+        backend.write(key, record())
+    for key in ('key0', 'key0', 'key2'):
+        backend.read(key)
+    backend.write('key3', record())
+    # 방금 쓴 key3은 접근 횟수가 0이므로 다음 제거 대상
+    backend.write('key4', record())
+
+    assert evicted == [hash_key('key1'), hash_key('key3')]
+    assert stored_keys(backend, keys) == ['key0', 'key2', 'key4']
+    backend.close()
+
+
+@pytest.mark.parametrize('backend_cls', BACKENDS)
+def test_byte_budget(tmp_path, backend_cls):
+    size = backend_cls(str(tmp_path / 'probe')).write('probe', record('x' * 500))
+    budget = size * 3 + size // 2
+    backend = backend_cls(str(tmp_path / 'cache'), max_bytes=budget)
+    keys = [f'key{i}' for i in range(6)]
+
+    for key in keys:
+        assert backend.write(key, record('x' * 500)) == size
+
+    stats = backend.get_stats()
+    assert stats['total_files'] == 3
+    assert stats['total_size'] == backend.get_size() == size * 3 <= budget
+    assert stored_keys(backend, keys) == keys[3:]
+    backend.close()
+
+
+@pytest.mark.parametrize('backend_cls', BACKENDS)
+def test_entry_budget_keeps_entry_just_written(tmp_path, backend_cls):
+    backend = backend_cls(str(tmp_path), max_entries=1)
+
+    backend.write('old', record())
+    backend.write('new', record('x' * 10000))
+
+    assert backend.get_stats()['total_files'] == 1
+    assert backend.read('old') is None
+    assert backend.read('new')['value'] == 'x' * 10000
+    backend.close()
+
+
+@pytest.mark.parametrize('backend_cls', BACKENDS)
+def test_unlimited_backend_keeps_everything(tmp_path, backend_cls):
+    backend = backend_cls(str(tmp_path))
+    for i in range(20):
+        backend.write(f'key{i}', record())
+    assert backend.get_stats()['total_files'] == 20
+    backend.close()
+
+
+def test_file_index_is_rebuilt_after_other_process_deletes_files(tmp_path):
+    backend = FileCacheBackend(str(tmp_path), max_entries=10)
+    evicted = []
+    backend.on_evict = evicted.extend
+    keys = [f'key{i}' for i in range(5)]
+    for key in keys:
+        backend.write(key, record())
+    size = backend.get_size() // 5
+
+    # 다른 프로세스가 파일을 지움 (이 프로세스의 인덱스는 모름)
+    for key in keys[:2]:
+        os.remove(os.path.join(str(tmp_path), f'{hash_key(key)}.cache'))
+    assert backend.get_stats()['total_files'] == 5
+
+    backend.enforce_limits()
+    assert sorted(evicted) == sorted(hash_key(key) for key in keys[:2])
+    assert backend.get_stats()['total_files'] == 3
+    assert backend.get_size() == size * 3
+
+
+def test_file_limits_count_entries_written_by_other_processes(tmp_path):
+    first = FileCacheBackend(str(tmp_path), max_entries=4)
+    second = FileCacheBackend(str(tmp_path), max_entries=4)
+    for i in range(3):
+        first.write(f'first{i}', record())
+        second.write(f'second{i}', record())
+
+    # 각자의 인덱스로는 한도 안이지만 디렉토리 전체는 6개
+    assert len(cache_files(str(tmp_path))) == 6
+
+    first.close()
+    assert len(cache_files(str(tmp_path))) == 4
+    assert first.get_stats()['total_files'] == 4
+
+
+def test_file_backend_rescans_periodically(tmp_path):
+    first = FileCacheBackend(str(tmp_path), max_entries=20)
+    second = FileCacheBackend(str(tmp_path), max_entries=20)
+    assert first._rescan_writes == FileCacheBackend.MIN_RESCAN_WRITES
+
+    for i in range(15):
+        second.write(f'second{i}', record())
+    for i in range(FileCacheBackend.MIN_RESCAN_WRITES):
+        first.write(f'first{i}', record())
+
+    # 쓰기 횟수가 차면 close 없이도 디렉토리 전체 기준으로 한도를 지킴
+    assert len(cache_files(str(tmp_path))) == 20
+
+
+def access_rows(path):
+    conn = sqlite3.connect(os.path.join(str(path), SQLiteCacheBackend.DB_FILENAME))
+    try:
+        return dict(conn.execute("SELECT key_hash, hits FROM cache_access"))
+    finally:
+        conn.close()
+
+
+def test_sqlite_touches_are_buffered_and_flushed_on_close(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path))
+    backend.write('key', record())
+    for _ in range(3):
+        assert backend.read('key') is not None
+
+    # 조회마다 커밋하지 않음
+    assert access_rows(tmp_path) == {hash_key('key'): 0}
+
+    backend.close()
+    assert access_rows(tmp_path) == {hash_key('key'): 3}
+
+
+def test_sqlite_touches_are_flushed_in_batches(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path))
+    keys = [f'key{i}' for i in range(SQLiteCacheBackend.ACCESS_FLUSH_BATCH)]
+    for key in keys:
+        backend.write(key, record())
+    for key in keys:
+        backend.read(key)
+
+    assert set(access_rows(tmp_path).values()) == {1}
+    backend.close()
+
+
+def test_sqlite_flushed_touches_survive_reopen(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path), eviction_policy='lfu')
+    for key in ('key0', 'key1'):
+        backend.write(key, record())
+    backend.read('key0')
+    backend.close()
+
+    reopened = SQLiteCacheBackend(str(tmp_path), max_entries=2, eviction_policy='lfu')
+    evicted = []
+    reopened.on_evict = evicted.extend
+    reopened.write('key2', record())
+    assert evicted == [hash_key('key1')]
+    reopened.close()
+
+
+@pytest.mark.parametrize('backend', ['file', 'sqlite'])
+def test_eviction_also_drops_memory_tier(tmp_path, backend):
+    cache = Cache(str(tmp_path), backend=backend, max_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key)
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 'b' and cache.get('c') == 'c'
+    assert cache.get_tier_stats()['memory_entries'] == 2
+    cache.close()
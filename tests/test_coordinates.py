@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from utils.coordinates import Coordinates
+
+
+@pytest.mark.parametrize('zoom', [0, 1, 5, 18])
+def test_tile_pixels_clamped_at_antimeridian_and_poles(zoom):
+    lats = np.array([0.0, 0.0, 90.0, -90.0, 85.0511287798, -85.0511287798, 90.0, -90.0])
+    lngs = np.array([180.0, -180.0, 0.0, 0.0, 180.0, 180.0, 180.0, -180.0])
+    tile_x, tile_y, pixel_x, pixel_y = Coordinates.latlon_to_tile_pixels(lats, lngs, zoom)
+
+    last = 2 ** zoom - 1
+    assert ((tile_x >= 0) & (tile_x <= last)).all()
+    assert ((tile_y >= 0) & (tile_y <= last)).all()
+    assert ((pixel_x >= 0) & (pixel_x < 256)).all()
+    assert ((pixel_y >= 0) & (pixel_y < 256)).all()
+
+    tiles_x, tiles_y = Coordinates.latlon_to_tiles(lats, lngs, zoom)
+    np.testing.assert_array_equal(tile_x, tiles_x)
+    np.testing.assert_array_equal(tile_y, tiles_y)
+
+
+def test_tile_pixels_at_east_edge_is_last_pixel():
+    tile_x, _, pixel_x, _ = Coordinates.latlon_to_tile_pixels([0.0], [180.0], 3)
+    assert tile_x[0] == 7
+    assert pixel_x[0] == 255
+
+
+def test_tile_pixels_interior_point_unchanged():
+    lat, lng, zoom = 37.5665, 126.9780, 15
+    tile_x, tile_y, pixel_x, pixel_y = Coordinates.latlon_to_tile_pixels([lat], [lng], zoom)
+    assert (tile_x[0], tile_y[0]) == Coordinates.latlon_to_tile(lat, lng, zoom)
+    x, y = Coordinates.latlon_to_world([lat], [lng], zoom)
+    assert pixel_x[0] == int((x[0] - tile_x[0]) * 256)
+    assert pixel_y[0] == int((y[0] - tile_y[0]) * 256)
@@ -0,0 +1,69 @@
+import pytest
+
+from utils import geodesic
+
+
+def square(lng, lat, size=0.01):
+    return [[lng, lat], [lng + size, lat], [lng + size, lat + size], [lng, lat + size], [lng, lat]]
+
+
+def feature(kind, coordinates, properties=None):
+    return {'type': 'Feature', 'geometry': {'type': kind, 'coordinates': coordinates},
+            'properties': properties}
+
+
+def annotate(*features):
+    geojson = {'type': 'FeatureCollection', 'features': list(features)}
+    geodesic.annotate_measurements(geojson)
+    return [f['properties'] for f in geojson['features']]
+
+
+def test_polygon_areas_skips_empty_and_degenerate_rings():
+    triangle = ([37, 37, 38], [127, 128, 128])
+    expected = geodesic.polygon_area(*triangle)
+
+    for rings in ([triangle, ([], [])], [([], []), triangle], [triangle, ([37], [127]), triangle]):
+        areas = geodesic.polygon_areas(rings)
+        assert len(areas) == len(rings)
+        assert areas == pytest.approx([expected if ring is triangle else 0.0 for ring in rings])
+
+    assert geodesic.polygon_areas([([], [])]).tolist() == [0.0]
+
+
+def test_polygon_area_and_hole():
+    outer = square(126.97, 37.56)
+    hole = square(126.972, 37.562, 0.002)
+    solid, holed = annotate(feature('Polygon', [outer]), feature('Polygon', [outer, hole]))
+
+    assert solid['area_m2'] == pytest.approx(geodesic.polygon_area(
+        [c[1] for c in outer], [c[0] for c in outer]))
+    hole_area = geodesic.polygon_area([c[1] for c in hole], [c[0] for c in hole])
+    assert holed['area_m2'] == pytest.approx(solid['area_m2'] - hole_area)
+
+
+def test_multipolygon_area_is_sum_of_parts():
+    first = [square(126.97, 37.56)]
+    second = [square(129.07, 35.17), square(129.072, 35.172, 0.002)]
+    single_first, single_second, multi = annotate(
+        feature('Polygon', first), feature('Polygon', second),
+        feature('MultiPolygon', [first, second]))
+
+    assert multi['area_m2'] > 0
+    assert multi['area_m2'] == pytest.approx(single_first['area_m2'] + single_second['area_m2'])
+
+
+def test_multilinestring_length_is_sum_of_parts():
+    first = [[126.97, 37.56], [126.98, 37.57]]
+    second = [[129.07, 35.17], [129.08, 35.17], [129.08, 35.18]]
+    line_first, line_second, multi = annotate(
+        feature('LineString', first), feature('LineString', second),
+        feature('MultiLineString', [first, second], {'name': 'route'}))
+
+    assert multi['length_m'] > 0
+    assert multi['length_m'] == pytest.approx(line_first['length_m'] + line_second['length_m'])
+    assert multi['name'] == 'route'
+
+
+def test_other_geometries_are_left_alone():
+    point, = annotate(feature('Point', [126.97, 37.56]))
+    assert point == {}
@@ -0,0 +1,55 @@
+import json
+
+from api import kakao_parser
+from models.place import Place
+
+
+DOCUMENTS = [
+    {'id': '1', 'place_name': '강남역', 'address_name': '서울 강남구 역삼동 858',
+     'road_address_name': '서울 강남구 강남대로 396', 'category_name': '교통,수송 > 지하철역',
+     'phone': '02-1234-5678', 'place_url': 'http://place.map.kakao.com/1',
+     'x': '127.0276', 'y': '37.4979', 'distance': '120'},
+    # 기준 좌표 없이 검색하면 distance가 빈 문자열
+    {'id': '2', 'place_name': '역삼역', 'address_name': '서울 강남구 역삼동 804',
+     'road_address_name': '', 'category_name': '교통,수송 > 지하철역',
+     'phone': '', 'place_url': 'http://place.map.kakao.com/2',
+     'x': '127.0364', 'y': '37.5006', 'distance': ''},
+    # distance, 좌표, 선택 필드가 아예 없는 문서
+    {'id': '3', 'place_name': '이름만 있는 장소'},
+]
+
+
+def body(documents=DOCUMENTS):
+    return json.dumps({'documents': documents, 'meta': {'total_count': len(documents)}}).encode()
+
+
+def expected_places():
+    return [Place.from_kakao_response(doc) for doc in DOCUMENTS]
+
+
+def test_parse_places_matches_from_kakao_response():
+    places, meta = kakao_parser.parse_places(body())
+
+    assert places == expected_places()
+    assert places[1].distance is None and places[2].distance is None
+    assert (places[2].x, places[2].y) == (0.0, 0.0)
+    assert meta == {'total_count': 3}
+
+
+def test_parse_place_table_matches_from_kakao_response():
+    table, meta = kakao_parser.parse_place_table(body())
+
+    assert len(table) == 3
+    assert table.to_list() == expected_places()
+    assert table[1].distance is None
+    assert meta == {'total_count': 3}
+
+
+def test_parsers_accept_decoded_and_empty_bodies():
+    decoded = json.loads(body())
+    assert kakao_parser.parse_places(decoded)[0] == expected_places()
+    assert kakao_parser.parse_place_table(decoded)[0].to_list() == expected_places()
+
+    assert kakao_parser.parse_places(None) == ([], {})
+    table, meta = kakao_parser.parse_place_table(body([]))
+    assert len(table) == 0 and table.to_list() == [] and meta == {'total_count': 0}
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from utils import projection
+from utils.coordinates import Coordinates
+
+
+# 기준값은 PROJ(pyproj 3.x)로 계산한 값 (미터)
+REFERENCE_POINTS = [
+    (5179, 37.5665, 126.9780, 953901.165, 1952032.081),   # 서울시청
+    (5179, 35.1796, 129.0756, 1143467.380, 1688281.982),  # 부산
+    (5179, 33.4996, 126.5312, 910010.546, 1501279.789),   # 제주
+    (5181, 37.5665, 126.9780, 198056.367, 451885.031),
+    (5185, 35.1796, 129.0756, 571345.335, 294636.998),
+    (5186, 37.5665, 126.9780, 198056.367, 551885.031),
+    (5187, 33.4996, 126.5312, -29436.192, 103389.361),
+    (5188, 37.4844, 130.9057, 191659.745, 542776.905),    # 울릉도
+]
+
+
+@pytest.mark.parametrize('epsg, lat, lng, x, y', REFERENCE_POINTS)
+def test_forward_matches_proj(epsg, lat, lng, x, y):
+    tm_x, tm_y = Coordinates.wgs84_to_tm(lat, lng, epsg)
+    assert tm_x == pytest.approx(x, abs=1e-3)
+    assert tm_y == pytest.approx(y, abs=1e-3)
+
+
+@pytest.mark.parametrize('epsg, lat, lng, x, y', REFERENCE_POINTS)
+def test_inverse_matches_proj(epsg, lat, lng, x, y):
+    back_lat, back_lng = Coordinates.tm_to_wgs84(x, y, epsg)
+    assert back_lat == pytest.approx(lat, abs=1e-8)
+    assert back_lng == pytest.approx(lng, abs=1e-8)
+
+
+@pytest.mark.parametrize('epsg', sorted(projection.PROJECTIONS))
+def test_round_trip(epsg):
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(33.0, 38.6, 10000)
+    lngs = rng.uniform(124.5, 131.9, 10000)
+    back_lats, back_lngs = projection.tm_to_wgs84(*projection.wgs84_to_tm(lats, lngs, epsg), epsg)
+    assert np.abs(back_lats - lats).max() < 1e-10
+    assert np.abs(back_lngs - lngs).max() < 1e-10
+
+
+def test_offset_helpers_are_deprecated():
+    with pytest.deprecated_call():
+        Coordinates.wgs84_to_grs80(37.5665, 126.9780)
+    with pytest.deprecated_call():
+        Coordinates.grs80_to_wgs84(37.5665, 126.9780)
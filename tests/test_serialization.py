@@ -0,0 +1,140 @@
+import marshal
+import pickle
+import zlib
+from datetime import datetime
+
+import pytest
+
+from models.cctv import CCTV
+from models.place import Place
+from utils.serialization import CacheSerializer, SerializationError
+
+
+PLACES = [Place(id=str(i), name=f'장소 {i}', address='서울 강남구', road_address='', x=127.0 + i / 1000,
+                y=37.5, category='카페', phone='', url='', distance=None if i % 2 else float(i))
+          for i in range(50)]
+
+CCTVS = [CCTV(id=str(i), name=f'CCTV {i}', address='서울 중구', x=126.97, y=37.56 + i / 1000,
+              purpose='방범', institution='서울시', status='정상', installation_date='2020-01-01')
+         for i in range(50)]
+
+
+def header(data):
+    return CacheSerializer.HEADER.unpack_from(data)
+
+
+@pytest.mark.parametrize('codec', CacheSerializer.CODECS)
+@pytest.mark.parametrize('value', [
+    {'documents': [{'id': '1', 'x': '127.0'}], 'meta': {'total_count': 1}},
+    '<response><item/></response>',
+    [1, 2.5, None, True],
+    [],
+])
+def test_round_trip(codec, value):
+    serializer = CacheSerializer(codec)
+    assert serializer.loads(serializer.dumps(value)) == value
+
+
+def test_header_records_format_codec_and_runtime():
+    data = CacheSerializer('compact', compress_threshold=0).dumps({'a': 1})
+    magic, version, codec, flags, *runtime = header(data)
+
+    assert magic == CacheSerializer.MAGIC
+    assert version == CacheSerializer.FORMAT_VERSION
+    assert codec == CacheSerializer.CODEC_MARSHAL
+    assert flags == 0
+    assert tuple(runtime) == CacheSerializer.RUNTIME
+    assert marshal.loads(data[CacheSerializer.HEADER.size:]) == {'a': 1}
+
+
+def test_values_marshal_cannot_encode_fall_back_to_pickle():
+    serializer = CacheSerializer('compact')
+    value = {'when': datetime(2024, 1, 1)}
+
+    data = serializer.dumps(value)
+    assert header(data)[2] == CacheSerializer.CODEC_PICKLE
+    assert serializer.loads(data) == value
+
+
+@pytest.mark.parametrize('models', [PLACES, CCTVS])
+def test_model_lists_are_stored_by_column(models):
+    serializer = CacheSerializer('compact', compress_threshold=0)
+
+    data = serializer.dumps(models)
+    assert header(data)[3] & CacheSerializer.FLAG_COLUMNAR
+    restored = serializer.loads(data)
+    assert restored == models
+    assert all(type(item) is type(models[0]) for item in restored)
+    # 열 단위 형식이 pickle보다 작아야 함
+    assert len(data) < len(CacheSerializer('pickle', compress_threshold=0).dumps(models))
+
+
+def test_mixed_model_lists_are_not_columnar():
+    serializer = CacheSerializer('compact')
+    value = [PLACES[0], CCTVS[0]]
+
+    data = serializer.dumps(value)
+    assert not header(data)[3] & CacheSerializer.FLAG_COLUMNAR
+    assert serializer.loads(data) == value
+
+
+def test_compression_above_threshold_only():
+    serializer = CacheSerializer('compact', compress_threshold=1024)
+    large = {'text': '가' * 5000}
+    small = {'text': '가'}
+
+    large_data = serializer.dumps(large)
+    assert header(large_data)[3] & CacheSerializer.FLAG_ZLIB
+    assert len(large_data) < len(marshal.dumps(large))
+    assert serializer.loads(large_data) == large
+
+    assert not header(serializer.dumps(small))[3] & CacheSerializer.FLAG_ZLIB
+    assert not header(CacheSerializer(compress_threshold=0).dumps(large))[3] & CacheSerializer.FLAG_ZLIB
+
+
+def test_payloads_are_readable_by_either_codec_setting():
+    value = {'documents': []}
+    compact, legacy = CacheSerializer('compact'), CacheSerializer('pickle')
+
+    assert legacy.loads(compact.dumps(value)) == value
+    assert compact.loads(legacy.dumps(value)) == value
+
+
+def test_unknown_codec_setting_is_rejected():
+    with pytest.raises(ValueError):
+        CacheSerializer('json')
+
+
+def replace_byte(data, index, value):
+    return data[:index] + bytes([value]) + data[index + 1:]
+
+
+@pytest.mark.parametrize('make_bad', [
+    lambda data: b'',
+    lambda data: data[:3],
+    # 헤더가 없는 이전 형식 (pickle 직접 저장)
+    lambda data: pickle.dumps({'a': 1}),
+    lambda data: replace_byte(data, 2, CacheSerializer.FORMAT_VERSION + 1),
+    lambda data: replace_byte(data, 2, CacheSerializer.FORMAT_VERSION - 1),
+    lambda data: replace_byte(data, 3, 9),
+    # 다른 Python 부 버전 / marshal 버전에서 기록
+    lambda data: replace_byte(data, 6, (CacheSerializer.RUNTIME[1] + 1) % 256),
+    lambda data: replace_byte(data, 7, (CacheSerializer.RUNTIME[2] + 1) % 256),
+    lambda data: data[:CacheSerializer.HEADER.size] + b'\x00garbage',
+])
+def test_bad_payloads_raise_serialization_error(make_bad):
+    serializer = CacheSerializer('compact', compress_threshold=0)
+    data = serializer.dumps({'documents': [1, 2, 3]})
+
+    with pytest.raises(SerializationError):
+        serializer.loads(make_bad(data))
+
+
+def test_corrupt_compressed_body_raises_serialization_error():
+    serializer = CacheSerializer('compact', compress_threshold=16)
+    data = serializer.dumps({'text': 'a' * 1000})
+    assert header(data)[3] & CacheSerializer.FLAG_ZLIB
+
+    body = zlib.decompress(data[CacheSerializer.HEADER.size:])
+    with pytest.raises(SerializationError):
+        serializer.loads(data[:CacheSerializer.HEADER.size] + body[:-1])
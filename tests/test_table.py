@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from models.place import Place, PlaceTable
+from models.table import DictionaryColumn
+
+
+def place(id, category='카페', x=127.0, y=37.5, distance=None):
+    return Place(id=id, name=f'장소 {id}', address='주소', road_address='', x=x, y=y,
+                 category=category, phone='', url='', distance=distance)
+
+
+PLACES = [
+    place('1', '카페', 127.00, 37.50, 100.0),
+    place('2', '음식점', 127.01, 37.51),
+    place('3', '카페', 127.02, 37.52, 300.0),
+    place('4', '약국', 127.03, 37.53),
+]
+
+
+def test_dictionary_column_encode_and_decode():
+    column = DictionaryColumn.encode(['a', 'b', 'a', 'c', 'b'])
+
+    assert column.values == ['a', 'b', 'c']
+    assert column.codes.tolist() == [0, 1, 0, 2, 1]
+    assert column.decode() == ['a', 'b', 'a', 'c', 'b']
+    assert column.isin({'b', 'c'}).tolist() == [False, True, False, True, True]
+
+
+def test_dictionary_column_concat_remaps_codes():
+    first = DictionaryColumn.encode(['a', 'b', 'a'])
+    second = DictionaryColumn.encode(['c', 'b', 'c'])
+
+    merged = first.concat(second)
+    assert merged.values == ['a', 'b', 'c']
+    assert merged.codes.tolist() == [0, 1, 0, 2, 1, 2]
+    assert merged.decode() == ['a', 'b', 'a', 'c', 'b', 'c']
+
+    empty = DictionaryColumn(np.zeros(0, dtype=np.int32), [])
+    assert empty.concat(second).decode() == ['c', 'b', 'c']
+    assert second.concat(empty).decode() == ['c', 'b', 'c']
+
+
+def test_round_trip_restores_none_for_optional_columns():
+    table = PlaceTable.from_models(PLACES)
+
+    assert np.isnan(table.columns['distance'][1])
+    assert table.column('distance') == [100.0, None, 300.0, None]
+    assert table[1].distance is None
+    assert table.to_list() == PLACES
+
+
+def test_filter_and_take():
+    table = PlaceTable.from_models(PLACES)
+
+    cafes = table.filter_category('카페')
+    assert [p.id for p in cafes] == ['1', '3']
+    assert [p.id for p in table.filter(table.x > 127.015)] == ['3', '4']
+    assert [p.id for p in table[1:3]] == ['2', '3']
+    assert [p.id for p in table.take([3, 0])] == ['4', '1']
+    assert len(table.filter(np.zeros(len(table), dtype=bool))) == 0
+
+
+def test_concat_keeps_rows_and_dictionary_values():
+    first = PlaceTable.from_models(PLACES[:2])
+    second = PlaceTable.from_models([place('5', '약국'), place('6', '카페', distance=50.0)])
+
+    merged = PlaceTable.concat([first, second])
+    assert merged.to_list() == PLACES[:2] + [place('5', '약국'), place('6', '카페', distance=50.0)]
+    assert merged.columns['category'].values == ['카페', '음식점', '약국']
+    assert len(PlaceTable.concat([])) == 0
+
+
+def test_drop_duplicates_keeps_first_occurrence_in_order():
+    repeated = [place('2', '병원'), place('1', '병원')]
+    table = PlaceTable.concat([PlaceTable.from_models(PLACES), PlaceTable.from_models(repeated)])
+
+    unique = table.drop_duplicates()
+    assert [p.id for p in unique] == ['1', '2', '3', '4']
+    assert unique[1].category == '음식점'
+    assert [p.category for p in table.drop_duplicates('category')] == ['카페', '음식점', '약국', '병원']
+
+
+def test_rows_are_materialized_lazily_and_cached():
+    table = PlaceTable.from_models(PLACES)
+    assert table._objects == {}
+
+    first = table[2]
+    assert first == PLACES[2]
+    assert list(table._objects) == [2]
+    assert table[2] is first
+    assert table[-2] is first
+
+    with pytest.raises(IndexError):
+        table[len(table)]
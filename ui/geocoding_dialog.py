@@ -27,6 +27,8 @@ class GeocodingWorker(QThread):
             
             if result:
                 self.result_ready.emit(result)
+            elif self.api.transport.last_error is not None:
+                self.error_occurred.emit(f"요청 실패: {self.api.transport.last_error}")
             else:
                 self.error_occurred.emit("검색 결과가 없습니다.")
         except Exception as e:
@@ -11,10 +11,14 @@ from ui.geocoding_dialog import GeocodingDialog
 from api.kakao_local_api import KakaoLocalAPI
 from api.kakao_map_api import KakaoMapAPI
 from api.cctv_api import CCTVApi
+from api.transport import configure_shared_transport
+from api.rate_limiter import RateLimiter
+from api.resilience import RetryPolicy
+from api.response_cache import ResponseCache
 from utils.config import Config
 from utils.cache import Cache
 from models.place import Place
-from models.cctv import CCTV
+from models.cctv import CCTVTable
 
 from typing import List, Optional
 import logging
@@ -46,16 +50,22 @@ class SearchWorker(QThread):
                     self.query, self.x, self.y, page=self.page
                 )
             
+            # 결과가 비어 있어도 요청 실패였다면 "결과 없음" 대신 오류로 보고
+            error = self.local_api.transport.last_error
+            if not places and error is not None:
+                self.search_failed.emit(str(error))
+                return
+            
             self.search_completed.emit(places)
         except Exception as e:
             self.search_failed.emit(str(e))
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, cache: Optional[Cache] = None):
         super().__init__()
         self.config = config
-        self.cache = Cache()
+        self.cache = cache or Cache()
         self.current_search_page = 1
         self.current_query = ""
         self.current_category = ""
@@ -68,9 +78,27 @@ class MainWindow(QMainWindow):
             self.show_api_key_warning()
             return
         
-        self.local_api = KakaoLocalAPI(api_key)
-        self.map_api = KakaoMapAPI(api_key)
-        self.cctv_api = CCTVApi()
+        # 모든 API 클라이언트가 공유하는 연결 풀
+        retry_settings = self.config.get_retry_settings()
+        self.transport = configure_shared_transport(
+            rate_limiter=RateLimiter(self.config.get_rate_limit_settings()),
+            retry_policy=RetryPolicy(
+                retry_settings['max_retries'],
+                retry_settings['backoff_base'],
+                retry_settings['backoff_max']
+            ),
+            failure_threshold=retry_settings['failure_threshold'],
+            reset_timeout=retry_settings['reset_timeout'],
+            **self.config.get_http_settings()
+        )
+        
+        # 반복 검색/지오코딩은 로컬 캐시에서 응답
+        self.response_cache = ResponseCache(self.cache, self.config.get_cache_ttls(),
+                                            **self.config.get_response_cache_settings())
+        
+        self.local_api = KakaoLocalAPI(api_key, self.transport, self.response_cache)
+        self.map_api = KakaoMapAPI(api_key, self.transport, self.response_cache)
+        self.cctv_api = CCTVApi(transport=self.transport, response_cache=self.response_cache)
         
         self.search_worker = None
         
@@ -321,6 +349,7 @@ class MainWindow(QMainWindow):
         self.map_widget.location_clicked.connect(self.on_location_clicked)
         self.map_widget.marker_clicked.connect(self.on_marker_clicked)
         self.map_widget.roadview_clicked.connect(self.open_roadview_popup)
+        self.map_widget.measurement_completed.connect(self.on_measurement_completed)
         
         # 로드뷰 위젯 연결
         self.roadview_widget.roadview_closed.connect(self.on_roadview_closed)
@@ -421,6 +450,16 @@ class MainWindow(QMainWindow):
         if not self.roadview_action.isChecked():
             self.roadview_action.setChecked(True)
     
+    @pyqtSlot(str, float)
+    def on_measurement_completed(self, kind: str, value: float):
+        """측지 측정 결과를 상태 표시줄에 표시"""
+        if kind in ('area', 'drawing_area'):
+            text = f"{value / 1000000:.3f}km²" if value >= 1000000 else f"{value:.1f}m²"
+            self.status_label.setText(f"면적: {text}")
+        else:
+            text = f"{value / 1000:.2f}km" if value >= 1000 else f"{value:.1f}m"
+            self.status_label.setText(f"거리: {text}")
+    
     @pyqtSlot(str)
     def on_marker_clicked(self, marker_id: str):
         """마커 클릭 처리"""
@@ -492,9 +531,15 @@ class MainWindow(QMainWindow):
         
         try:
             # 주변 CCTV 검색 (1km 반경)
-            cctvs = self.cctv_api.get_cctv_list(center['lng'], center['lat'], 1.0)
+            cctvs = CCTVTable.from_models(
+                self.cctv_api.get_cctv_list(center['lng'], center['lat'], 1.0)
+            )
             
-            for cctv in cctvs:
+            # 이미 지도에 있는 CCTV 마커는 다시 추가하지 않음
+            shown = {marker_id[len("cctv_"):] for marker_id in self.map_widget.markers
+                     if marker_id.startswith("cctv_")}
+            new_cctvs = cctvs.filter(~cctvs.columns['id'].isin(shown))
+            for cctv in new_cctvs:
                 marker_id = f"cctv_{cctv.id}"
                 self.map_widget.add_marker(
                     marker_id, cctv.y, cctv.x,
@@ -502,7 +547,11 @@ class MainWindow(QMainWindow):
                     f"📹 {cctv.purpose} CCTV\n{cctv.address}"
                 )
             
-            self.status_label.setText(f"CCTV {len(cctvs)}개 표시")
+            skipped = len(cctvs) - len(new_cctvs)
+            if skipped:
+                self.status_label.setText(f"CCTV {len(new_cctvs)}개 추가 표시 (이미 표시된 {skipped}개 제외)")
+            else:
+                self.status_label.setText(f"CCTV {len(new_cctvs)}개 표시")
         except Exception as e:
             self.status_label.setText(f"CCTV 로드 실패: {str(e)}")
     
@@ -553,8 +602,12 @@ class MainWindow(QMainWindow):
     
     def clear_cache(self):
         """캐시 정리"""
+        stats = self.response_cache.get_stats()
         self.cache.clear()
-        self.status_label.setText("캐시가 정리되었습니다")
+        self.status_label.setText(
+            f"캐시가 정리되었습니다 (히트 {stats['hits']}회, 미스 {stats['misses']}회, "
+            f"적중률 {stats['hit_rate']:.0%})"
+        )
     
     def show_about(self):
         """정보 대화상자"""
@@ -691,4 +744,16 @@ class MainWindow(QMainWindow):
             self.search_worker.quit()
             self.search_worker.wait()
         
+        # 응답 캐시 통계 기록
+        if hasattr(self, 'response_cache'):
+            logging.info(f"API 응답 캐시 통계: {self.response_cache.get_stats()}")
+            logging.info(f"캐시 계층별 통계: {self.cache.get_tier_stats()}")
+            self.response_cache.close()
+        
+        # 공유 연결 풀 종료
+        if hasattr(self, 'transport'):
+            if self.transport.rate_limiter:
+                logging.info(f"API 쿼터 사용 현황: {self.transport.rate_limiter.get_quota_status()}")
+            self.transport.close()
+        
         event.accept()
\ No newline at end of file
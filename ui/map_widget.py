@@ -6,11 +6,19 @@ from PyQt6.QtGui import QIcon
 from typing import Dict, Any
 import json
 
+from utils import geodesic
+from utils.simplify import LODLayer
+
 
 class MapWidget(QWidget):
     location_clicked = pyqtSignal(float, float)
     marker_clicked = pyqtSignal(str)
     roadview_clicked = pyqtSignal(float, float)
+    measurement_completed = pyqtSignal(str, float)  # 종류, 측지 길이(m) 또는 면적(m²)
+    
+    # Shapefile 레이어 단순화 (레벨별 허용 오차 = 픽셀 수 × 픽셀당 미터)
+    SIMPLIFY_METHOD = 'douglas_peucker'
+    SIMPLIFY_PIXEL_TOLERANCE = 1.0
     
     def __init__(self, api_key: str):
         super().__init__()
@@ -23,7 +31,7 @@ class MapWidget(QWidget):
         self.roadview_mode = False
         self.shapefile_layers = []
         self.callback_timer = None
-        self.last_callback_timestamps = {'mapClick': 0, 'roadviewClick': 0}
+        self.last_callback_timestamps = {'mapClick': 0, 'roadviewClick': 0, 'zoomChange': 0}
         self.init_ui()
     
     def init_ui(self):
@@ -389,6 +397,7 @@ class MapWidget(QWidget):
                                     
                                     var distance = Math.round(clickLine.getLength());
                                     displayCircleDot(clickPosition, distance);
+                                    notifyMeasurement('distance', path);
                                 }}
                                 return;
                             }}
@@ -443,6 +452,7 @@ class MapWidget(QWidget):
                                     if (path.length >= 3) {{
                                         var area = getPolygonArea(areaPolygon);
                                         displayAreaInfo(area, clickPosition);
+                                        notifyMeasurement('area', path);
                                     }}
                                 }}
                                 return;
@@ -826,34 +836,55 @@ class MapWidget(QWidget):
                             return kakao.maps.LatLng.distance(latlng1, latlng2);
                         }}
                         
-                        // 다각형 면적 계산 (정확한 계산)
+                        // 다각형 면적 미리보기 (구면 초과각)
+                        // 확정 값은 Python(utils/geodesic)의 타원체 계산으로 다시 표시됨
                         function getPolygonArea(polygon) {{
-                            var area = 0;
                             var points = polygon.getPath();
                             
                             if (points.length < 3) {{
                                 return 0;
                             }}
                             
-                            // Shoelace formula 사용
+                            var EARTH_RADIUS = 6371008.8;
+                            var toRad = Math.PI / 180;
+                            var excess = 0;
                             for (var i = 0; i < points.length; i++) {{
                                 var j = (i + 1) % points.length;
-                                var xi = points[i].getLng();
-                                var yi = points[i].getLat();
-                                var xj = points[j].getLng();
-                                var yj = points[j].getLat();
-                                
-                                area += xi * yj;
-                                area -= xj * yi;
+                                var t1 = Math.tan(points[i].getLat() * toRad / 2);
+                                var t2 = Math.tan(points[j].getLat() * toRad / 2);
+                                var dlng = (points[j].getLng() - points[i].getLng()) * toRad;
+                                excess += 2 * Math.atan2(Math.tan(dlng / 2) * (t1 + t2), 1 + t1 * t2);
                             }}
                             
-                            area = Math.abs(area) / 2.0;
-                            
-                            // 위도/경도를 미터로 변환 (대략적)
-                            var metersPerDegree = 111000;
-                            return area * Math.pow(metersPerDegree, 2);
+                            return Math.abs(excess) * EARTH_RADIUS * EARTH_RADIUS;
+                        }}
+                        
+                        // 측정 경로를 Python에 전달 (측지 길이/면적 계산용)
+                        function notifyMeasurement(kind, path) {{
+                            if (!window.pythonCallbacks) {{
+                                return;
+                            }}
+                            var coords = path.map(function(p) {{
+                                return [p.getLat(), p.getLng()];
+                            }});
+                            window.pythonCallbacks.measurements.push({{kind: kind, path: coords}});
                         }}
                         
+                        // Python에서 계산한 측지 면적 표시
+                        window.showMeasuredArea = function(area, lat, lng) {{
+                            if (areaMeasureMode && areaPolygon) {{
+                                displayAreaInfo(area, new kakao.maps.LatLng(lat, lng));
+                            }}
+                        }};
+                        
+                        // Python에서 계산한 측지 거리로 지점 라벨 갱신
+                        window.updateDistanceDot = function(index, distance) {{
+                            var dot = distanceCircleDots[index];
+                            if (dot && dot.distance) {{
+                                dot.distance.setContent('<div class="dotOverlay">거리 <span class="number">' + distance + '</span>m</div>');
+                            }}
+                        }};
+                        
                         // 측정 결과 모두 지우기 기능
                         window.clearAllMeasurements = function() {{
                             // 거리 측정 정리
@@ -1059,6 +1090,24 @@ class MapWidget(QWidget):
                                 kakao.maps.Drawing.event.addListener(drawingManager, 'drawend', function(e) {{
                                     drawnOverlays.push(e.overlay);
                                     console.log('그리기 완료:', e.overlayType);
+                                    
+                                    // 선/사각형/다각형은 Python에서 측지 길이와 면적 계산
+                                    var OverlayType = kakao.maps.Drawing.OverlayType;
+                                    if (e.overlayType === OverlayType.POLYLINE) {{
+                                        notifyMeasurement('drawing_length', e.overlay.getPath());
+                                    }} else if (e.overlayType === OverlayType.POLYGON) {{
+                                        notifyMeasurement('drawing_area', e.overlay.getPath());
+                                    }} else if (e.overlayType === OverlayType.RECTANGLE) {{
+                                        var bounds = e.overlay.getBounds();
+                                        var sw = bounds.getSouthWest();
+                                        var ne = bounds.getNorthEast();
+                                        notifyMeasurement('drawing_area', [
+                                            sw,
+                                            new kakao.maps.LatLng(sw.getLat(), ne.getLng()),
+                                            ne,
+                                            new kakao.maps.LatLng(ne.getLat(), sw.getLng())
+                                        ]);
+                                    }}
                                 }});
                                 
                                 console.log("드로잉 매니저 초기화 완료");
@@ -1165,7 +1214,7 @@ class MapWidget(QWidget):
                                         // 폴리곤 클릭 이벤트
                                         kakao.maps.event.addListener(polygon, 'click', function() {{
                                             var info = feature.properties.name || 'Shapefile Feature';
-                                            console.log('Shapefile polygon clicked:', info);
+                                            console.log('Shapefile polygon clicked:', info, feature.properties.area_m2);
                                         }});
                                     }}
                                 }});
@@ -1178,6 +1227,12 @@ class MapWidget(QWidget):
                             }}
                         }};
                         
+                        // 레벨이 바뀌면 해당 레벨의 단순화 결과로 교체
+                        window.setShapefileLayerData = function(layerId, geojsonData) {{
+                            window.removeShapefileLayer(layerId);
+                            window.addShapefileLayer(layerId, geojsonData);
+                        }};
+                        
                         window.removeShapefileLayer = function(layerId) {{
                             if (shapefileLayers[layerId]) {{
                                 shapefileLayers[layerId].forEach(function(polygon) {{
@@ -1227,7 +1282,9 @@ class MapWidget(QWidget):
         script_content = """
             window.pythonCallbacks = {
                 mapClick: null,
-                roadviewClick: null
+                roadviewClick: null,
+                zoomChange: null,
+                measurements: []
             };
             
             window.mapClicked = function(lat, lng) {
@@ -1239,6 +1296,10 @@ class MapWidget(QWidget):
                 console.log('Roadview clicked:', lat, lng);
                 window.pythonCallbacks.roadviewClick = {lat: lat, lng: lng, timestamp: Date.now()};
             };
+            
+            window.zoomChanged = function(level) {
+                window.pythonCallbacks.zoomChange = {level: level, timestamp: Date.now()};
+            };
         """
         
         self.web_view.page().runJavaScript(script_content)
@@ -1261,6 +1322,14 @@ class MapWidget(QWidget):
                 result.roadviewClick = window.pythonCallbacks.roadviewClick;
                 window.pythonCallbacks.roadviewClick = null;  // 처리 후 초기화
             }
+            if (window.pythonCallbacks.zoomChange) {
+                result.zoomChange = window.pythonCallbacks.zoomChange;
+                window.pythonCallbacks.zoomChange = null;  // 처리 후 초기화
+            }
+            if (window.pythonCallbacks.measurements.length) {
+                result.measurements = window.pythonCallbacks.measurements;
+                window.pythonCallbacks.measurements = [];  // 처리 후 초기화
+            }
             return JSON.stringify(result);
         })();
         """
@@ -1289,10 +1358,47 @@ class MapWidget(QWidget):
                     if timestamp > self.last_callback_timestamps['roadviewClick']:
                         self.last_callback_timestamps['roadviewClick'] = timestamp
                         self.roadview_clicked.emit(data['lat'], data['lng'])
+                
+                # 줌 레벨 변경 처리
+                if 'zoomChange' in result and result['zoomChange']:
+                    data = result['zoomChange']
+                    timestamp = data.get('timestamp', 0)
+                    if timestamp > self.last_callback_timestamps['zoomChange']:
+                        self.last_callback_timestamps['zoomChange'] = timestamp
+                        self.current_zoom = data['level']
+                        self._update_shapefile_lods()
+                
+                # 측정/그리기 경로 처리
+                for data in result.get('measurements', []):
+                    self._handle_measurement(data)
         
         except Exception as e:
             print(f"JavaScript 콜백 처리 오류: {e}")
     
+    def _handle_measurement(self, data: Dict[str, Any]):
+        """측정 경로의 측지 길이/면적을 계산해 지도에 반영"""
+        kind = data.get('kind')
+        path = data.get('path') or []
+        if not path:
+            return
+        
+        lats = [p[0] for p in path]
+        lngs = [p[1] for p in path]
+        
+        if kind in ('area', 'drawing_area'):
+            value = geodesic.polygon_area(lats, lngs)
+        else:
+            value = geodesic.polyline_length(lats, lngs)
+        
+        if kind == 'area':
+            script = f"showMeasuredArea({value}, {lats[-1]}, {lngs[-1]});"
+            self.web_view.page().runJavaScript(script)
+        elif kind == 'distance':
+            script = f"updateDistanceDot({len(path) - 1}, {round(value)});"
+            self.web_view.page().runJavaScript(script)
+        
+        self.measurement_completed.emit(kind, value)
+    
     def add_marker(self, marker_id: str, lat: float, lng: float, title: str = "", info: str = ""):
         """마커 추가"""
         self.markers[marker_id] = {'lat': lat, 'lng': lng, 'title': title, 'info': info}
@@ -1481,7 +1587,12 @@ class MapWidget(QWidget):
                 ]
             }
             
-            geojson_str = json.dumps(sample_geojson)
+            geodesic.annotate_measurements(sample_geojson)
+            
+            # 레벨별 단순화 결과를 미리 만들어 두고 현재 레벨 것만 전송
+            lod = LODLayer(sample_geojson, self.SIMPLIFY_METHOD, self.SIMPLIFY_PIXEL_TOLERANCE)
+            geojson = lod.for_level(self.current_zoom)
+            geojson_str = json.dumps(geojson)
             layer_id = f"shp_layer_{len(self.shapefile_layers)}"
             
             # JavaScript로 GeoJSON 데이터 전송
@@ -1490,7 +1601,7 @@ class MapWidget(QWidget):
             """
             
             self.web_view.page().runJavaScript(script)
-            self.shapefile_layers.append({"id": layer_id, "path": file_path})
+            self.shapefile_layers.append({"id": layer_id, "path": file_path, "lod": lod, "shown": geojson})
             
             print(f"Shapefile 로드됨: {file_path}")
             
@@ -1498,6 +1609,17 @@ class MapWidget(QWidget):
             print(f"Shapefile 로드 실패: {e}")
             raise e
     
+    def _update_shapefile_lods(self):
+        """현재 지도 레벨에 맞는 단순화 결과로 Shapefile 레이어 교체"""
+        for layer in self.shapefile_layers:
+            geojson = layer['lod'].for_level(self.current_zoom)
+            # 인접 레벨의 결과가 같으면 같은 객체이므로 다시 보내지 않음
+            if geojson is layer['shown']:
+                continue
+            script = f"setShapefileLayerData('{layer['id']}', {json.dumps(geojson)});"
+            self.web_view.page().runJavaScript(script)
+            layer['shown'] = geojson
+    
     def clear_shapefile_layers(self):
         """모든 Shapefile 레이어 제거"""
         for layer in self.shapefile_layers:
@@ -3,8 +3,8 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
                              QListWidgetItem, QFrame, QScrollArea)
 from PyQt6.QtCore import pyqtSignal, Qt, QThread, pyqtSlot
 from PyQt6.QtGui import QFont
-from typing import List, Optional
-from models.place import Place
+from typing import List, Optional, Union
+from models.place import Place, PlaceTable
 
 
 class SearchResultItem(QWidget):
@@ -66,7 +66,7 @@ class SearchWidget(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.current_places = []
+        self.current_places = PlaceTable()
         self.init_ui()
     
     def init_ui(self):
@@ -174,13 +174,14 @@ class SearchWidget(QWidget):
         if category_code:
             self.category_selected.emit(category_code, category_name)
     
-    def update_results(self, places: List[Place], append: bool = False):
+    def update_results(self, places: Union[PlaceTable, List[Place]], append: bool = False):
         """검색 결과 업데이트"""
+        places = PlaceTable.from_models(places)
         if not append:
             self.clear_results()
-            self.current_places = places.copy()
+            self.current_places = places
         else:
-            self.current_places.extend(places)
+            self.current_places = PlaceTable.concat([self.current_places, places])
         
         # 결과 개수 업데이트
         count = len(self.current_places)
@@ -214,7 +215,7 @@ class SearchWidget(QWidget):
             if child.widget():
                 child.widget().deleteLater()
         
-        self.current_places.clear()
+        self.current_places = PlaceTable()
         self.load_more_btn.hide()
     
     def on_place_clicked(self, place: Place):
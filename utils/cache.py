@@ -1,134 +1,1118 @@
 import os
-import pickle
+import sqlite3
+import struct
+import threading
 import time
 import hashlib
-import shutil
-from typing import Any, Optional
+import heapq
+import marshal
+import sys
+import tempfile
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from utils.file_lock import FileLock
+from utils.serialization import CacheSerializer, SerializationError
 
-class Cache:
-    def __init__(self, cache_dir="cache", default_ttl=3600):
+
+def hash_key(key: str) -> str:
+    """캐시 키의 저장소 해시 (파일 이름, DB 기본 키, 메모리 계층 키로 사용)"""
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+class AccessIndex:
+    """저장소 항목의 크기와 접근 기록 (LRU/LFU 제거 대상 선정용)"""
+
+    POLICIES = ('lru', 'lfu')
+
+    def __init__(self, policy: str = 'lru'):
+        if policy not in self.POLICIES:
+            raise ValueError(f"지원하지 않는 제거 정책: {policy}")
+        self.policy = policy
+        self.total_bytes = 0
+        # key_hash -> [size, hits, seq], 순서는 최근 사용 순 (앞쪽이 가장 오래됨)
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._heap = []
+        self._seq = 0
+
+    def _push(self, key_hash: str, entry: list):
+        self._seq += 1
+        entry[2] = self._seq
+        if self.policy == 'lfu':
+            heapq.heappush(self._heap, (entry[1], entry[2], key_hash))
+            # 지연 삭제로 쌓인 낡은 항목이 많아지면 힙 재구성
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._heap = [(e[1], e[2], k) for k, e in self._entries.items()]
+                heapq.heapify(self._heap)
+
+    def add(self, key_hash: str, size: int, hits: int = 0):
+        """항목 추가 또는 크기 갱신"""
+        self.remove(key_hash)
+        entry = [size, hits, 0]
+        self._entries[key_hash] = entry
+        self.total_bytes += size
+        self._push(key_hash, entry)
+
+    def touch(self, key_hash: str):
+        """접근 기록 갱신"""
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return
+        entry[1] += 1
+        self._entries.move_to_end(key_hash)
+        self._push(key_hash, entry)
+
+    def get_hits(self, key_hash: str) -> int:
+        """항목의 접근 횟수 (없으면 0)"""
+        entry = self._entries.get(key_hash)
+        return entry[1] if entry is not None else 0
+
+    def remove(self, key_hash: str) -> Optional[int]:
+        """항목 제거 (제거된 항목의 크기 반환)"""
+        entry = self._entries.pop(key_hash, None)
+        if entry is None:
+            return None
+        self.total_bytes -= entry[0]
+        return entry[0]
+
+    def pop_victim(self, exclude: Optional[str] = None) -> Optional[str]:
+        """정책에 따라 제거할 항목을 골라 인덱스에서 제거"""
+        if self.policy == 'lru':
+            for key_hash in self._entries:
+                if key_hash != exclude:
+                    self.remove(key_hash)
+                    return key_hash
+            return None
+
+        skipped = []
+        victim = None
+        while self._heap:
+            hits, seq, key_hash = heapq.heappop(self._heap)
+            entry = self._entries.get(key_hash)
+            if entry is None or entry[1] != hits or entry[2] != seq:
+                continue
+            if key_hash == exclude:
+                skipped.append((hits, seq, key_hash))
+                continue
+            victim = key_hash
+            break
+        for item in skipped:
+            heapq.heappush(self._heap, item)
+
+        if victim is not None:
+            self.remove(victim)
+        return victim
+
+    def clear(self):
+        self._entries.clear()
+        self._heap = []
+        self.total_bytes = 0
+
+    def keys(self) -> List[str]:
+        """현재 항목 키 목록 (최근 사용 순)"""
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key_hash: str) -> bool:
+        return key_hash in self._entries
+
+
+class FileCacheBackend:
+    """키마다 파일 하나를 쓰는 저장소 (만료 시각/체크섬 헤더 + 직렬화된 값)"""
+
+    MAGIC = b'KMF2'
+    # magic, expires_at, created_at, fresh_until, 페이로드 길이, 페이로드 CRC32
+    RECORD_HEADER = struct.Struct('<4sdddII')
+
+    # 여러 프로세스가 같은 cache_dir을 공유할 때 쓰는 잠금 파일
+    LOCK_FILENAME = ".lock"
+    TEMP_SUFFIX = ".tmp"
+    # 이보다 오래된 임시 파일은 중단된 쓰기로 보고 삭제
+    STALE_TEMP_AGE = 3600
+
+    # 만료 시각 사이드카 (시작 시 파일을 열지 않고 만료 여부 판단)
+    MANIFEST_FILENAME = "expiry.manifest"
+    MANIFEST_VERSION = 1
+
+    # 이 횟수만큼 쓸 때마다 디렉토리를 다시 읽어 다른 프로세스가 쓴 항목까지 한도에 반영
+    # (항목 수 한도가 있으면 한도의 1/8마다 읽어 초과분을 프로세스당 그 정도로 제한)
+    RESCAN_WRITES = 256
+    MIN_RESCAN_WRITES = 16
+
+    def __init__(self, cache_dir: str, max_bytes: int = 0, max_entries: int = 0,
+                 eviction_policy: str = 'lru', serializer: Optional[CacheSerializer] = None):
         self.cache_dir = cache_dir
-        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.serializer = serializer or CacheSerializer()
         self.ensure_cache_dir()
-    
+
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(os.path.join(cache_dir, self.LOCK_FILENAME))
+        self._index = AccessIndex(eviction_policy)
+        # key_hash -> expires_at (헤더나 매니페스트로 알게 된 항목만)
+        self._expiry: Dict[str, float] = {}
+        self._cleanup_queue: List[str] = []
+        self._writes_since_scan = 0
+        self._rescan_writes = self.RESCAN_WRITES
+        if max_entries:
+            self._rescan_writes = min(self.RESCAN_WRITES, max(self.MIN_RESCAN_WRITES, max_entries // 8))
+        # 제거/삭제된 항목의 key_hash 목록을 받는 콜백 (메모리 계층 동기화용)
+        self.on_evict: Optional[Callable[[List[str]], None]] = None
+        self._load_index()
+        self._load_manifest()
+
     def ensure_cache_dir(self):
         """캐시 디렉토리 생성"""
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
-    
+
+    def _scan_directory(self) -> List[Tuple[float, str, int]]:
+        """레코드 파일의 (수정 시각, key_hash, 크기) 목록 (오래된 임시 파일은 삭제)"""
+        entries = []
+        now = time.time()
+        for entry in os.scandir(self.cache_dir):
+            try:
+                if entry.name.endswith('.cache'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-len('.cache')], stat.st_size))
+                elif entry.name.endswith(self.TEMP_SUFFIX):
+                    if now - entry.stat().st_mtime > self.STALE_TEMP_AGE:
+                        os.remove(entry.path)
+            except OSError:
+                # 다른 프로세스가 그 사이에 지운 파일
+                pass
+        # 읽을 때마다 수정 시각을 갱신하므로 mtime 순서가 곧 최근 사용 순서
+        entries.sort()
+        return entries
+
+    def _load_index(self):
+        """파일 크기와 수정 시각으로 접근 인덱스 구성 (페이로드는 읽지 않음)"""
+        for _, key_hash, size in self._scan_directory():
+            self._index.add(key_hash, size)
+
+    def _rescan(self) -> List[str]:
+        """디렉토리 기준으로 인덱스를 다시 구성하고 사라진 key_hash 반환 (배타 잠금 하에서 호출)
+
+        다른 프로세스가 쓴 파일까지 합산해야 공유 cache_dir 전체가 한도를 지킴
+        """
+        entries = self._scan_directory()
+        with self._lock:
+            old = self._index
+            self._index = AccessIndex(old.policy)
+            for _, key_hash, size in entries:
+                self._index.add(key_hash, size, old.get_hits(key_hash))
+            vanished = [key_hash for key_hash in old.keys() if key_hash not in self._index]
+            for key_hash in vanished:
+                self._expiry.pop(key_hash, None)
+            self._writes_since_scan = 0
+        return vanished
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.cache_dir, self.MANIFEST_FILENAME)
+
+    def _load_manifest(self):
+        """저장된 만료 시각 매니페스트 로드 (없거나 손상되면 무시)"""
+        try:
+            with open(self._manifest_path(), 'rb') as f:
+                manifest = marshal.load(f)
+            if manifest.get('version') != self.MANIFEST_VERSION:
+                return
+            self._expiry = {key_hash: expires_at for key_hash, expires_at in manifest['expiry'].items()
+                            if key_hash in self._index}
+        except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError):
+            self._expiry = {}
+
+    def _save_manifest(self):
+        """만료 시각 매니페스트 저장"""
+        with self._lock:
+            manifest = {'version': self.MANIFEST_VERSION, 'expiry': dict(self._expiry)}
+        try:
+            with self._file_lock.shared():
+                self._atomic_write(self._manifest_path(), marshal.dumps(manifest))
+        except OSError as e:
+            print(f"캐시 매니페스트 저장 실패: {e}")
+
+    def _atomic_write(self, path: str, data: bytes):
+        """임시 파일에 쓴 뒤 이름을 바꿔 읽는 쪽이 항상 완전한 파일만 보도록 저장"""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.', suffix=self.TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        return hash_key(key)
+
     def _get_cache_path(self, key: str) -> str:
         """캐시 키로부터 파일 경로 생성"""
-        key_hash = hashlib.md5(key.encode()).hexdigest()
+        return self._get_path_for_hash(self._hash_key(key))
+
+    def _get_path_for_hash(self, key_hash: str) -> str:
         return os.path.join(self.cache_dir, f"{key_hash}.cache")
-    
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
-        """캐시에 데이터 저장"""
+
+    def read(self, key: str) -> Optional[dict]:
+        """저장된 레코드 조회 (없거나 손상된 파일이면 None)"""
+        key_hash = self._hash_key(key)
+        cache_path = self._get_path_for_hash(key_hash)
+
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        record = self._unpack_record(data)
+        if record is None:
+            return None
+
+        # 접근 기록은 파일 시각과 메모리 인덱스에만 남기고 페이로드는 다시 쓰지 않음
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        with self._lock:
+            self._index.touch(key_hash)
+            self._expiry[key_hash] = record['expires_at']
+        record['size'] = len(data)
+        return record
+
+    def write(self, key: str, record: dict) -> int:
+        """레코드 저장 후 용량 한도를 넘으면 일부 항목 제거 (저장된 크기 반환)"""
+        key_hash = self._hash_key(key)
+        cache_path = self._get_path_for_hash(key_hash)
+        data = self._pack_record(record)
+
+        # 다른 프로세스의 정리 작업과 겹치지 않도록 공유 잠금 하에서 교체
+        with self._file_lock.shared():
+            self._atomic_write(cache_path, data)
+
+        with self._lock:
+            self._index.add(key_hash, len(data))
+            self._expiry[key_hash] = record['expires_at']
+            self._writes_since_scan += 1
+            rescan = self._writes_since_scan >= self._rescan_writes
+            if not rescan:
+                victims = self._evict(exclude=key_hash)
+
+        if not rescan:
+            self._remove_files(victims)
+            return len(data)
+
+        # 이 프로세스의 집계는 다른 프로세스의 쓰기를 모르므로 주기적으로 디렉토리를 다시 읽어 제거
+        self.enforce_limits(exclude=key_hash)
+        return len(data)
+
+    def enforce_limits(self, exclude: Optional[str] = None):
+        """디렉토리 전체(다른 프로세스가 쓴 항목 포함)를 다시 집계해 한도를 넘은 만큼 제거"""
+        if not (self.max_bytes or self.max_entries):
+            return
+        with self._file_lock.exclusive():
+            removed = self._rescan()
+            with self._lock:
+                victims = self._evict(exclude=exclude)
+            self._unlink(victims)
+        self._notify_evicted(removed + victims)
+
+    def _pack_record(self, record: dict) -> bytes:
+        payload = self.serializer.dumps(record['value'])
+        header = self.RECORD_HEADER.pack(
+            self.MAGIC, record['expires_at'], record['created_at'],
+            record.get('fresh_until', record['expires_at']),
+            len(payload), zlib.crc32(payload)
+        )
+        return header + payload
+
+    def _unpack_record(self, data: bytes) -> Optional[dict]:
+        """헤더와 체크섬을 확인해 레코드 복원 (이전 형식이거나 잘린 파일이면 None)"""
+        if len(data) < self.RECORD_HEADER.size:
+            return None
+        magic, expires_at, created_at, fresh_until, length, checksum = \
+            self.RECORD_HEADER.unpack_from(data)
+        payload = data[self.RECORD_HEADER.size:]
+        if magic != self.MAGIC or len(payload) != length or zlib.crc32(payload) != checksum:
+            return None
+        try:
+            value = self.serializer.loads(payload)
+        except SerializationError:
+            # 다른 형식/Python 버전에서 기록된 페이로드는 미스로 처리하고 다음 저장 때 덮어씀
+            return None
+        return {
+            'value': value,
+            'expires_at': expires_at,
+            'created_at': created_at,
+            'fresh_until': fresh_until
+        }
+
+    def _over_budget(self) -> bool:
+        return bool((self.max_bytes and self._index.total_bytes > self.max_bytes) or
+                    (self.max_entries and len(self._index) > self.max_entries))
+
+    def _evict(self, exclude: Optional[str] = None) -> List[str]:
+        """한도를 넘은 만큼 제거 대상을 인덱스에서 빼서 반환 (lock 보유 상태에서 호출)"""
+        victims = []
+        while self._over_budget():
+            victim = self._index.pop_victim(exclude)
+            if victim is None:
+                break
+            self._expiry.pop(victim, None)
+            victims.append(victim)
+        return victims
+
+    def _remove_files(self, key_hashes: List[str]):
+        """레코드 파일 삭제 (배타 잠금 하에서)"""
+        if not key_hashes:
+            return
+        with self._file_lock.exclusive():
+            self._unlink(key_hashes)
+        self._notify_evicted(key_hashes)
+
+    def _unlink(self, key_hashes: List[str]):
+        for key_hash in key_hashes:
+            try:
+                os.remove(self._get_path_for_hash(key_hash))
+            except FileNotFoundError:
+                pass
+
+    def _notify_evicted(self, key_hashes: List[str]):
+        if key_hashes and self.on_evict is not None:
+            self.on_evict(key_hashes)
+
+    def delete(self, key: str):
+        """레코드 삭제"""
+        key_hash = self._hash_key(key)
+        with self._lock:
+            self._index.remove(key_hash)
+            self._expiry.pop(key_hash, None)
+        self._remove_files([key_hash])
+
+    def clear(self):
+        """모든 레코드 삭제 (잠금 파일은 다른 프로세스가 쓰고 있을 수 있으므로 유지)"""
+        with self._lock:
+            self._index.clear()
+            self._expiry.clear()
+            self._cleanup_queue = []
+        with self._file_lock.exclusive():
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.cache') or entry.name == self.MANIFEST_FILENAME:
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+    def _read_expiry(self, cache_file: str) -> float:
+        """파일 헤더에서 만료 시각만 읽음 (이전 형식이거나 손상되면 0)"""
+        try:
+            with open(cache_file, 'rb') as f:
+                header = f.read(self.RECORD_HEADER.size)
+            magic, expires_at = self.RECORD_HEADER.unpack(header)[:2]
+            return expires_at if magic == self.MAGIC else 0.0
+        except (OSError, struct.error):
+            return 0.0
+
+    def is_expired(self, cache_file: str) -> bool:
+        """캐시 파일 만료 여부 확인 (헤더만 읽음)"""
+        return time.time() > self._read_expiry(cache_file)
+
+    def cleanup_step(self, limit: int) -> Tuple[int, bool]:
+        """최대 limit개 항목의 만료 여부를 확인해 정리 (삭제 개수, 한 바퀴 완료 여부)"""
+        with self._lock:
+            if not self._cleanup_queue:
+                self._cleanup_queue = self._index.keys()
+            batch = self._cleanup_queue[-limit:]
+            del self._cleanup_queue[-limit:]
+            known = {key_hash: self._expiry.get(key_hash) for key_hash in batch}
+
+        now = time.time()
+        removed = []
+        # 헤더 확인과 삭제 사이에 다른 프로세스가 파일을 교체하지 못하도록 배타 잠금
+        with self._file_lock.exclusive():
+            for key_hash, expires_at in known.items():
+                cache_path = self._get_path_for_hash(key_hash)
+                # 매니페스트 값이 만료로 보이면 다른 프로세스가 갱신했을 수 있으므로 헤더로 재확인
+                if expires_at is None or now > expires_at:
+                    expires_at = self._read_expiry(cache_path)
+                with self._lock:
+                    if key_hash not in self._index:
+                        continue
+                    if now <= expires_at:
+                        self._expiry[key_hash] = expires_at
+                        continue
+                    self._index.remove(key_hash)
+                    self._expiry.pop(key_hash, None)
+                try:
+                    os.remove(cache_path)
+                except FileNotFoundError:
+                    pass
+                removed.append(key_hash)
+
+        self._notify_evicted(removed)
+        with self._lock:
+            finished = not self._cleanup_queue
+        if finished:
+            self._save_manifest()
+        return len(removed), finished
+
+    def cleanup_expired(self) -> int:
+        """만료된 레코드 정리 (삭제된 개수 반환)"""
+        with self._lock:
+            self._cleanup_queue = []
+        removed = 0
+        while True:
+            count, finished = self.cleanup_step(256)
+            removed += count
+            if finished:
+                return removed
+
+    def get_size(self) -> int:
+        """저장소 크기 (바이트 단위)"""
+        with self._lock:
+            return self._index.total_bytes
+
+    def get_stats(self) -> dict:
+        """저장소 통계 (만료 개수는 만료 시각을 알고 있는 항목 기준)"""
+        now = time.time()
+        with self._lock:
+            return {
+                'total_files': len(self._index),
+                'total_size': self._index.total_bytes,
+                'expired_files': sum(1 for expires_at in self._expiry.values() if now > expires_at)
+            }
+
+    def close(self):
+        """용량 한도를 다시 확인하고 만료 시각 매니페스트 저장"""
+        try:
+            self.enforce_limits()
+        except OSError as e:
+            print(f"캐시 용량 정리 실패: {e}")
+        self._save_manifest()
+
+
+class SQLiteCacheBackend:
+    """단일 SQLite 데이터베이스(WAL 모드)에 모든 레코드를 저장하는 저장소"""
+
+    DB_FILENAME = "cache.db"
+    EVICTION_BATCH = 16
+    # 조회 시 접근 기록은 모아 두었다가 이 개수나 시간(초)이 차면 한 번에 기록
+    ACCESS_FLUSH_BATCH = 64
+    ACCESS_FLUSH_INTERVAL = 5.0
+
+    def __init__(self, cache_dir: str, max_bytes: int = 0, max_entries: int = 0,
+                 eviction_policy: str = 'lru', serializer: Optional[CacheSerializer] = None):
+        if eviction_policy not in AccessIndex.POLICIES:
+            raise ValueError(f"지원하지 않는 제거 정책: {eviction_policy}")
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.eviction_policy = eviction_policy
+        self.serializer = serializer or CacheSerializer()
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        self.db_path = os.path.join(cache_dir, self.DB_FILENAME)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key_hash TEXT PRIMARY KEY,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                fresh_until REAL
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")}
+        if 'fresh_until' not in columns:
+            self._conn.execute("ALTER TABLE cache_entries ADD COLUMN fresh_until REAL")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at)"
+        )
+        # 접근 기록은 별도 테이블에 두어 조회 시 페이로드 행을 다시 쓰지 않음
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_access (
+                key_hash TEXT PRIMARY KEY,
+                last_access REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_access_lru ON cache_access (last_access)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_access_lfu ON cache_access (hits, last_access)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO cache_access (key_hash, last_access, hits) "
+            "SELECT key_hash, created_at, 0 FROM cache_entries"
+        )
+        self._conn.commit()
+
+        self._count, self._total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        # 제거/삭제된 항목의 key_hash 목록을 받는 콜백 (메모리 계층 동기화용)
+        self.on_evict: Optional[Callable[[List[str]], None]] = None
+        # key_hash -> [마지막 접근 시각, 기록되지 않은 접근 횟수]
+        self._pending_access: Dict[str, list] = {}
+        self._last_flush = time.monotonic()
+
+    def _notify_evicted(self, key_hashes: List[str]):
+        if key_hashes and self.on_evict is not None:
+            self.on_evict(key_hashes)
+
+    def _flush_access(self):
+        """모아 둔 접근 기록을 한 번에 반영 (lock 보유 상태에서 호출, 커밋은 호출한 쪽에서)"""
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE cache_access SET last_access = ?, hits = hits + ? WHERE key_hash = ?",
+                [(last_access, hits, key_hash)
+                 for key_hash, (last_access, hits) in self._pending_access.items()]
+            )
+            self._pending_access = {}
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        return hash_key(key)
+
+    def read(self, key: str) -> Optional[dict]:
+        """저장된 레코드 조회"""
+        key_hash = self._hash_key(key)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, created_at, payload, fresh_until FROM cache_entries WHERE key_hash = ?",
+                (key_hash,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            # 조회마다 커밋하지 않도록 접근 기록은 모아 두었다가 한 번에 기록
+            pending = self._pending_access.get(key_hash)
+            if pending is None:
+                self._pending_access[key_hash] = [time.time(), 1]
+            else:
+                pending[0] = time.time()
+                pending[1] += 1
+            if (len(self._pending_access) >= self.ACCESS_FLUSH_BATCH or
+                    time.monotonic() - self._last_flush >= self.ACCESS_FLUSH_INTERVAL):
+                self._flush_access()
+                self._conn.commit()
+
+        expires_at, created_at, payload, fresh_until = row
+        try:
+            value = self.serializer.loads(payload)
+        except SerializationError:
+            # 다른 형식/Python 버전에서 기록된 페이로드는 미스로 처리하고 다음 저장 때 덮어씀
+            return None
+        return {
+            'value': value,
+            'expires_at': expires_at,
+            'created_at': created_at,
+            'fresh_until': fresh_until if fresh_until is not None else expires_at,
+            'size': len(payload)
+        }
+
+    def write(self, key: str, record: dict) -> int:
+        """레코드 저장 후 용량 한도를 넘으면 일부 항목 제거 (저장된 크기 반환)"""
+        key_hash = self._hash_key(key)
+        payload = self.serializer.dumps(record['value'])
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM cache_entries WHERE key_hash = ?", (key_hash,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(key_hash, expires_at, created_at, size, payload, fresh_until) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key_hash, record['expires_at'], record['created_at'],
+                 len(payload), sqlite3.Binary(payload), record.get('fresh_until'))
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_access (key_hash, last_access, hits) VALUES (?, ?, 0)",
+                (key_hash, time.time())
+            )
+            self._pending_access.pop(key_hash, None)
+
+            if old is None:
+                self._count += 1
+            else:
+                self._total_bytes -= old[0]
+            self._total_bytes += len(payload)
+
+            victims = self._evict(exclude=key_hash)
+            self._conn.commit()
+        self._notify_evicted(victims)
+        return len(payload)
+
+    def _over_budget(self) -> bool:
+        return bool((self.max_bytes and self._total_bytes > self.max_bytes) or
+                    (self.max_entries and self._count > self.max_entries))
+
+    def _evict(self, exclude: str) -> List[str]:
+        """한도를 넘은 만큼만 접근 기록 순으로 제거하고 제거한 key_hash 반환 (lock 보유 상태에서 호출)"""
+        if self.eviction_policy == 'lfu':
+            order = "a.hits, a.last_access"
+        else:
+            order = "a.last_access"
+
+        # 다른 프로세스가 같은 DB에 쓴 양도 반영해 한도 판단
+        if self._over_budget():
+            self._refresh_totals()
+            # 제거 순서가 최근 조회를 반영하도록 모아 둔 접근 기록 먼저 기록
+            self._flush_access()
+
+        evicted = []
+        while self._over_budget():
+            victims = self._conn.execute(
+                f"SELECT e.key_hash, e.size FROM cache_access a "
+                f"JOIN cache_entries e ON e.key_hash = a.key_hash "
+                f"WHERE a.key_hash != ? ORDER BY {order} LIMIT ?",
+                (exclude, self.EVICTION_BATCH)
+            ).fetchall()
+            if not victims:
+                break
+
+            for key_hash, size in victims:
+                if not self._over_budget():
+                    break
+                self._delete_hash(key_hash)
+                self._count -= 1
+                self._total_bytes -= size
+                evicted.append(key_hash)
+        return evicted
+
+    def _delete_hash(self, key_hash: str):
+        self._conn.execute("DELETE FROM cache_entries WHERE key_hash = ?", (key_hash,))
+        self._conn.execute("DELETE FROM cache_access WHERE key_hash = ?", (key_hash,))
+
+    def _refresh_totals(self):
+        self._count, self._total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+
+    def delete(self, key: str):
+        """레코드 삭제"""
+        key_hash = self._hash_key(key)
+        with self._lock:
+            self._pending_access.pop(key_hash, None)
+            self._delete_hash(key_hash)
+            self._conn.commit()
+            self._refresh_totals()
+        self._notify_evicted([key_hash])
+
+    def clear(self):
+        """모든 레코드 삭제"""
+        with self._lock:
+            self._pending_access = {}
+            self._conn.execute("DELETE FROM cache_entries")
+            self._conn.execute("DELETE FROM cache_access")
+            self._conn.commit()
+            self._count, self._total_bytes = 0, 0
+
+    def cleanup_step(self, limit: int) -> Tuple[int, bool]:
+        """만료 인덱스에서 최대 limit개 정리 (삭제 개수, 남은 만료 항목이 없는지 여부)"""
+        now = time.time()
+        with self._lock:
+            expired = [row[0] for row in self._conn.execute(
+                "SELECT key_hash FROM cache_entries WHERE expires_at < ? LIMIT ?", (now, limit)
+            )]
+            for key_hash in expired:
+                self._delete_hash(key_hash)
+            self._conn.commit()
+            if expired:
+                self._refresh_totals()
+        self._notify_evicted(expired)
+        return len(expired), len(expired) < limit
+
+    def cleanup_expired(self) -> int:
+        """만료된 레코드 정리 (삭제된 개수 반환)"""
+        now = time.time()
+        with self._lock:
+            expired = [row[0] for row in self._conn.execute(
+                "SELECT key_hash FROM cache_entries WHERE expires_at < ?", (now,)
+            )]
+            self._conn.execute(
+                "DELETE FROM cache_access WHERE key_hash IN "
+                "(SELECT key_hash FROM cache_entries WHERE expires_at < ?)", (now,)
+            )
+            cursor = self._conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,))
+            self._conn.commit()
+            self._refresh_totals()
+        self._notify_evicted(expired)
+        return cursor.rowcount
+
+    def get_size(self) -> int:
+        """저장된 페이로드 크기 합계 (바이트 단위)"""
+        with self._lock:
+            return self._total_bytes
+
+    def get_stats(self) -> dict:
+        """저장소 통계"""
+        with self._lock:
+            total, size, expired = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(CASE WHEN expires_at < ? THEN 1 ELSE 0 END), 0) FROM cache_entries",
+                (time.time(),)
+            ).fetchone()
+
+        return {
+            'total_files': total,
+            'total_size': size,
+            'expired_files': expired
+        }
+
+    def close(self):
+        """남은 접근 기록을 저장하고 데이터베이스 연결 종료"""
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()
+
+
+class MemoryCacheTier:
+    """영구 저장소 앞단의 프로세스 내 LRU 캐시 (항목 수와 바이트 수로 제한)
+
+    값은 복사하지 않고 같은 객체를 모든 호출자에게 돌려주므로 조회한 값을 수정하면 안 됨
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """레코드 조회 (조회된 항목은 가장 최근 사용으로 이동)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, record: dict, size: int):
+        """레코드 저장 후 한도를 넘으면 오래된 항목부터 제거"""
+        if not self.enabled or size > self.max_bytes:
+            self.discard(key)
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+            self._entries[key] = (record, size)
+            self.current_bytes += size
+
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def discard(self, key: str):
+        """레코드 제거"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def discard_many(self, keys: List[str]):
+        """여러 레코드 제거 (영구 저장소에서 제거된 항목 반영)"""
+        with self._lock:
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self.current_bytes -= entry[1]
+
+    def clear(self):
+        """모든 레코드 제거"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def cleanup_expired(self, now: float):
+        """만료된 레코드 제거"""
+        with self._lock:
+            expired = [key for key, (record, _) in self._entries.items() if now > record['expires_at']]
+            for key in expired:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheCleaner:
+    """만료 항목을 작은 배치로 나누어 백그라운드에서 정리"""
+
+    def __init__(self, cache: 'Cache', interval: float = 300.0, batch_size: int = 200,
+                 batch_pause: float = 0.05):
+        self.cache = cache
+        self.interval = interval
+        self.batch_size = batch_size
+        # 배치 사이에 잠시 쉬어 UI 스레드와 저장소 잠금을 오래 점유하지 않음
+        self.batch_pause = batch_pause
+        self.removed = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """정리 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-cleaner", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """정리 스레드 중지 (진행 중인 배치가 끝날 때까지 대기)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        delay = 0.0
+        while not self._stop.wait(delay):
+            try:
+                removed, finished = self.cache.cleanup_step(self.batch_size)
+                self.removed += removed
+            except Exception as e:
+                print(f"만료된 캐시 정리 실패: {e}")
+                finished = True
+            delay = self.interval if finished else self.batch_pause
+
+
+class NegativeEntry:
+    """조회 결과가 없었음을 나타내는 캐시 값"""
+    __slots__ = ()
+
+
+class Cache:
+    BACKENDS = {
+        'file': FileCacheBackend,
+        'sqlite': SQLiteCacheBackend
+    }
+
+    # lookup() 결과 상태
+    FRESH = 'fresh'
+    STALE = 'stale'
+    NEGATIVE = 'negative'
+    MISS = 'miss'
+
+    def __init__(self, cache_dir="cache", default_ttl=3600, backend="file",
+                 memory_max_entries=1000, memory_max_bytes=16 * 1024 * 1024,
+                 max_bytes=0, max_entries=0, eviction_policy="lru",
+                 serializer="compact", compress_threshold=4096):
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 캐시 백엔드: {backend}")
+        self.backend_name = backend
+        # max_bytes/max_entries가 0이면 용량 제한 없음
+        self.serializer = CacheSerializer(serializer, compress_threshold)
+        self.backend = self.BACKENDS[backend](
+            cache_dir, max_bytes=max_bytes, max_entries=max_entries,
+            eviction_policy=eviction_policy, serializer=self.serializer
+        )
+
+        # 자주 읽는 키는 파일/DB를 거치지 않도록 메모리 계층에 보관
+        # 메모리 계층은 저장소와 같은 key_hash를 키로 써서 저장소의 제거/삭제를 그대로 반영
+        self.memory = MemoryCacheTier(memory_max_entries, memory_max_bytes)
+        self.backend.on_evict = self.memory.discard_many
+        self.tier_stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        self._stats_lock = threading.Lock()
+        self.cleaner: Optional[CacheCleaner] = None
+
+    def ensure_cache_dir(self):
+        """캐시 디렉토리 생성"""
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, stale_ttl: int = 0):
+        """캐시에 데이터 저장 (stale_ttl 동안은 만료 후에도 오래된 값으로 제공 가능)"""
         if ttl is None:
             ttl = self.default_ttl
-        
+
+        now = time.time()
         cache_data = {
             'value': value,
-            'expires_at': time.time() + ttl,
-            'created_at': time.time()
+            'expires_at': now + ttl + stale_ttl,
+            'created_at': now,
+            'fresh_until': now + ttl
         }
-        
-        cache_path = self._get_cache_path(key)
+
+        # write-through: 영구 저장소에 기록한 뒤 직렬화된 크기로 메모리 계층에도 기록
+        size = None
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(cache_data, f)
+            size = self.backend.write(key, cache_data)
         except Exception as e:
             print(f"캐시 저장 실패: {e}")
-    
-    def get(self, key: str) -> Optional[Any]:
-        """캐시에서 데이터 조회"""
-        cache_path = self._get_cache_path(key)
-        
-        if not os.path.exists(cache_path):
-            return None
-        
+
+        if self.memory.enabled:
+            self.memory.put(hash_key(key), cache_data,
+                            size if size is not None else sys.getsizeof(value))
+
+    def set_negative(self, key: str, ttl: int):
+        """조회 결과가 없다는 사실을 짧은 TTL로 저장 (negative caching)"""
+        self.set(key, NegativeEntry(), ttl)
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self.tier_stats[name] += 1
+
+    def _read_record(self, key: str) -> Optional[dict]:
+        """메모리 계층 → 영구 저장소 순으로 만료되지 않은 레코드 조회"""
+        key_hash = hash_key(key)
+        cache_data = self.memory.get(key_hash)
+        if cache_data is not None:
+            if time.time() <= cache_data['expires_at']:
+                self._count('memory_hits')
+                return cache_data
+            self.memory.discard(key_hash)
+
         try:
-            with open(cache_path, 'rb') as f:
-                cache_data = pickle.load(f)
-            
+            cache_data = self.backend.read(key)
+            if cache_data is None:
+                self._count('misses')
+                return None
+
             if time.time() > cache_data['expires_at']:
+                self._count('misses')
                 self.delete(key)
                 return None
-            
-            return cache_data['value']
+
+            # read-promotion: 디스크에서 읽은 항목은 저장소가 알려준 크기로 메모리 계층에 승격
+            self._count('disk_hits')
+            if self.memory.enabled:
+                self.memory.put(key_hash, cache_data, cache_data['size'])
+            return cache_data
         except Exception as e:
             print(f"캐시 로드 실패: {e}")
+            self._count('misses')
             self.delete(key)
             return None
-    
+
+    def lookup(self, key: str) -> Tuple[str, Optional[Any]]:
+        """캐시 상태와 값 조회 (FRESH, STALE, NEGATIVE, MISS 중 하나)"""
+        cache_data = self._read_record(key)
+        if cache_data is None:
+            return self.MISS, None
+
+        if isinstance(cache_data['value'], NegativeEntry):
+            return self.NEGATIVE, None
+
+        if time.time() > cache_data.get('fresh_until', cache_data['expires_at']):
+            return self.STALE, cache_data['value']
+        return self.FRESH, cache_data['value']
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에서 데이터 조회 (유효 기간이 지난 값은 반환하지 않음, 반환된 값은 공유되므로 수정 금지)"""
+        state, value = self.lookup(key)
+        return value if state == self.FRESH else None
+
     def delete(self, key: str):
         """캐시에서 데이터 삭제"""
-        cache_path = self._get_cache_path(key)
+        self.memory.discard(hash_key(key))
         try:
-            if os.path.exists(cache_path):
-                os.remove(cache_path)
+            self.backend.delete(key)
         except Exception as e:
             print(f"캐시 삭제 실패: {e}")
-    
+
     def clear(self):
         """모든 캐시 데이터 삭제"""
+        self.memory.clear()
         try:
-            if os.path.exists(self.cache_dir):
-                shutil.rmtree(self.cache_dir)
-                self.ensure_cache_dir()
+            self.backend.clear()
         except Exception as e:
             print(f"캐시 전체 삭제 실패: {e}")
-    
+
     def is_expired(self, cache_file: str) -> bool:
-        """캐시 만료 여부 확인"""
-        try:
-            with open(cache_file, 'rb') as f:
-                cache_data = pickle.load(f)
-            return time.time() > cache_data['expires_at']
-        except Exception:
-            return True
-    
+        """캐시 만료 여부 확인 (파일 백엔드 전용)"""
+        if isinstance(self.backend, FileCacheBackend):
+            return self.backend.is_expired(cache_file)
+        return True
+
     def cleanup_expired(self):
         """만료된 캐시 정리"""
+        self.memory.cleanup_expired(time.time())
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.cache'):
-                    cache_path = os.path.join(self.cache_dir, filename)
-                    if self.is_expired(cache_path):
-                        os.remove(cache_path)
+            self.backend.cleanup_expired()
         except Exception as e:
             print(f"만료된 캐시 정리 실패: {e}")
-    
+
+    def cleanup_step(self, limit: int) -> Tuple[int, bool]:
+        """만료된 캐시를 최대 limit개만 정리 (삭제 개수, 한 바퀴 완료 여부)"""
+        self.memory.cleanup_expired(time.time())
+        return self.backend.cleanup_step(limit)
+
+    def start_background_cleanup(self, interval: float = 300.0, batch_size: int = 200):
+        """만료된 캐시를 백그라운드에서 점진적으로 정리"""
+        if self.cleaner is None:
+            self.cleaner = CacheCleaner(self, interval, batch_size)
+        self.cleaner.start()
+
+    def stop_background_cleanup(self):
+        """백그라운드 정리 중지"""
+        if self.cleaner is not None:
+            self.cleaner.stop()
+
     def get_cache_size(self) -> int:
         """캐시 크기 조회 (바이트 단위)"""
-        total_size = 0
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.cache'):
-                    cache_path = os.path.join(self.cache_dir, filename)
-                    total_size += os.path.getsize(cache_path)
+            return self.backend.get_size()
         except Exception as e:
             print(f"캐시 크기 계산 실패: {e}")
-        return total_size
-    
+            return 0
+
     def get_cache_stats(self) -> dict:
         """캐시 통계 정보 조회"""
-        stats = {
-            'total_files': 0,
-            'total_size': 0,
-            'expired_files': 0
-        }
-        
-        try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.cache'):
-                    cache_path = os.path.join(self.cache_dir, filename)
-                    stats['total_files'] += 1
-                    stats['total_size'] += os.path.getsize(cache_path)
-                    
-                    if self.is_expired(cache_path):
-                        stats['expired_files'] += 1
+        try:
+            return self.backend.get_stats()
         except Exception as e:
             print(f"캐시 통계 계산 실패: {e}")
-        
-        return stats
\ No newline at end of file
+            return {
+                'total_files': 0,
+                'total_size': 0,
+                'expired_files': 0
+            }
+
+    def get_tier_stats(self) -> dict:
+        """계층별 히트율 (메모리 / 영구 저장소)"""
+        with self._stats_lock:
+            stats = dict(self.tier_stats)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        disk_lookups = stats['disk_hits'] + stats['misses']
+
+        stats['memory_hit_rate'] = stats['memory_hits'] / lookups if lookups else 0.0
+        stats['disk_hit_rate'] = stats['disk_hits'] / disk_lookups if disk_lookups else 0.0
+        stats['memory_entries'] = len(self.memory)
+        stats['memory_bytes'] = self.memory.current_bytes
+        return stats
+
+    def close(self):
+        """캐시 저장소 닫기"""
+        self.stop_background_cleanup()
+        try:
+            self.backend.close()
+        except Exception as e:
+            print(f"캐시 종료 실패: {e}")
@@ -32,6 +32,61 @@ class Config:
             'window_height': '800',
             'search_panel_width': '300'
         }
+        self.config['HTTP'] = {
+            'pool_connections': '10',
+            'pool_maxsize': '10',
+            'pool_block': 'true',
+            'connect_timeout': '3.05',
+            'read_timeout': '10'
+        }
+        self.config['RATE_LIMIT'] = {
+            'search_per_second': '10',
+            'search_burst': '10',
+            'search_daily_quota': '100000',
+            'geo_per_second': '10',
+            'geo_burst': '10',
+            'geo_daily_quota': '100000',
+            'roadview_per_second': '5',
+            'roadview_burst': '5',
+            'roadview_daily_quota': '100000',
+            'cctv_per_second': '5',
+            'cctv_burst': '5',
+            'cctv_daily_quota': '10000'
+        }
+        self.config['RETRY'] = {
+            'max_retries': '3',
+            'backoff_base': '0.3',
+            'backoff_max': '5',
+            'failure_threshold': '5',
+            'reset_timeout': '30'
+        }
+        self.config['CACHE'] = {
+            'backend': 'sqlite',
+            'memory_max_entries': '1000',
+            'memory_max_bytes': '16777216',
+            'max_bytes': '268435456',
+            'max_entries': '100000',
+            'eviction_policy': 'lru',
+            'serializer': 'compact',
+            'compress_threshold': '4096',
+            'cleanup_interval': '300',
+            'cleanup_batch_size': '200',
+            'stale_grace': '86400',
+            'empty_ttl': '300',
+            'failure_ttl': '30',
+            'keyword_ttl': '600',
+            'category_ttl': '600',
+            'address_ttl': '604800',
+            'coord2address_ttl': '604800',
+            'coord2region_ttl': '604800',
+            'roadview_ttl': '86400',
+            'cctv_nearby_ttl': '3600',
+            'default_ttl': '3600',
+            'coord2address_cell': '10',
+            'coord2region_cell': '100',
+            'roadview_cell': '10',
+            'cctv_nearby_cell': '50'
+        }
         self.save_config()
     
     def save_config(self):
@@ -97,4 +152,154 @@ class Config:
             self.config.add_section('UI')
         for key, value in kwargs.items():
             self.config.set('UI', key, str(value))
-        self.save_config()
\ No newline at end of file
+        self.save_config()
+    
+    def get_http_settings(self) -> Dict[str, Any]:
+        """HTTP 연결 풀 설정 조회"""
+        try:
+            return {
+                'pool_connections': self.config.getint('HTTP', 'pool_connections'),
+                'pool_maxsize': self.config.getint('HTTP', 'pool_maxsize'),
+                'pool_block': self.config.getboolean('HTTP', 'pool_block'),
+                'connect_timeout': self.config.getfloat('HTTP', 'connect_timeout'),
+                'read_timeout': self.config.getfloat('HTTP', 'read_timeout')
+            }
+        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return {
+                'pool_connections': 10,
+                'pool_maxsize': 10,
+                'pool_block': True,
+                'connect_timeout': 3.05,
+                'read_timeout': 10.0
+            }
+    
+    def get_rate_limit_settings(self) -> Dict[str, Dict[str, float]]:
+        """엔드포인트 계열별 호출 제한 설정 조회 ({계열}_per_second, {계열}_burst, {계열}_daily_quota)"""
+        limits = {
+            'search': {'per_second': 10.0, 'burst': 10.0, 'daily_quota': 100000},
+            'geo': {'per_second': 10.0, 'burst': 10.0, 'daily_quota': 100000},
+            'roadview': {'per_second': 5.0, 'burst': 5.0, 'daily_quota': 100000},
+            'cctv': {'per_second': 5.0, 'burst': 5.0, 'daily_quota': 10000}
+        }
+        
+        if 'RATE_LIMIT' not in self.config:
+            return limits
+        
+        for option, value in self.config.items('RATE_LIMIT'):
+            for suffix in ('per_second', 'burst', 'daily_quota'):
+                if option.endswith('_' + suffix):
+                    family = option[:-len(suffix) - 1]
+                    try:
+                        parsed = int(value) if suffix == 'daily_quota' else float(value)
+                    except ValueError:
+                        continue
+                    limits.setdefault(family, {})[suffix] = parsed
+                    break
+        
+        return limits
+    
+    def get_retry_settings(self) -> Dict[str, Any]:
+        """재시도 및 회로 차단기 설정 조회"""
+        try:
+            return {
+                'max_retries': self.config.getint('RETRY', 'max_retries'),
+                'backoff_base': self.config.getfloat('RETRY', 'backoff_base'),
+                'backoff_max': self.config.getfloat('RETRY', 'backoff_max'),
+                'failure_threshold': self.config.getint('RETRY', 'failure_threshold'),
+                'reset_timeout': self.config.getfloat('RETRY', 'reset_timeout')
+            }
+        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return {
+                'max_retries': 3,
+                'backoff_base': 0.3,
+                'backoff_max': 5.0,
+                'failure_threshold': 5,
+                'reset_timeout': 30.0
+            }
+    
+    def get_cache_ttls(self) -> Dict[str, int]:
+        """API 응답 캐시의 엔드포인트별 TTL 조회 ({이름}_ttl, 초 단위)"""
+        ttls = {}
+        if 'CACHE' not in self.config:
+            return ttls
+        
+        for option, value in self.config.items('CACHE'):
+            # 빈 결과 / 실패 TTL은 엔드포인트 TTL이 아님
+            if option in ('empty_ttl', 'failure_ttl'):
+                continue
+            if option.endswith('_ttl'):
+                try:
+                    ttls[option[:-len('_ttl')]] = int(value)
+                except ValueError:
+                    continue
+        return ttls
+    
+    def get_cache_cell_sizes(self) -> Dict[str, float]:
+        """좌표 기반 응답 캐시의 엔드포인트별 공간 셀 크기 조회 ({이름}_cell, 미터 단위)"""
+        cell_sizes = {}
+        if 'CACHE' not in self.config:
+            return cell_sizes
+        
+        for option, value in self.config.items('CACHE'):
+            if option.endswith('_cell'):
+                try:
+                    cell_sizes[option[:-len('_cell')]] = float(value)
+                except ValueError:
+                    continue
+        return cell_sizes
+    
+    def get_response_cache_settings(self) -> Dict[str, Any]:
+        """API 응답 캐시의 stale 유예 시간, negative 캐시 TTL, 공간 셀 크기 조회"""
+        try:
+            return {
+                'stale_grace': self.config.getint('CACHE', 'stale_grace', fallback=86400),
+                'empty_ttl': self.config.getint('CACHE', 'empty_ttl', fallback=300),
+                'failure_ttl': self.config.getint('CACHE', 'failure_ttl', fallback=30),
+                'cell_sizes': self.get_cache_cell_sizes()
+            }
+        except ValueError:
+            return {
+                'stale_grace': 86400,
+                'empty_ttl': 300,
+                'failure_ttl': 30,
+                'cell_sizes': self.get_cache_cell_sizes()
+            }
+    
+    def get_cache_cleanup_settings(self) -> Dict[str, Any]:
+        """만료 캐시 백그라운드 정리 설정 조회"""
+        try:
+            return {
+                'interval': self.config.getfloat('CACHE', 'cleanup_interval', fallback=300.0),
+                'batch_size': self.config.getint('CACHE', 'cleanup_batch_size', fallback=200)
+            }
+        except ValueError:
+            return {
+                'interval': 300.0,
+                'batch_size': 200
+            }
+    
+    def get_cache_settings(self) -> Dict[str, Any]:
+        """캐시 저장소 설정 조회"""
+        try:
+            # 기존 설정 파일은 file 캐시를 그대로 사용하고, 새로 생성된 설정만 sqlite를 기본으로 사용
+            return {
+                'backend': self.config.get('CACHE', 'backend', fallback='file'),
+                'memory_max_entries': self.config.getint('CACHE', 'memory_max_entries', fallback=1000),
+                'memory_max_bytes': self.config.getint('CACHE', 'memory_max_bytes', fallback=16777216),
+                'max_bytes': self.config.getint('CACHE', 'max_bytes', fallback=268435456),
+                'max_entries': self.config.getint('CACHE', 'max_entries', fallback=100000),
+                'eviction_policy': self.config.get('CACHE', 'eviction_policy', fallback='lru'),
+                'serializer': self.config.get('CACHE', 'serializer', fallback='compact'),
+                'compress_threshold': self.config.getint('CACHE', 'compress_threshold', fallback=4096)
+            }
+        except ValueError:
+            return {
+                'backend': 'file',
+                'memory_max_entries': 1000,
+                'memory_max_bytes': 16777216,
+                'max_bytes': 268435456,
+                'max_entries': 100000,
+                'eviction_policy': 'lru',
+                'serializer': 'compact',
+                'compress_threshold': 4096
+            }
@@ -1,13 +1,36 @@
 import math
-from typing import Tuple, Dict
+import warnings
+from typing import Tuple, Dict, List
+
+import numpy as np
+
+from utils import projection
 
 
 class Coordinates:
     EARTH_RADIUS_KM = 6371.0
+    # 웹 메르카토르 투영이 정사각형이 되는 위도 한계
+    MAX_MERCATOR_LAT = 85.05112878
+    
+    GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+    # int64에 들어가는 최대 정밀도 (12자 = 60비트)
+    GEOHASH_MAX_PRECISION = 12
+    # 이웃 방향 → (위도 칸 변화, 경도 칸 변화)
+    NEIGHBOR_OFFSETS = {
+        'n': (1, 0), 'ne': (1, 1), 'e': (0, 1), 'se': (-1, 1),
+        's': (-1, 0), 'sw': (-1, -1), 'w': (0, -1), 'nw': (1, -1)
+    }
+    # 커버 계산 시 만들 수 있는 최대 셀 수
+    MAX_COVER_CELLS = 100000
+    # 카카오 지도 레벨 + 웹 메르카토르 줌 ≈ 20 (레벨 3 ≈ 줌 17)
+    KAKAO_ZOOM_OFFSET = 20
     
     @staticmethod
     def wgs84_to_grs80(lat: float, lng: float) -> Tuple[float, float]:
-        """WGS84 좌표계를 GRS80으로 변환"""
+        """WGS84 좌표계를 GRS80으로 변환 (고정 오프셋 근사, 더 이상 사용하지 않음 - wgs84_to_tm 사용)"""
+        warnings.warn("wgs84_to_grs80은 고정 오프셋 근사이므로 더 이상 사용하지 않습니다. "
+                      "TM 좌표가 필요하면 Coordinates.wgs84_to_tm을 사용하세요",
+                      DeprecationWarning, stacklevel=2)
         delta_lat = 0.00010576
         delta_lng = 0.00011059
         
@@ -18,7 +41,10 @@ class Coordinates:
     
     @staticmethod
     def grs80_to_wgs84(x: float, y: float) -> Tuple[float, float]:
-        """GRS80 좌표계를 WGS84로 변환"""
+        """GRS80 좌표계를 WGS84로 변환 (고정 오프셋 근사, 더 이상 사용하지 않음 - tm_to_wgs84 사용)"""
+        warnings.warn("grs80_to_wgs84는 고정 오프셋 근사이므로 더 이상 사용하지 않습니다. "
+                      "TM 좌표를 위경도로 바꾸려면 Coordinates.tm_to_wgs84를 사용하세요",
+                      DeprecationWarning, stacklevel=2)
         delta_lat = 0.00010576
         delta_lng = 0.00011059
         
@@ -27,6 +53,18 @@ class Coordinates:
         
         return wgs84_lat, wgs84_lng
     
+    @staticmethod
+    def wgs84_to_tm(lat: float, lng: float, epsg: int = 5179) -> Tuple[float, float]:
+        """WGS84 위경도를 GRS80 TM 좌표 (x, y)로 변환 (EPSG:5179/5181/5185~5188)"""
+        x, y = projection.wgs84_to_tm(lat, lng, epsg)
+        return float(x), float(y)
+    
+    @staticmethod
+    def tm_to_wgs84(x: float, y: float, epsg: int = 5179) -> Tuple[float, float]:
+        """GRS80 TM 좌표 (x, y)를 WGS84 위경도로 변환 (EPSG:5179/5181/5185~5188)"""
+        lat, lng = projection.tm_to_wgs84(x, y, epsg)
+        return float(lat), float(lng)
+    
     @staticmethod
     def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """두 좌표 간의 거리 계산 (하버사인 공식) - km 단위"""
@@ -63,6 +101,53 @@ class Coordinates:
         
         return (bearing_degrees + 360) % 360
     
+    @staticmethod
+    def _haversine_km(lat1, lng1, lat2, lng2) -> np.ndarray:
+        """브로드캐스팅 가능한 배열에 대한 하버사인 거리 (km)"""
+        lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=np.float64))
+                                  for v in (lat1, lng1, lat2, lng2))
+        a = (np.sin((lat2 - lat1) / 2) ** 2 +
+             np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+        # 부동소수점 오차로 1을 넘는 경우 방지
+        return 2 * Coordinates.EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    
+    @staticmethod
+    def _bearing_deg(lat1, lng1, lat2, lng2) -> np.ndarray:
+        """브로드캐스팅 가능한 배열에 대한 방위각 (도)"""
+        lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=np.float64))
+                                  for v in (lat1, lng1, lat2, lng2))
+        dlng = lng2 - lng1
+        y = np.sin(dlng) * np.cos(lat2)
+        x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlng)
+        return (np.degrees(np.arctan2(y, x)) + 360) % 360
+    
+    @staticmethod
+    def calculate_distances(lat: float, lng: float, lats, lngs) -> np.ndarray:
+        """한 좌표에서 N개 좌표까지의 거리 (km 단위 배열)"""
+        return Coordinates._haversine_km(lat, lng, lats, lngs)
+    
+    @staticmethod
+    def calculate_bearings(lat: float, lng: float, lats, lngs) -> np.ndarray:
+        """한 좌표에서 N개 좌표로의 방위각 (도 단위 배열)"""
+        return Coordinates._bearing_deg(lat, lng, lats, lngs)
+    
+    @staticmethod
+    def distance_matrix(lats1, lngs1, lats2, lngs2) -> np.ndarray:
+        """N개 좌표와 M개 좌표 사이의 거리 행렬 (N×M, km 단위)"""
+        lats1, lngs1 = np.asarray(lats1, dtype=np.float64), np.asarray(lngs1, dtype=np.float64)
+        return Coordinates._haversine_km(lats1[:, np.newaxis], lngs1[:, np.newaxis], lats2, lngs2)
+    
+    @staticmethod
+    def bearing_matrix(lats1, lngs1, lats2, lngs2) -> np.ndarray:
+        """N개 좌표에서 M개 좌표로의 방위각 행렬 (N×M, 도 단위)"""
+        lats1, lngs1 = np.asarray(lats1, dtype=np.float64), np.asarray(lngs1, dtype=np.float64)
+        return Coordinates._bearing_deg(lats1[:, np.newaxis], lngs1[:, np.newaxis], lats2, lngs2)
+    
+    @staticmethod
+    def within_radius(lat: float, lng: float, lats, lngs, radius_km: float) -> np.ndarray:
+        """N개 좌표 중 반경 안에 있는 좌표의 불리언 마스크"""
+        return Coordinates.calculate_distances(lat, lng, lats, lngs) <= radius_km
+    
     @staticmethod
     def get_bounds(center_lat: float, center_lng: float, radius_km: float) -> Dict[str, float]:
         """중심점과 반경으로 경계 좌표 계산"""
@@ -87,6 +172,11 @@ class Coordinates:
         """주어진 위도와 줌 레벨에서 픽셀당 미터 계산"""
         return 156543.03392 * math.cos(math.radians(lat)) / (2 ** zoom)
     
+    @staticmethod
+    def kakao_level_to_zoom(level: int) -> int:
+        """카카오 지도 레벨(1~14)을 웹 메르카토르 줌 레벨로 변환"""
+        return Coordinates.KAKAO_ZOOM_OFFSET - level
+    
     @staticmethod
     def tile_to_latlon(x: int, y: int, zoom: int) -> Tuple[float, float]:
         """타일 좌표를 위경도로 변환"""
@@ -103,4 +193,289 @@ class Coordinates:
         n = 2.0 ** zoom
         x = int((lng + 180.0) / 360.0 * n)
         y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
-        return x, y
\ No newline at end of file
+        return x, y
+    
+    @staticmethod
+    def meters_per_pixel_array(lats, zoom) -> np.ndarray:
+        """위도 배열(또는 줌 배열)에 대한 픽셀당 미터"""
+        lats = np.asarray(lats, dtype=np.float64)
+        return 156543.03392 * np.cos(np.radians(lats)) / np.exp2(np.asarray(zoom, dtype=np.float64))
+    
+    @staticmethod
+    def latlon_to_world(lats, lngs, zoom) -> Tuple[np.ndarray, np.ndarray]:
+        """위경도 배열을 해당 줌의 연속 타일 좌표(소수부 = 타일 내 위치)로 변환"""
+        lats = np.clip(np.asarray(lats, dtype=np.float64), -Coordinates.MAX_MERCATOR_LAT,
+                       Coordinates.MAX_MERCATOR_LAT)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        n = np.exp2(np.asarray(zoom, dtype=np.float64))
+        x = (lngs + 180.0) / 360.0 * n
+        y = (1.0 - np.arcsinh(np.tan(np.radians(lats))) / np.pi) / 2.0 * n
+        return x, y
+    
+    @staticmethod
+    def latlon_to_tiles(lats, lngs, zoom) -> Tuple[np.ndarray, np.ndarray]:
+        """위경도 배열을 타일 좌표 배열로 변환"""
+        x, y = Coordinates.latlon_to_world(lats, lngs, zoom)
+        last = np.exp2(np.asarray(zoom, dtype=np.float64)) - 1
+        return (np.clip(np.floor(x), 0, last).astype(np.int64),
+                np.clip(np.floor(y), 0, last).astype(np.int64))
+    
+    @staticmethod
+    def latlon_to_tile_pixels(lats, lngs, zoom, tile_size: int = 256
+                              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """위경도 배열을 타일 좌표와 타일 내 픽셀 오프셋으로 변환 (tile_x, tile_y, pixel_x, pixel_y)"""
+        x, y = Coordinates.latlon_to_world(lats, lngs, zoom)
+        # latlon_to_tiles와 같이 경도 180°/극 근처는 마지막 타일의 마지막 픽셀로 맞춤
+        last = np.exp2(np.asarray(zoom, dtype=np.float64)) - 1
+        tile_x = np.clip(np.floor(x), 0, last)
+        tile_y = np.clip(np.floor(y), 0, last)
+        pixel_x = np.clip(((x - tile_x) * tile_size).astype(np.int64), 0, tile_size - 1)
+        pixel_y = np.clip(((y - tile_y) * tile_size).astype(np.int64), 0, tile_size - 1)
+        return tile_x.astype(np.int64), tile_y.astype(np.int64), pixel_x, pixel_y
+    
+    @staticmethod
+    def tiles_to_latlon(xs, ys, zoom) -> Tuple[np.ndarray, np.ndarray]:
+        """타일 좌표 배열(소수 가능, 예: 중심은 +0.5)을 위경도 배열로 변환"""
+        n = np.exp2(np.asarray(zoom, dtype=np.float64))
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        lngs = xs / n * 360.0 - 180.0
+        lats = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * ys / n))))
+        return lats, lngs
+    
+    @staticmethod
+    def zoom_for_cell_size(lat: float, meters: float) -> int:
+        """주어진 위도에서 타일 한 변이 meters 이하가 되는 최소 줌 레벨"""
+        tile_meters = Coordinates.meters_per_pixel(lat, 0) * 256
+        return max(0, math.ceil(math.log2(tile_meters / meters)))
+    
+    @staticmethod
+    def snap_to_tile_center(lat: float, lng: float, zoom: int) -> Tuple[float, float]:
+        """좌표가 속한 타일의 중심 좌표 반환"""
+        x, y = Coordinates.latlon_to_tile(lat, lng, zoom)
+        return Coordinates.tile_to_latlon(x + 0.5, y + 0.5, zoom)
+    
+    @staticmethod
+    def _geohash_bits(precision: int) -> Tuple[int, int]:
+        """정밀도별 (위도 비트 수, 경도 비트 수)"""
+        if not 1 <= precision <= Coordinates.GEOHASH_MAX_PRECISION:
+            raise ValueError(f"지오해시 정밀도는 1~{Coordinates.GEOHASH_MAX_PRECISION} 사이여야 합니다: {precision}")
+        total = 5 * precision
+        return total // 2, (total + 1) // 2
+    
+    @staticmethod
+    def _geohash_from_indices(lat_idx, lng_idx, precision: int) -> np.ndarray:
+        """위도/경도 칸 번호 배열을 지오해시 문자열 배열로 변환 (경도 비트부터 교차)"""
+        lat_bits, lng_bits = Coordinates._geohash_bits(precision)
+        lat_idx = np.asarray(lat_idx, dtype=np.int64).ravel()
+        lng_idx = np.asarray(lng_idx, dtype=np.int64).ravel()
+        
+        code = np.zeros(lat_idx.shape, dtype=np.int64)
+        for i in range(5 * precision):
+            if i % 2 == 0:
+                bit = (lng_idx >> (lng_bits - 1 - i // 2)) & 1
+            else:
+                bit = (lat_idx >> (lat_bits - 1 - i // 2)) & 1
+            code = (code << 1) | bit
+        
+        shifts = np.arange(5 * (precision - 1), -1, -5, dtype=np.int64)
+        digits = (code[:, np.newaxis] >> shifts) & 31
+        alphabet = np.frombuffer(Coordinates.GEOHASH_BASE32.encode(), dtype=np.uint8)
+        chars = np.ascontiguousarray(alphabet[digits])
+        return chars.view(f'S{precision}').ravel().astype(f'U{precision}')
+    
+    @staticmethod
+    def _geohash_to_indices(hashes) -> Tuple[np.ndarray, np.ndarray, int]:
+        """같은 길이의 지오해시 배열을 (위도 칸 번호, 경도 칸 번호, 정밀도)로 변환"""
+        hashes = np.atleast_1d(np.asarray(hashes, dtype=str))
+        precision = len(hashes[0]) if hashes.size else 1
+        if np.any(np.char.str_len(hashes) != precision):
+            raise ValueError("지오해시 길이가 모두 같아야 합니다")
+        lat_bits, lng_bits = Coordinates._geohash_bits(precision)
+        
+        lookup = np.full(128, -1, dtype=np.int64)
+        lookup[np.frombuffer(Coordinates.GEOHASH_BASE32.encode(), dtype=np.uint8)] = np.arange(32)
+        chars = np.char.lower(hashes).astype(f'S{precision}').view(np.uint8).reshape(-1, precision)
+        digits = lookup[chars]
+        if np.any(digits < 0):
+            raise ValueError("잘못된 지오해시 문자가 있습니다")
+        
+        code = np.zeros(len(hashes), dtype=np.int64)
+        for k in range(precision):
+            code = (code << 5) | digits[:, k]
+        
+        lat_idx = np.zeros_like(code)
+        lng_idx = np.zeros_like(code)
+        total = 5 * precision
+        for i in range(total):
+            bit = (code >> (total - 1 - i)) & 1
+            if i % 2 == 0:
+                lng_idx = (lng_idx << 1) | bit
+            else:
+                lat_idx = (lat_idx << 1) | bit
+        return lat_idx, lng_idx, precision
+    
+    @staticmethod
+    def _geohash_cell_indices(lats, lngs, precision: int) -> Tuple[np.ndarray, np.ndarray]:
+        lat_bits, lng_bits = Coordinates._geohash_bits(precision)
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        lat_idx = np.floor((lats + 90.0) / 180.0 * (1 << lat_bits)).astype(np.int64)
+        lng_idx = np.floor((lngs + 180.0) / 360.0 * (1 << lng_bits)).astype(np.int64)
+        return (np.clip(lat_idx, 0, (1 << lat_bits) - 1),
+                np.clip(lng_idx, 0, (1 << lng_bits) - 1))
+    
+    @staticmethod
+    def geohash_encode_batch(lats, lngs, precision: int = 9) -> np.ndarray:
+        """위경도 배열을 지오해시 문자열 배열로 변환"""
+        lat_idx, lng_idx = Coordinates._geohash_cell_indices(lats, lngs, precision)
+        return Coordinates._geohash_from_indices(lat_idx, lng_idx, precision)
+    
+    @staticmethod
+    def geohash_encode(lat: float, lng: float, precision: int = 9) -> str:
+        """위경도를 지오해시 문자열로 변환"""
+        return str(Coordinates.geohash_encode_batch(lat, lng, precision)[0])
+    
+    @staticmethod
+    def geohash_decode_batch(hashes) -> Tuple[np.ndarray, np.ndarray]:
+        """같은 길이의 지오해시 배열을 셀 중심 위경도 배열로 변환"""
+        lat_idx, lng_idx, precision = Coordinates._geohash_to_indices(hashes)
+        lat_bits, lng_bits = Coordinates._geohash_bits(precision)
+        lats = (lat_idx + 0.5) * (180.0 / (1 << lat_bits)) - 90.0
+        lngs = (lng_idx + 0.5) * (360.0 / (1 << lng_bits)) - 180.0
+        return lats, lngs
+    
+    @staticmethod
+    def geohash_decode(geohash: str) -> Tuple[float, float]:
+        """지오해시를 셀 중심 위경도로 변환"""
+        lats, lngs = Coordinates.geohash_decode_batch([geohash])
+        return float(lats[0]), float(lngs[0])
+    
+    @staticmethod
+    def geohash_bounds(geohash: str) -> Dict[str, float]:
+        """지오해시 셀의 경계 좌표 (get_bounds와 같은 형식)"""
+        lat_idx, lng_idx, precision = Coordinates._geohash_to_indices([geohash])
+        lat_bits, lng_bits = Coordinates._geohash_bits(precision)
+        lat_size = 180.0 / (1 << lat_bits)
+        lng_size = 360.0 / (1 << lng_bits)
+        south = int(lat_idx[0]) * lat_size - 90.0
+        west = int(lng_idx[0]) * lng_size - 180.0
+        return {
+            'north': south + lat_size,
+            'south': south,
+            'east': west + lng_size,
+            'west': west
+        }
+    
+    @staticmethod
+    def geohash_neighbors(geohash: str) -> Dict[str, str]:
+        """지오해시의 8방향 이웃 (극지방 밖으로 나가는 방향은 제외, 경도는 순환)"""
+        lat_idx, lng_idx, precision = Coordinates._geohash_to_indices([geohash])
+        lat_bits, lng_bits = Coordinates._geohash_bits(precision)
+        lat_idx, lng_idx = int(lat_idx[0]), int(lng_idx[0])
+        
+        neighbors = {}
+        for direction, (dlat, dlng) in Coordinates.NEIGHBOR_OFFSETS.items():
+            nlat = lat_idx + dlat
+            if not 0 <= nlat < (1 << lat_bits):
+                continue
+            nlng = (lng_idx + dlng) % (1 << lng_bits)
+            neighbors[direction] = str(Coordinates._geohash_from_indices(nlat, nlng, precision)[0])
+        return neighbors
+    
+    @staticmethod
+    def geohash_cover(bounds: Dict[str, float], precision: int) -> List[str]:
+        """경계 영역(get_bounds 결과)을 덮는 지오해시 목록"""
+        lat_idx, lng_idx = Coordinates._geohash_cell_indices(
+            [bounds['south'], bounds['north']], [bounds['west'], bounds['east']], precision
+        )
+        lat_range = np.arange(lat_idx[0], lat_idx[1] + 1, dtype=np.int64)
+        lng_range = np.arange(lng_idx[0], lng_idx[1] + 1, dtype=np.int64)
+        if len(lat_range) * len(lng_range) > Coordinates.MAX_COVER_CELLS:
+            raise ValueError(f"커버 셀 수가 너무 많습니다: {len(lat_range) * len(lng_range)}개")
+        
+        lat_grid, lng_grid = np.meshgrid(lat_range, lng_range, indexing='ij')
+        return Coordinates._geohash_from_indices(lat_grid, lng_grid, precision).tolist()
+    
+    @staticmethod
+    def tiles_to_quadkeys(xs, ys, zoom: int) -> np.ndarray:
+        """타일 좌표 배열을 쿼드키 문자열 배열로 변환"""
+        if zoom < 1:
+            raise ValueError(f"쿼드키 줌 레벨은 1 이상이어야 합니다: {zoom}")
+        xs = np.asarray(xs, dtype=np.int64).ravel()
+        ys = np.asarray(ys, dtype=np.int64).ravel()
+        shifts = np.arange(zoom - 1, -1, -1, dtype=np.int64)
+        digits = (((xs[:, np.newaxis] >> shifts) & 1) +
+                  2 * ((ys[:, np.newaxis] >> shifts) & 1))
+        chars = np.ascontiguousarray((digits + ord('0')).astype(np.uint8))
+        return chars.view(f'S{zoom}').ravel().astype(f'U{zoom}')
+    
+    @staticmethod
+    def quadkeys_to_tiles(quadkeys) -> Tuple[np.ndarray, np.ndarray, int]:
+        """같은 길이의 쿼드키 배열을 (타일 x, 타일 y, 줌 레벨)로 변환"""
+        quadkeys = np.atleast_1d(np.asarray(quadkeys, dtype=str))
+        zoom = len(quadkeys[0]) if quadkeys.size else 0
+        if zoom < 1 or np.any(np.char.str_len(quadkeys) != zoom):
+            raise ValueError("쿼드키 길이가 모두 같고 1 이상이어야 합니다")
+        digits = quadkeys.astype(f'S{zoom}').view(np.uint8).reshape(-1, zoom).astype(np.int64) - ord('0')
+        if np.any((digits < 0) | (digits > 3)):
+            raise ValueError("잘못된 쿼드키 문자가 있습니다")
+        
+        xs = np.zeros(len(quadkeys), dtype=np.int64)
+        ys = np.zeros(len(quadkeys), dtype=np.int64)
+        for k in range(zoom):
+            xs = (xs << 1) | (digits[:, k] & 1)
+            ys = (ys << 1) | (digits[:, k] >> 1)
+        return xs, ys, zoom
+    
+    @staticmethod
+    def quadkey_encode_batch(lats, lngs, zoom: int) -> np.ndarray:
+        """위경도 배열을 쿼드키 문자열 배열로 변환"""
+        xs, ys = Coordinates.latlon_to_tiles(lats, lngs, zoom)
+        return Coordinates.tiles_to_quadkeys(xs, ys, zoom)
+    
+    @staticmethod
+    def quadkey_encode(lat: float, lng: float, zoom: int) -> str:
+        """위경도를 쿼드키 문자열로 변환"""
+        return str(Coordinates.quadkey_encode_batch(lat, lng, zoom)[0])
+    
+    @staticmethod
+    def quadkey_decode_batch(quadkeys) -> Tuple[np.ndarray, np.ndarray]:
+        """같은 길이의 쿼드키 배열을 타일 중심 위경도 배열로 변환"""
+        xs, ys, zoom = Coordinates.quadkeys_to_tiles(quadkeys)
+        return Coordinates.tiles_to_latlon(xs + 0.5, ys + 0.5, zoom)
+    
+    @staticmethod
+    def quadkey_decode(quadkey: str) -> Tuple[float, float]:
+        """쿼드키를 타일 중심 위경도로 변환"""
+        lats, lngs = Coordinates.quadkey_decode_batch([quadkey])
+        return float(lats[0]), float(lngs[0])
+    
+    @staticmethod
+    def quadkey_neighbors(quadkey: str) -> Dict[str, str]:
+        """쿼드키의 8방향 이웃 (위아래 끝은 제외, 경도는 순환)"""
+        xs, ys, zoom = Coordinates.quadkeys_to_tiles([quadkey])
+        x, y, n = int(xs[0]), int(ys[0]), 1 << zoom
+        
+        neighbors = {}
+        for direction, (dlat, dlng) in Coordinates.NEIGHBOR_OFFSETS.items():
+            # 타일 y는 북쪽으로 갈수록 작아짐
+            ny = y - dlat
+            if not 0 <= ny < n:
+                continue
+            neighbors[direction] = str(Coordinates.tiles_to_quadkeys((x + dlng) % n, ny, zoom)[0])
+        return neighbors
+    
+    @staticmethod
+    def quadkey_cover(bounds: Dict[str, float], zoom: int) -> List[str]:
+        """경계 영역(get_bounds 결과)을 덮는 쿼드키 목록"""
+        xs, ys = Coordinates.latlon_to_tiles(
+            [bounds['north'], bounds['south']], [bounds['west'], bounds['east']], zoom
+        )
+        x_range = np.arange(xs[0], xs[1] + 1, dtype=np.int64)
+        y_range = np.arange(ys[0], ys[1] + 1, dtype=np.int64)
+        if len(x_range) * len(y_range) > Coordinates.MAX_COVER_CELLS:
+            raise ValueError(f"커버 셀 수가 너무 많습니다: {len(x_range) * len(y_range)}개")
+        
+        y_grid, x_grid = np.meshgrid(y_range, x_range, indexing='ij')
+        return Coordinates.tiles_to_quadkeys(x_grid, y_grid, zoom).tolist()
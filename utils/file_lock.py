@@ -0,0 +1,76 @@
+import errno
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# msvcrt.locking(LK_LOCK)이 잠금 경합으로 실패할 때의 오류 번호
+_CONTENTION_ERRNOS = {getattr(errno, 'EDEADLOCK', errno.EDEADLK), errno.EACCES}
+
+
+class FileLock:
+    """여러 프로세스가 같은 디렉토리를 공유할 때 쓰는 권고(advisory) 파일 잠금"""
+
+    def __init__(self, path: str, timeout: float = 60.0):
+        self.path = path
+        # Windows에서 잠금을 기다리는 최대 시간 (초)
+        self.timeout = timeout
+
+    def _acquire(self, shared: bool) -> int:
+        # 획득할 때마다 새로 열어야 같은 프로세스의 스레드 사이에서도 잠금이 동작함
+        # (Windows에는 공유 잠금이 없으므로 공유 잠금도 배타 잠금으로 처리)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            else:
+                deadline = time.monotonic() + self.timeout
+                while True:
+                    try:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError as e:
+                        # LK_LOCK은 약 10초 재시도 후 경합 오류를 내므로 제한 시간까지만 다시 시도
+                        # (그 밖의 오류는 재시도해도 풀리지 않으므로 그대로 전달)
+                        if e.errno not in _CONTENTION_ERRNOS or time.monotonic() >= deadline:
+                            raise
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    @staticmethod
+    def _release(fd: int):
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def shared(self):
+        """공유 잠금 (여러 작성자가 동시에 보유 가능)"""
+        fd = self._acquire(shared=True)
+        try:
+            yield
+        finally:
+            self._release(fd)
+
+    @contextmanager
+    def exclusive(self):
+        """배타 잠금 (정리/삭제처럼 다른 프로세스의 쓰기와 겹치면 안 되는 작업)"""
+        fd = self._acquire(shared=False)
+        try:
+            yield
+        finally:
+            self._release(fd)
@@ -0,0 +1,187 @@
+import math
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+
+from utils.projection import GRS80_A, GRS80_F
+
+
+# 타원체 상수 (GRS80, WGS84와의 차이는 측정 용도에서 무시 가능)
+A = GRS80_A
+F = GRS80_F
+B = A * (1 - F)
+E2 = F * (2 - F)
+E = math.sqrt(E2)
+
+# 평균 반경 (Vincenty가 수렴하지 않는 대척점 근처 구간에 사용)
+MEAN_RADIUS = (2 * A + B) / 3
+
+VINCENTY_TOLERANCE = 1e-12
+VINCENTY_MAX_ITERATIONS = 200
+
+
+def _authalic_q(sin_phi):
+    """등적 위도 계산에 쓰는 q(φ)"""
+    e_sin = E * sin_phi
+    return (1 - E2) * (sin_phi / (1 - e_sin * e_sin) -
+                       np.log((1 - e_sin) / (1 + e_sin)) / (2 * E))
+
+
+# 면적 보존(등적) 구의 반경과 극에서의 q 값
+QP = float(_authalic_q(1.0))
+AUTHALIC_RADIUS = A * math.sqrt(QP / 2)
+
+
+def _as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def distances(lats1, lngs1, lats2, lngs2) -> np.ndarray:
+    """두 좌표 배열 사이의 타원체 측지 거리 (Vincenty 역문제, 미터 단위 배열)"""
+    phi1, lam1, phi2, lam2 = (np.radians(_as_array(v)) for v in (lats1, lngs1, lats2, lngs2))
+    phi1, lam1, phi2, lam2 = np.broadcast_arrays(phi1, lam1, phi2, lam2)
+
+    L = (lam2 - lam1 + np.pi) % (2 * np.pi) - np.pi
+    U1 = np.arctan((1 - F) * np.tan(phi1))
+    U2 = np.arctan((1 - F) * np.tan(phi2))
+    sin_u1, cos_u1 = np.sin(U1), np.cos(U1)
+    sin_u2, cos_u2 = np.sin(U2), np.cos(U2)
+
+    lam = L.copy()
+    converged = np.zeros(L.shape, dtype=bool)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(VINCENTY_MAX_ITERATIONS):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+
+            # 같은 점(sin σ = 0)과 적도 위 구간(cos²α = 0)은 0으로 처리
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha * sin_alpha
+            cos_2sm = np.where(cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+            C = F / 16 * cos2_alpha * (4 + F * (4 - 3 * cos2_alpha))
+
+            lam_prev = lam
+            lam = L + (1 - C) * F * sin_alpha * (
+                sigma + C * sin_sigma * (cos_2sm + C * cos_sigma * (-1 + 2 * cos_2sm * cos_2sm)))
+            converged = np.abs(lam - lam_prev) <= VINCENTY_TOLERANCE
+            if converged.all():
+                break
+
+    u2 = cos2_alpha * (A * A - B * B) / (B * B)
+    big_a = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    big_b = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = big_b * sin_sigma * (cos_2sm + big_b / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sm * cos_2sm) -
+        big_b / 6 * cos_2sm * (-3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos_2sm * cos_2sm)))
+    result = B * big_a * (sigma - delta_sigma)
+
+    # 대척점 근처에서 수렴하지 않은 구간은 평균 반경의 대원 거리로 대체
+    failed = ~converged | ~np.isfinite(result)
+    if failed.any():
+        a = (np.sin((phi2 - phi1) / 2) ** 2 +
+             np.cos(phi1) * np.cos(phi2) * np.sin(L / 2) ** 2)
+        spherical = 2 * MEAN_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        result = np.where(failed, spherical, result)
+    return result
+
+
+def segment_lengths(lats, lngs) -> np.ndarray:
+    """폴리라인 각 구간의 측지 길이 (미터 단위, 길이 N-1 배열)"""
+    lats, lngs = _as_array(lats), _as_array(lngs)
+    if len(lats) < 2:
+        return np.zeros(0)
+    return distances(lats[:-1], lngs[:-1], lats[1:], lngs[1:])
+
+
+def polyline_length(lats, lngs) -> float:
+    """폴리라인의 전체 측지 길이 (미터)"""
+    return float(segment_lengths(lats, lngs).sum())
+
+
+def _close_ring(lats: np.ndarray, lngs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """첫 점과 마지막 점이 다르면 첫 점을 덧붙여 링을 닫음"""
+    if len(lats) and (lats[0] != lats[-1] or lngs[0] != lngs[-1]):
+        lats = np.append(lats, lats[0])
+        lngs = np.append(lngs, lngs[0])
+    return lats, lngs
+
+
+def polygon_perimeter(lats, lngs) -> float:
+    """다각형 외곽선의 측지 둘레 (미터, 링은 자동으로 닫음)"""
+    lats, lngs = _close_ring(_as_array(lats), _as_array(lngs))
+    return polyline_length(lats, lngs)
+
+
+def _edge_excess(lats, lngs) -> np.ndarray:
+    """링의 각 변이 등적 구 위에서 만드는 부호 있는 구면 초과각 (라디안)"""
+    sin_phi = np.sin(np.radians(lats))
+    beta = np.arcsin(np.clip(_authalic_q(sin_phi) / QP, -1.0, 1.0))
+    t = np.tan(beta / 2)
+    lam = np.radians(lngs)
+    dlam = (lam[1:] - lam[:-1] + np.pi) % (2 * np.pi) - np.pi
+    return 2 * np.arctan2(np.tan(dlam / 2) * (t[:-1] + t[1:]), 1 + t[:-1] * t[1:])
+
+
+def polygon_area(lats, lngs) -> float:
+    """다각형의 타원체 면적 (제곱미터, 등적 위도 변환 + 구면 초과각)"""
+    lats, lngs = _close_ring(_as_array(lats), _as_array(lngs))
+    if len(lats) < 4:
+        return 0.0
+    return abs(float(_edge_excess(lats, lngs).sum())) * AUTHALIC_RADIUS ** 2
+
+
+def polygon_areas(rings: Iterable[Tuple[Iterable[float], Iterable[float]]]) -> np.ndarray:
+    """여러 다각형 (lats, lngs) 링의 면적을 한 번에 계산 (제곱미터 배열)"""
+    closed = [_close_ring(_as_array(lats), _as_array(lngs)) for lats, lngs in rings]
+    if not closed:
+        return np.zeros(0)
+
+    counts = np.array([len(lats) for lats, _ in closed])
+    areas = np.zeros(len(closed))
+    # 닫힌 링이 4점 미만(빈 링, 선분)이면 면적 0이므로 계산에서 제외
+    valid = np.flatnonzero(counts >= 4)
+    if not len(valid):
+        return areas
+
+    valid_counts = counts[valid]
+    all_lats = np.concatenate([closed[i][0] for i in valid])
+    all_lngs = np.concatenate([closed[i][1] for i in valid])
+
+    # 링을 이어 붙여 한 번에 변 단위 값을 구한 뒤, 링 경계를 넘는 변은 버림
+    excess = _edge_excess(all_lats, all_lngs)
+    ring_ids = np.repeat(np.arange(len(valid)), valid_counts)[:-1]
+    excess[np.cumsum(valid_counts)[:-1] - 1] = 0.0
+
+    sums = np.bincount(ring_ids, weights=excess, minlength=len(valid))
+    areas[valid] = np.abs(sums) * AUTHALIC_RADIUS ** 2
+    return areas
+
+
+def annotate_measurements(geojson: Dict[str, Any]):
+    """GeoJSON 피처에 측지 면적(area_m2)과 길이(length_m) 속성을 일괄 추가 (Multi* 형상은 부분의 합)"""
+    rings, owners = [], []
+    for feature in geojson.get('features', []):
+        geometry = feature.get('geometry') or {}
+        kind = geometry.get('type')
+        if feature.get('properties') is None:
+            feature['properties'] = {}
+        properties = feature['properties']
+
+        if kind in ('Polygon', 'MultiPolygon'):
+            polygons = [geometry['coordinates']] if kind == 'Polygon' else geometry['coordinates']
+            properties['area_m2'] = 0.0
+            # 외곽 링 면적에서 구멍(내부 링) 면적을 뺌
+            for polygon in polygons:
+                for ring_index, ring in enumerate(polygon):
+                    rings.append(([c[1] for c in ring], [c[0] for c in ring]))
+                    owners.append((properties, 1.0 if ring_index == 0 else -1.0))
+        elif kind in ('LineString', 'MultiLineString'):
+            lines = [geometry['coordinates']] if kind == 'LineString' else geometry['coordinates']
+            properties['length_m'] = sum(
+                polyline_length([c[1] for c in line], [c[0] for c in line]) for line in lines)
+
+    # 모든 링의 면적은 한 번에 계산
+    for (properties, sign), area in zip(owners, polygon_areas(rings)):
+        properties['area_m2'] += sign * float(area)
@@ -0,0 +1,137 @@
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+# GRS80 타원체 (Korea 2000 / ITRF 계열, WGS84와의 차이는 0.1mm 이하)
+GRS80_A = 6378137.0
+GRS80_F = 1 / 298.257222101
+
+
+class TransverseMercator:
+    """횡단 메르카토르(TM) 투영 - Krüger 6차 급수 (배열 일괄 변환)"""
+
+    NEWTON_ITERATIONS = 5
+
+    def __init__(self, lat0: float, lon0: float, k0: float, false_easting: float,
+                 false_northing: float, a: float = GRS80_A, f: float = GRS80_F):
+        self.lat0 = lat0
+        self.lon0 = lon0
+        self.k0 = k0
+        self.false_easting = false_easting
+        self.false_northing = false_northing
+
+        self.e = math.sqrt(f * (2 - f))
+        n = f / (2 - f)
+        n2, n3, n4, n5, n6 = n ** 2, n ** 3, n ** 4, n ** 5, n ** 6
+
+        # 자오선 호 길이 계수 (rectifying radius)
+        self.A = a / (1 + n) * (1 + n2 / 4 + n4 / 64 + n6 / 256)
+
+        # 정방향 (등각 위도 → TM) 계수
+        self.alpha = np.array([
+            n / 2 - 2 * n2 / 3 + 5 * n3 / 16 + 41 * n4 / 180 - 127 * n5 / 288 + 7891 * n6 / 37800,
+            13 * n2 / 48 - 3 * n3 / 5 + 557 * n4 / 1440 + 281 * n5 / 630 - 1983433 * n6 / 1935360,
+            61 * n3 / 240 - 103 * n4 / 140 + 15061 * n5 / 26880 + 167603 * n6 / 181440,
+            49561 * n4 / 161280 - 179 * n5 / 168 + 6601661 * n6 / 7257600,
+            34729 * n5 / 80640 - 3418889 * n6 / 1995840,
+            212378941 * n6 / 319334400,
+        ])
+        # 역방향 (TM → 등각 위도) 계수
+        self.beta = np.array([
+            n / 2 - 2 * n2 / 3 + 37 * n3 / 96 - n4 / 360 - 81 * n5 / 512 + 96199 * n6 / 604800,
+            n2 / 48 + n3 / 15 - 437 * n4 / 1440 + 46 * n5 / 105 - 1118711 * n6 / 3870720,
+            17 * n3 / 480 - 37 * n4 / 840 - 209 * n5 / 4480 + 5569 * n6 / 90720,
+            4397 * n4 / 161280 - 11 * n5 / 504 - 830251 * n6 / 7257600,
+            4583 * n5 / 161280 - 108847 * n6 / 3991680,
+            20648693 * n6 / 638668800,
+        ])
+        self._orders = np.arange(2, 2 * len(self.alpha) + 1, 2, dtype=np.float64)
+
+        # 원점 위도의 자오선 호 길이 (경도차 0에서의 ξ)
+        xi0, _ = self._conformal_to_tm(*self._geodetic_to_conformal(np.radians(lat0), 0.0))
+        self.xi0 = float(xi0)
+
+    def _geodetic_to_conformal(self, phi, dlam) -> Tuple[np.ndarray, np.ndarray]:
+        """위도/경도차(라디안)를 등각 구면 좌표 (ξ', η')로 변환"""
+        sin_phi = np.sin(phi)
+        t = np.sinh(np.arctanh(sin_phi) - self.e * np.arctanh(self.e * sin_phi))
+        xi_p = np.arctan2(t, np.cos(dlam))
+        eta_p = np.arctanh(np.sin(dlam) / np.sqrt(1 + t * t))
+        return xi_p, eta_p
+
+    def _conformal_to_tm(self, xi_p, eta_p) -> Tuple[np.ndarray, np.ndarray]:
+        """Krüger 급수로 등각 좌표를 정규화된 TM 좌표 (ξ, η)로 변환"""
+        xi_p = np.asarray(xi_p, dtype=np.float64)
+        eta_p = np.asarray(eta_p, dtype=np.float64)
+        j = self._orders.reshape((-1,) + (1,) * xi_p.ndim)
+        xi = xi_p + np.sum(self.alpha.reshape(j.shape) * np.sin(j * xi_p) * np.cosh(j * eta_p), axis=0)
+        eta = eta_p + np.sum(self.alpha.reshape(j.shape) * np.cos(j * xi_p) * np.sinh(j * eta_p), axis=0)
+        return xi, eta
+
+    def forward(self, lats, lngs) -> Tuple[np.ndarray, np.ndarray]:
+        """위경도(도) 배열을 TM 좌표 (x=동향, y=북향, 미터) 배열로 변환"""
+        phi = np.radians(np.asarray(lats, dtype=np.float64))
+        dlam = np.radians(np.asarray(lngs, dtype=np.float64) - self.lon0)
+        xi, eta = self._conformal_to_tm(*self._geodetic_to_conformal(phi, dlam))
+
+        x = self.false_easting + self.k0 * self.A * eta
+        y = self.false_northing + self.k0 * self.A * (xi - self.xi0)
+        return x, y
+
+    def inverse(self, x, y) -> Tuple[np.ndarray, np.ndarray]:
+        """TM 좌표 (x=동향, y=북향, 미터) 배열을 위경도(도) 배열로 변환"""
+        eta = (np.asarray(x, dtype=np.float64) - self.false_easting) / (self.k0 * self.A)
+        xi = (np.asarray(y, dtype=np.float64) - self.false_northing) / (self.k0 * self.A) + self.xi0
+
+        j = self._orders.reshape((-1,) + (1,) * xi.ndim)
+        beta = self.beta.reshape(j.shape)
+        xi_p = xi - np.sum(beta * np.sin(j * xi) * np.cosh(j * eta), axis=0)
+        eta_p = eta - np.sum(beta * np.cos(j * xi) * np.sinh(j * eta), axis=0)
+
+        sinh_eta = np.sinh(eta_p)
+        cos_xi = np.cos(xi_p)
+        tau_p = np.sin(xi_p) / np.sqrt(sinh_eta * sinh_eta + cos_xi * cos_xi)
+        lam = np.arctan2(sinh_eta, cos_xi)
+
+        # 등각 위도의 tan 값에서 측지 위도의 tan 값을 뉴턴 반복으로 계산
+        e2 = self.e * self.e
+        tau = tau_p.copy()
+        for _ in range(self.NEWTON_ITERATIONS):
+            sqrt_tau = np.sqrt(1 + tau * tau)
+            sigma = np.sinh(self.e * np.arctanh(self.e * tau / sqrt_tau))
+            tau_i = tau * np.sqrt(1 + sigma * sigma) - sigma * sqrt_tau
+            tau += ((tau_p - tau_i) / np.sqrt(1 + tau_i * tau_i) *
+                    (1 + (1 - e2) * tau * tau) / ((1 - e2) * sqrt_tau))
+
+        return np.degrees(np.arctan(tau)), np.degrees(lam) + self.lon0
+
+
+# 국내 공공 데이터에서 쓰는 GRS80 기반 TM 좌표계
+PROJECTIONS: Dict[int, TransverseMercator] = {
+    5179: TransverseMercator(38.0, 127.5, 0.9996, 1000000.0, 2000000.0),  # UTM-K
+    5181: TransverseMercator(38.0, 127.0, 1.0, 200000.0, 500000.0),       # 중부원점 (카카오 지도)
+    5185: TransverseMercator(38.0, 125.0, 1.0, 200000.0, 600000.0),       # 서부원점
+    5186: TransverseMercator(38.0, 127.0, 1.0, 200000.0, 600000.0),       # 중부원점
+    5187: TransverseMercator(38.0, 129.0, 1.0, 200000.0, 600000.0),       # 동부원점
+    5188: TransverseMercator(38.0, 131.0, 1.0, 200000.0, 600000.0),       # 동해(울릉)원점
+}
+
+
+def get_projection(epsg: int) -> TransverseMercator:
+    """EPSG 코드에 해당하는 TM 투영"""
+    try:
+        return PROJECTIONS[epsg]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 좌표계: EPSG:{epsg}") from None
+
+
+def wgs84_to_tm(lats, lngs, epsg: int = 5179) -> Tuple[np.ndarray, np.ndarray]:
+    """WGS84 위경도 배열을 TM 좌표 (x, y) 배열로 변환"""
+    return get_projection(epsg).forward(lats, lngs)
+
+
+def tm_to_wgs84(x, y, epsg: int = 5179) -> Tuple[np.ndarray, np.ndarray]:
+    """TM 좌표 (x, y) 배열을 WGS84 위경도 배열로 변환"""
+    return get_projection(epsg).inverse(x, y)
@@ -0,0 +1,159 @@
+import marshal
+import pickle
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import fields
+from typing import Any, List
+
+from models.cctv import CCTV
+from models.place import Place
+
+
+class SerializationError(ValueError):
+    """알 수 없는 형식이거나 손상된 캐시 페이로드"""
+
+
+class CacheSerializer:
+    """캐시 페이로드 직렬화 (형식 버전 헤더 + compact/pickle 코덱 + 선택적 zlib 압축)"""
+
+    MAGIC = b'KC'
+    FORMAT_VERSION = 2
+    # magic, 형식 버전, 코덱, 플래그, 기록한 Python 주/부 버전, marshal 버전
+    HEADER = struct.Struct('<2sBBBBBB')
+
+    CODEC_PICKLE = 0
+    CODEC_MARSHAL = 1
+    CODECS = ('compact', 'pickle')
+
+    FLAG_ZLIB = 0x01
+    FLAG_COLUMNAR = 0x02
+
+    # marshal 형식 4로 기록하지만 형식 자체는 Python 버전 간 호환이 보장되지 않으므로
+    # 기록한 Python/marshal 버전을 헤더에 남기고 다르면 캐시 미스로 처리
+    MARSHAL_VERSION = 4
+    RUNTIME = (sys.version_info[0], sys.version_info[1], marshal.version)
+
+    # 열 단위로 저장하는 모델 (리스트 전체가 같은 타입일 때)
+    COLUMNAR_MODELS = {cls.__name__: cls for cls in (Place, CCTV)}
+
+    def __init__(self, codec: str = 'compact', compress_threshold: int = 4096,
+                 compress_level: int = 6):
+        if codec not in self.CODECS:
+            raise ValueError(f"지원하지 않는 직렬화 형식: {codec}")
+        self.codec = codec
+        # 0이면 압축하지 않음
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def dumps(self, value: Any) -> bytes:
+        """값을 헤더가 붙은 바이트열로 변환"""
+        flags = 0
+        codec = self.CODEC_PICKLE
+        body = None
+
+        if self.codec == 'compact':
+            encoded = value
+            if self._is_model_list(value):
+                encoded = self._to_columns(value)
+                flags |= self.FLAG_COLUMNAR
+            try:
+                body = marshal.dumps(encoded, self.MARSHAL_VERSION)
+                codec = self.CODEC_MARSHAL
+            except ValueError:
+                # JSON 형태가 아닌 값은 pickle로 저장
+                flags = 0
+
+        if body is None:
+            body = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if self.compress_threshold and len(body) >= self.compress_threshold:
+            compressed = zlib.compress(body, self.compress_level)
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= self.FLAG_ZLIB
+
+        return self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, codec, flags, *self.RUNTIME) + body
+
+    def loads(self, data: bytes) -> Any:
+        """헤더를 확인한 뒤 바이트열을 값으로 변환 (읽을 수 없으면 SerializationError)"""
+        if len(data) < self.HEADER.size:
+            raise SerializationError("캐시 페이로드가 너무 짧습니다")
+
+        magic, version, codec, flags = self.HEADER.unpack_from(data)[:4]
+        if magic != self.MAGIC:
+            raise SerializationError("이전 형식의 캐시 페이로드입니다")
+        if version != self.FORMAT_VERSION:
+            raise SerializationError(f"지원하지 않는 캐시 형식 버전: {version}")
+        if codec == self.CODEC_MARSHAL and self.HEADER.unpack_from(data)[4:] != self.RUNTIME:
+            raise SerializationError("다른 Python 버전에서 기록된 marshal 페이로드입니다")
+
+        try:
+            body = memoryview(data)[self.HEADER.size:]
+            if flags & self.FLAG_ZLIB:
+                body = zlib.decompress(body)
+
+            if codec == self.CODEC_MARSHAL:
+                value = marshal.loads(body)
+            elif codec == self.CODEC_PICKLE:
+                value = pickle.loads(body)
+            else:
+                raise SerializationError(f"알 수 없는 캐시 코덱: {codec}")
+        except SerializationError:
+            raise
+        except (ValueError, EOFError, TypeError, zlib.error, pickle.UnpicklingError) as e:
+            raise SerializationError(f"손상된 캐시 페이로드: {e}") from e
+
+        if flags & self.FLAG_COLUMNAR:
+            value = self._from_columns(value)
+        return value
+
+    def _is_model_list(self, value: Any) -> bool:
+        if not isinstance(value, list) or not value:
+            return False
+        cls = type(value[0])
+        return (self.COLUMNAR_MODELS.get(cls.__name__) is cls and
+                all(type(item) is cls for item in value))
+
+    @staticmethod
+    def _to_columns(items: List[Any]) -> tuple:
+        """모델 리스트를 열 단위 튜플로 변환 (실수 열은 float64 배열로 압축)"""
+        cls = type(items[0])
+        names = tuple(f.name for f in fields(cls))
+        columns = []
+        for name in names:
+            column = [getattr(item, name) for item in items]
+            if all(type(v) is float for v in column):
+                packed = array('d', column)
+                if sys.byteorder == 'big':
+                    packed.byteswap()
+                columns.append(packed.tobytes())
+            else:
+                columns.append(column)
+        return cls.__name__, names, tuple(columns)
+
+    def _from_columns(self, value: tuple) -> List[Any]:
+        """열 단위 튜플을 모델 리스트로 복원"""
+        model_name, names, columns = value
+        cls = self.COLUMNAR_MODELS.get(model_name)
+        if cls is None:
+            raise SerializationError(f"알 수 없는 모델: {model_name}")
+
+        unpacked = []
+        for column in columns:
+            if isinstance(column, bytes):
+                values = array('d')
+                values.frombytes(column)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                column = values.tolist()
+            unpacked.append(column)
+
+        rows = zip(*unpacked)
+        if names == tuple(f.name for f in fields(cls)):
+            return [cls(*row) for row in rows]
+
+        # 저장 이후 필드가 바뀐 경우 남아 있는 필드만 사용
+        known = {f.name for f in fields(cls)}
+        return [cls(**{name: v for name, v in zip(names, row) if name in known}) for row in rows]
@@ -0,0 +1,256 @@
+import heapq
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from utils.coordinates import Coordinates
+
+
+METHODS = ('douglas_peucker', 'visvalingam')
+
+# 카카오 지도 레벨 범위
+KAKAO_LEVELS = range(1, 15)
+
+# GeoJSON 형상별 (좌표 중첩 깊이, 닫힌 링 여부)
+GEOMETRY_LAYOUTS = {
+    'LineString': (0, False),
+    'MultiLineString': (1, False),
+    'Polygon': (1, True),
+    'MultiPolygon': (2, True),
+}
+
+
+def to_local_meters(lats, lngs) -> Tuple[np.ndarray, np.ndarray]:
+    """위경도 배열을 평균 위도 기준 등장방형 평면 좌표 (미터)로 변환"""
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    radius = Coordinates.EARTH_RADIUS_KM * 1000
+    lat0 = np.radians(lats.mean()) if lats.size else 0.0
+    return radius * np.cos(lat0) * np.radians(lngs), radius * np.radians(lats)
+
+
+def _point_segment_distance(px, py, ax, ay, bx, by) -> np.ndarray:
+    """점과 선분 사이의 거리 (배열)"""
+    dx, dy = bx - ax, by - ay
+    length2 = dx * dx + dy * dy
+    safe = np.where(length2 > 0, length2, 1.0)
+    t = np.clip(((px - ax) * dx + (py - ay) * dy) / safe, 0.0, 1.0)
+    t = np.where(length2 > 0, t, 0.0)
+    return np.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def _keep_triangle(significance: np.ndarray):
+    """닫힌 링이 삼각형 아래로 줄어들지 않도록 내부 꼭짓점 2개를 항상 유지"""
+    interior = significance[1:-1]
+    missing = 2 - int(np.isinf(interior).sum())
+    if missing <= 0:
+        return
+    finite = np.flatnonzero(np.isfinite(interior))
+    top = finite[np.argsort(interior[finite])[::-1][:missing]]
+    interior[top] = np.inf
+
+
+def douglas_peucker_significance(xs, ys, closed: bool = False) -> np.ndarray:
+    """Douglas-Peucker 기준 꼭짓점별 유의도 (이 허용 오차 미만에서 제거됨, 미터)"""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    n = len(xs)
+    significance = np.zeros(n)
+    if n == 0:
+        return significance
+    significance[0] = significance[-1] = np.inf
+
+    starts, ends = np.array([0]), np.array([n - 1])
+    if closed and n > 3:
+        # 닫힌 링은 시작점에서 가장 먼 꼭짓점으로 두 구간을 나눔
+        far = int(np.argmax(np.hypot(xs - xs[0], ys - ys[0])))
+        if 0 < far < n - 1:
+            significance[far] = np.inf
+            starts, ends = np.array([0, far]), np.array([far, n - 1])
+    parents = np.full(len(starts), np.inf)
+
+    # 재귀 대신 같은 깊이의 구간을 한 번에 처리
+    while True:
+        active = ends - starts >= 2
+        starts, ends, parents = starts[active], ends[active], parents[active]
+        if not len(starts):
+            break
+
+        counts = ends - starts - 1
+        offsets = np.cumsum(counts) - counts
+        seg = np.repeat(np.arange(len(starts)), counts)
+        idx = np.arange(counts.sum()) - offsets[seg] + starts[seg] + 1
+
+        d = _point_segment_distance(xs[idx], ys[idx], xs[starts[seg]], ys[starts[seg]],
+                                    xs[ends[seg]], ys[ends[seg]])
+        dmax = np.maximum.reduceat(d, offsets)
+
+        # 구간마다 최대 거리를 갖는 첫 꼭짓점에서 분할
+        candidates = np.flatnonzero(d == dmax[seg])
+        _, first = np.unique(seg[candidates], return_index=True)
+        split = idx[candidates[first]]
+
+        # 부모보다 큰 유의도를 가지면 허용 오차로 거를 때 부모 없이 남으므로 부모 값으로 제한
+        significance[split] = np.minimum(dmax, parents)
+        starts, ends = np.concatenate([starts, split]), np.concatenate([split, ends])
+        parents = np.concatenate([significance[split], significance[split]])
+
+    if closed:
+        _keep_triangle(significance)
+    return significance
+
+
+def visvalingam_significance(xs, ys, closed: bool = False) -> np.ndarray:
+    """Visvalingam-Whyatt 기준 꼭짓점별 유의도 (유효 면적의 제곱근, 미터)"""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    n = len(xs)
+    significance = np.full(n, np.inf)
+    if n < 3:
+        return significance
+
+    # 초기 삼각형 면적은 한 번에 계산
+    areas = 0.5 * np.abs((xs[:-2] - xs[2:]) * (ys[1:-1] - ys[:-2]) -
+                         (xs[:-2] - xs[1:-1]) * (ys[2:] - ys[:-2]))
+    current = [np.inf] + areas.tolist() + [np.inf]
+
+    # 힙 갱신 루프는 파이썬 리스트가 NumPy 스칼라 인덱싱보다 빠름
+    px, py = xs.tolist(), ys.tolist()
+
+    def triangle_area(a: int, b: int, c: int) -> float:
+        return 0.5 * abs((px[a] - px[c]) * (py[b] - py[a]) - (px[a] - px[b]) * (py[c] - py[a]))
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+
+    removed = [np.inf] * n
+    heap = [(current[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+    removed_area = 0.0
+    while heap:
+        area, i = heapq.heappop(heap)
+        # 이미 제거됐거나 면적이 갱신된 항목은 건너뜀
+        if area != current[i]:
+            continue
+        # 먼저 제거된 점보다 작은 유효 면적을 갖지 않도록 단조 증가 유지
+        removed_area = max(removed_area, area)
+        removed[i] = removed_area
+        current[i] = -1.0
+
+        p, q = prev[i], nxt[i]
+        nxt[p], prev[q] = q, p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                current[j] = triangle_area(prev[j], j, nxt[j])
+                heapq.heappush(heap, (current[j], j))
+
+    significance[1:-1] = np.sqrt(removed[1:-1])
+    if closed:
+        _keep_triangle(significance)
+    return significance
+
+
+SIGNIFICANCE_FUNCTIONS = {
+    'douglas_peucker': douglas_peucker_significance,
+    'visvalingam': visvalingam_significance,
+}
+
+
+def simplify(lats, lngs, tolerance_m: float, method: str = 'douglas_peucker',
+             closed: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """폴리라인/링을 허용 오차(미터) 안에서 단순화한 (lats, lngs) 배열"""
+    if method not in SIGNIFICANCE_FUNCTIONS:
+        raise ValueError(f"지원하지 않는 단순화 방식: {method}")
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    significance = SIGNIFICANCE_FUNCTIONS[method](*to_local_meters(lats, lngs), closed=closed)
+    keep = significance > tolerance_m
+    return lats[keep], lngs[keep]
+
+
+class LODLayer:
+    """GeoJSON 레이어의 카카오 지도 레벨별 단순화 결과 (꼭짓점 유의도를 한 번만 계산)"""
+
+    def __init__(self, geojson: Dict[str, Any], method: str = 'douglas_peucker',
+                 pixel_tolerance: float = 1.0, levels: Iterable[int] = KAKAO_LEVELS):
+        if method not in SIGNIFICANCE_FUNCTIONS:
+            raise ValueError(f"지원하지 않는 단순화 방식: {method}")
+        self.method = method
+        self.pixel_tolerance = pixel_tolerance
+        self._significance = SIGNIFICANCE_FUNCTIONS[method]
+
+        self._features = []
+        lat_sum, lat_count = 0.0, 0
+        for feature in geojson.get('features', []):
+            geometry = feature.get('geometry') or {}
+            layout = GEOMETRY_LAYOUTS.get(geometry.get('type'))
+            if layout is None:
+                self._features.append((feature, None, None))
+                continue
+            depth, closed = layout
+            prepared = self._prepare(geometry['coordinates'], depth, closed)
+            for coords, _ in self._iter_lines(prepared, depth):
+                lat_sum += float(coords[:, 1].sum())
+                lat_count += len(coords)
+            self._features.append((feature, prepared, depth))
+
+        # 허용 오차는 레이어 중심 위도의 픽셀당 미터로 계산
+        self.center_lat = lat_sum / lat_count if lat_count else 0.0
+
+        self.lods: Dict[int, Dict[str, Any]] = {}
+        self.vertex_counts: Dict[int, int] = {}
+        previous = None
+        for level in sorted(levels):
+            geojson_lod, count = self._build(self.tolerance_for_level(level))
+            # 레벨이 올라가면 허용 오차만 커지므로 꼭짓점 수가 같으면 결과도 같음
+            if previous is not None and previous[1] == count:
+                geojson_lod = previous[0]
+            self.lods[level] = geojson_lod
+            self.vertex_counts[level] = count
+            previous = (geojson_lod, count)
+
+    def tolerance_for_level(self, level: int) -> float:
+        """카카오 지도 레벨에서의 허용 오차 (미터)"""
+        zoom = Coordinates.kakao_level_to_zoom(level)
+        return self.pixel_tolerance * Coordinates.meters_per_pixel(self.center_lat, zoom)
+
+    def for_level(self, level: int) -> Dict[str, Any]:
+        """지도 레벨에 맞는 단순화된 GeoJSON (범위 밖이면 가장 가까운 레벨)"""
+        levels = list(self.lods)
+        if not levels:
+            return {"type": "FeatureCollection", "features": []}
+        return self.lods[min(max(level, levels[0]), levels[-1])]
+
+    def _prepare(self, coords, depth: int, closed: bool):
+        """좌표를 배열로 바꾸고 꼭짓점 유의도를 계산"""
+        if depth == 0:
+            array = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+            xs, ys = to_local_meters(array[:, 1], array[:, 0])
+            return array, self._significance(xs, ys, closed=closed)
+        return [self._prepare(c, depth - 1, closed) for c in coords]
+
+    def _iter_lines(self, prepared, depth: int):
+        if depth == 0:
+            yield prepared
+        else:
+            for part in prepared:
+                yield from self._iter_lines(part, depth - 1)
+
+    def _simplify(self, prepared, depth: int, tolerance: float, counter: List[int]):
+        if depth == 0:
+            coords, significance = prepared
+            kept = coords[significance > tolerance]
+            counter[0] += len(kept)
+            return kept.tolist()
+        return [self._simplify(part, depth - 1, tolerance, counter) for part in prepared]
+
+    def _build(self, tolerance: float) -> Tuple[Dict[str, Any], int]:
+        counter = [0]
+        features = []
+        for feature, prepared, depth in self._features:
+            if prepared is None:
+                features.append(feature)
+                continue
+            geometry = dict(feature['geometry'])
+            geometry['coordinates'] = self._simplify(prepared, depth, tolerance, counter)
+            features.append({**feature, 'geometry': geometry})
+        return {"type": "FeatureCollection", "features": features}, counter[0]
@@ -0,0 +1,335 @@
+import heapq
+import itertools
+import math
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.coordinates import Coordinates
+
+# (min_lat, min_lng, max_lat, max_lng)
+BBox = Tuple[float, float, float, float]
+
+
+def _union(a: BBox, b: BBox) -> BBox:
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _area(b: BBox) -> float:
+    return (b[2] - b[0]) * (b[3] - b[1])
+
+
+def _intersects(a: BBox, b: BBox) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _bounds_to_bbox(bounds: Dict[str, float]) -> BBox:
+    return (bounds['south'], bounds['west'], bounds['north'], bounds['east'])
+
+
+class _Node:
+    __slots__ = ('leaf', 'entries', 'bbox', 'parent')
+
+    def __init__(self, leaf: bool, entries: Optional[list] = None):
+        self.leaf = leaf
+        # 리프: (bbox, key), 내부 노드: (bbox, 자식 노드)
+        self.entries = entries or []
+        self.parent: Optional['_Node'] = None
+        self.bbox: Optional[BBox] = None
+        if not leaf:
+            for _, child in self.entries:
+                child.parent = self
+        self.refresh_bbox()
+
+    def refresh_bbox(self):
+        if not self.entries:
+            self.bbox = None
+            return
+        boxes = [bbox for bbox, _ in self.entries]
+        self.bbox = (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                     max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+class SpatialIndex:
+    """위경도 점/영역용 R-tree (STR 일괄 적재, 삽입/삭제, 경계/반경/최근접 검색)"""
+
+    def __init__(self, max_entries: int = 16):
+        if max_entries < 4:
+            raise ValueError(f"노드 최대 항목 수는 4 이상이어야 합니다: {max_entries}")
+        self.max_entries = max_entries
+        self.min_entries = max(2, max_entries * 2 // 5)
+        self._root = _Node(leaf=True)
+        # key -> (bbox, item, 리프 노드)
+        self._items: Dict[Hashable, list] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    # ------------------------------------------------------------------ 구성
+
+    @classmethod
+    def from_points(cls, items: Iterable[Any], lats, lngs, keys: Optional[Iterable[Hashable]] = None,
+                    max_entries: int = 16) -> 'SpatialIndex':
+        """점 목록으로 STR 일괄 적재 (keys를 생략하면 순번을 키로 사용)"""
+        items = list(items)
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        keys = list(keys) if keys is not None else list(range(len(items)))
+        bboxes = [(lat, lng, lat, lng) for lat, lng in zip(lats.tolist(), lngs.tolist())]
+        index = cls(max_entries)
+        index.bulk_load(zip(keys, bboxes, items))
+        return index
+
+    def bulk_load(self, entries: Iterable[Tuple[Hashable, BBox, Any]]):
+        """(key, bbox, item) 목록으로 트리를 새로 구성 (Sort-Tile-Recursive 적재)"""
+        self._items = {}
+        leaf_entries = []
+        for key, bbox, item in entries:
+            if key in self._items:
+                raise ValueError(f"중복된 키: {key}")
+            self._items[key] = [bbox, item, None]
+            leaf_entries.append((bbox, key))
+
+        if not leaf_entries:
+            self._root = _Node(leaf=True)
+            return
+
+        nodes = [_Node(leaf=True, entries=group) for group in self._str_pack(leaf_entries)]
+        for node in nodes:
+            for _, key in node.entries:
+                self._items[key][2] = node
+
+        while len(nodes) > 1:
+            parent_entries = [(node.bbox, node) for node in nodes]
+            nodes = [_Node(leaf=False, entries=group) for group in self._str_pack(parent_entries)]
+        self._root = nodes[0]
+
+    def _str_pack(self, entries: list) -> List[list]:
+        """중심 경도로 세로 조각을 나누고 조각마다 중심 위도로 정렬해 노드 크기로 묶음"""
+        count = len(entries)
+        node_count = math.ceil(count / self.max_entries)
+        slice_count = math.ceil(math.sqrt(node_count))
+        slice_size = slice_count * self.max_entries
+
+        boxes = np.array([bbox for bbox, _ in entries], dtype=np.float64)
+        center_lat = (boxes[:, 0] + boxes[:, 2]) / 2
+        center_lng = (boxes[:, 1] + boxes[:, 3]) / 2
+
+        groups = []
+        by_lng = np.argsort(center_lng, kind='stable')
+        for start in range(0, count, slice_size):
+            part = by_lng[start:start + slice_size]
+            part = part[np.argsort(center_lat[part], kind='stable')]
+            for offset in range(0, len(part), self.max_entries):
+                groups.append([entries[i] for i in part[offset:offset + self.max_entries]])
+        return groups
+
+    # ------------------------------------------------------------ 삽입/삭제
+
+    def insert_point(self, key: Hashable, lat: float, lng: float, item: Any = None):
+        """점 항목 삽입 (같은 키가 있으면 교체)"""
+        self.insert(key, (lat, lng, lat, lng), item)
+
+    def insert_bounds(self, key: Hashable, bounds: Dict[str, float], item: Any = None):
+        """영역 항목 삽입 (get_bounds 형식의 경계, 폴리곤은 외곽 경계로 등록)"""
+        self.insert(key, _bounds_to_bbox(bounds), item)
+
+    def insert(self, key: Hashable, bbox: BBox, item: Any = None):
+        """(min_lat, min_lng, max_lat, max_lng) 경계로 항목 삽입"""
+        if key in self._items:
+            self.delete(key)
+        self._items[key] = [bbox, item, None]
+        self._insert_entry((bbox, key))
+
+    def _insert_entry(self, entry: tuple):
+        bbox = entry[0]
+        node = self._root
+        while not node.leaf:
+            node = self._choose_child(node, bbox)
+
+        node.entries.append(entry)
+        self._items[entry[1]][2] = node
+        self._adjust_upwards(node)
+
+    @staticmethod
+    def _choose_child(node: _Node, bbox: BBox) -> _Node:
+        """확장 면적이 가장 작은 자식 선택 (같으면 면적이 작은 쪽)"""
+        best = None
+        best_cost = None
+        for child_bbox, child in node.entries:
+            area = _area(child_bbox)
+            cost = (_area(_union(child_bbox, bbox)) - area, area)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = child, cost
+        return best
+
+    def _adjust_upwards(self, node: _Node):
+        """넘친 노드를 분할하면서 루트까지 경계 갱신"""
+        while node is not None:
+            sibling = self._split(node) if len(node.entries) > self.max_entries else None
+            node.refresh_bbox()
+            parent = node.parent
+
+            if parent is None:
+                if sibling is not None:
+                    self._root = _Node(leaf=False, entries=[(node.bbox, node), (sibling.bbox, sibling)])
+                return
+
+            self._replace_child_bbox(parent, node)
+            if sibling is not None:
+                sibling.parent = parent
+                parent.entries.append((sibling.bbox, sibling))
+            node = parent
+
+    @staticmethod
+    def _replace_child_bbox(parent: _Node, child: _Node):
+        for i, (_, node) in enumerate(parent.entries):
+            if node is child:
+                parent.entries[i] = (child.bbox, child)
+                return
+
+    def _split(self, node: _Node) -> _Node:
+        """분포가 넓은 축의 중심 좌표 순으로 정렬해 반으로 분할 (새 형제 노드 반환)"""
+        boxes = [bbox for bbox, _ in node.entries]
+        lat_spread = max(b[2] for b in boxes) - min(b[0] for b in boxes)
+        lng_spread = max(b[3] for b in boxes) - min(b[1] for b in boxes)
+        if lat_spread >= lng_spread:
+            node.entries.sort(key=lambda e: e[0][0] + e[0][2])
+        else:
+            node.entries.sort(key=lambda e: e[0][1] + e[0][3])
+
+        half = len(node.entries) // 2
+        moved = node.entries[half:]
+        node.entries = node.entries[:half]
+        sibling = _Node(leaf=node.leaf, entries=moved)
+        if node.leaf:
+            for _, key in moved:
+                self._items[key][2] = sibling
+        return sibling
+
+    def delete(self, key: Hashable) -> bool:
+        """항목 삭제 (없으면 False)"""
+        record = self._items.pop(key, None)
+        if record is None:
+            return False
+
+        leaf = record[2]
+        leaf.entries = [entry for entry in leaf.entries if entry[1] != key]
+        self._condense(leaf)
+        return True
+
+    def _condense(self, node: _Node):
+        """항목이 너무 적어진 노드를 떼어내고 남은 항목을 다시 삽입"""
+        orphans = []
+        while node.parent is not None:
+            parent = node.parent
+            if len(node.entries) < self.min_entries:
+                parent.entries = [entry for entry in parent.entries if entry[1] is not node]
+                orphans.extend(self._collect_leaf_entries(node))
+            else:
+                node.refresh_bbox()
+                self._replace_child_bbox(parent, node)
+            node = parent
+        node.refresh_bbox()
+
+        # 자식이 하나뿐인 내부 루트는 한 단계 줄임
+        while not self._root.leaf and len(self._root.entries) == 1:
+            self._root = self._root.entries[0][1]
+            self._root.parent = None
+        if not self._root.leaf and not self._root.entries:
+            self._root = _Node(leaf=True)
+
+        for entry in orphans:
+            self._insert_entry(entry)
+
+    @staticmethod
+    def _collect_leaf_entries(node: _Node) -> list:
+        entries = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.leaf:
+                entries.extend(current.entries)
+            else:
+                stack.extend(child for _, child in current.entries)
+        return entries
+
+    def clear(self):
+        """모든 항목 삭제"""
+        self._root = _Node(leaf=True)
+        self._items = {}
+
+    # ------------------------------------------------------------------ 검색
+
+    def _search_keys(self, bbox: BBox) -> List[Hashable]:
+        keys = []
+        if self._root.bbox is None or not _intersects(self._root.bbox, bbox):
+            return keys
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for entry_bbox, child in node.entries:
+                if _intersects(entry_bbox, bbox):
+                    if node.leaf:
+                        keys.append(child)
+                    else:
+                        stack.append(child)
+        return keys
+
+    def query_bounds(self, bounds: Dict[str, float]) -> List[Any]:
+        """경계 영역(get_bounds 형식)과 겹치는 항목 목록"""
+        return [self._items[key][1] for key in self._search_keys(_bounds_to_bbox(bounds))]
+
+    def query_radius(self, lat: float, lng: float, radius_km: float,
+                     with_distance: bool = False) -> List[Any]:
+        """반경(km) 안의 항목을 가까운 순으로 반환 (with_distance면 (항목, 거리) 목록)"""
+        keys = self._search_keys(_bounds_to_bbox(Coordinates.get_bounds(lat, lng, radius_km)))
+        if not keys:
+            return []
+
+        # 영역 항목은 경계 상자에서 가장 가까운 점까지의 거리 사용
+        boxes = np.array([self._items[key][0] for key in keys], dtype=np.float64)
+        nearest_lats = np.clip(lat, boxes[:, 0], boxes[:, 2])
+        nearest_lngs = np.clip(lng, boxes[:, 1], boxes[:, 3])
+        distances = Coordinates.calculate_distances(lat, lng, nearest_lats, nearest_lngs)
+
+        order = np.argsort(distances, kind='stable')
+        results = []
+        for i in order:
+            if distances[i] > radius_km:
+                break
+            item = self._items[keys[i]][1]
+            results.append((item, float(distances[i])) if with_distance else item)
+        return results
+
+    @staticmethod
+    def _bbox_distance(lat: float, lng: float, bbox: BBox) -> float:
+        return Coordinates.calculate_distance(
+            lat, lng, min(max(lat, bbox[0]), bbox[2]), min(max(lng, bbox[1]), bbox[3])
+        )
+
+    def nearest(self, lat: float, lng: float, k: int = 1,
+                max_distance_km: Optional[float] = None, with_distance: bool = False) -> List[Any]:
+        """가장 가까운 k개 항목 (최선 우선 탐색)"""
+        results = []
+        if k <= 0 or self._root.bbox is None:
+            return results
+
+        counter = itertools.count()
+        heap = [(self._bbox_distance(lat, lng, self._root.bbox), next(counter), False, self._root)]
+        while heap and len(results) < k:
+            distance, _, is_item, value = heapq.heappop(heap)
+            if max_distance_km is not None and distance > max_distance_km:
+                break
+            if is_item:
+                item = self._items[value][1]
+                results.append((item, distance) if with_distance else item)
+                continue
+            for entry_bbox, child in value.entries:
+                heapq.heappush(heap, (self._bbox_distance(lat, lng, entry_bbox), next(counter),
+                                      value.leaf, child))
+        return results